@@ -0,0 +1,296 @@
+# ASTArena.py
+#
+# Flat, array-backed representation of the EmojiScript AST. Instead of nested
+# tuples and lists, a program is stored as parallel arrays indexed by node id:
+#
+#   kinds[i]      node kind as a small int (see KINDS)
+#   firsts[i]     index of the node's first child; children are contiguous
+#   counts[i]     number of children
+#   literals[i]   index into the literal table, or -1
+#   lines[i]      source line (the enclosing statement's line for expressions)
+#
+# Nodes are laid out breadth-first, so every child has a larger id than its
+# parent and conversions in both directions are simple loops (no recursion).
+# Conversion to and from the tuple form is lossless, and the arena can be
+# saved to / loaded from a compact binary format.
+
+import struct
+import sys
+from array import array
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from emoji import LazyBody, Parser
+
+KINDS = [
+    'block', 'timer', 'num', 'str', 'bool', 'var', 'assign', 'declare',
+    'binop', 'unop', 'and', 'or', 'not', 'if', 'if_else', 'while', 'repeat',
+    'range', 'input', 'random', 'def', 'call', 'print', 'return', 'import',
+]
+KIND_CODES = {name: code for code, name in enumerate(KINDS)}
+
+# Kinds whose tuple form is (kind, literal, *children)
+LITERAL_KINDS = {'num', 'str', 'bool', 'var', 'assign', 'declare', 'binop', 'unop', 'import'}
+
+MAGIC = b'EMAR'
+VERSION = 1
+
+
+class ArenaParser(Parser):
+    """Parser that records the source line of every statement, in pre-order."""
+
+    def __init__(self, tokens):
+        super().__init__(tokens)
+        self.statement_lines: List[int] = []
+
+    def statement(self):
+        self.statement_lines.append(self.current().line)
+        return super().statement()
+
+    def parse_arena(self) -> 'ASTArena':
+        ast = self.parse()
+        return ASTArena.from_tuples(ast, self.statement_lines)
+
+
+def _statement_lines(program: List[Any], lines: List[int]) -> Dict[tuple, int]:
+    """Map (id(statement list), index) -> line, walking statements in parse (pre-)order."""
+    mapping = {}
+    line_iter = iter(lines)
+    stack = [(program, 0)]
+    while stack:
+        stmts, idx = stack.pop()
+        if idx >= len(stmts):
+            continue
+        stack.append((stmts, idx + 1))
+        mapping[(id(stmts), idx)] = next(line_iter, 0)
+        stmt = stmts[idx]
+        kind = stmt[0]
+        nested = []
+        if kind == 'if':
+            nested = [stmt[2]] + ([stmt[3]] if stmt[3] is not None else [])
+        elif kind in ('while', 'repeat'):
+            nested = [stmt[2]]
+        elif kind == 'def':
+            nested = [stmt[3]]
+        for body in reversed(nested):
+            stack.append((body, 0))
+    return mapping
+
+
+class ASTArena:
+    def __init__(self):
+        self.kinds = array('B')
+        self.firsts = array('I')
+        self.counts = array('I')
+        self.literals = array('i')
+        self.lines = array('I')
+        self.literal_table: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    # ------------------------------------------------------------------
+    # Node access
+    # ------------------------------------------------------------------
+
+    def kind(self, node: int) -> str:
+        return KINDS[self.kinds[node]]
+
+    def children(self, node: int) -> range:
+        first = self.firsts[node]
+        return range(first, first + self.counts[node])
+
+    def literal(self, node: int) -> Any:
+        idx = self.literals[node]
+        return self.literal_table[idx] if idx >= 0 else None
+
+    def line(self, node: int) -> int:
+        return self.lines[node]
+
+    def walk(self, root: int = 0):
+        """Yield node ids of the subtree under root in depth-first pre-order."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(self.children(node)))
+
+    # ------------------------------------------------------------------
+    # Conversion from / to the tuple AST
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_tuples(cls, program: List[Any], statement_lines: Optional[List[int]] = None) -> 'ASTArena':
+        arena = cls()
+        line_of = _statement_lines(program, statement_lines) if statement_lines else {}
+        literal_ids: Dict[tuple, int] = {}
+
+        def intern(value) -> int:
+            key = (type(value), value)
+            idx = literal_ids.get(key)
+            if idx is None:
+                idx = literal_ids[key] = len(arena.literal_table)
+                arena.literal_table.append(value)
+            return idx
+
+        # Breadth-first: ids are handed out in queue order, so a node's
+        # children get the next len(children) ids when it is dequeued
+        kinds, firsts, counts, literals, lines = [], [], [], [], []
+        queue = deque([(program, 0)])
+        next_id = 1
+        while queue:
+            item, line = queue.popleft()
+            if isinstance(item, (list, LazyBody)):
+                kind, literal, children = 'block', None, item
+                child_lines = [line_of.get((id(item), i), line) for i in range(len(item))]
+            else:
+                kind, literal, children = cls.split(item)
+                child_lines = [line] * len(children)
+            kinds.append(KIND_CODES[kind])
+            literals.append(intern(literal) if kind in LITERAL_KINDS or kind == 'def' else -1)
+            lines.append(line)
+            firsts.append(next_id)
+            counts.append(len(children))
+            next_id += len(children)
+            queue.extend(zip(children, child_lines))
+
+        arena.kinds = array('B', kinds)
+        arena.firsts = array('I', firsts)
+        arena.counts = array('I', counts)
+        arena.literals = array('i', literals)
+        arena.lines = array('I', lines)
+        return arena
+
+    @staticmethod
+    def split(node: tuple):
+        """Return (arena kind, literal, children) for a tuple node."""
+        kind = node[0]
+        if kind == 'assign':
+            return ('declare' if len(node) > 3 else 'assign'), node[1], [node[2]]
+        if kind in LITERAL_KINDS:
+            return kind, node[1], list(node[2:])
+        if kind == 'if':
+            if node[3] is None:
+                return 'if', None, [node[1], node[2]]
+            return 'if_else', None, [node[1], node[2], node[3]]
+        if kind == 'input':
+            return 'input', None, [node[1]] if node[1] is not None else []
+        if kind == 'def':
+            return 'def', (node[1], tuple(node[2])), [node[3]]
+        if kind == 'call':
+            return 'call', None, [node[1], node[2]]
+        return kind, None, list(node[1:])
+
+    def to_tuples(self) -> List[Any]:
+        built: List[Any] = [None] * len(self.kinds)
+        # Children always have larger ids than their parent
+        for node in range(len(self.kinds) - 1, -1, -1):
+            kind = KINDS[self.kinds[node]]
+            first = self.firsts[node]
+            children = built[first:first + self.counts[node]]
+            if kind == 'block':
+                built[node] = children
+                continue
+            literal = self.literal(node)
+            if kind == 'assign':
+                built[node] = ('assign', literal, children[0])
+            elif kind == 'declare':
+                built[node] = ('assign', literal, children[0], 'new_var')
+            elif kind in LITERAL_KINDS:
+                built[node] = (kind, literal) + tuple(children)
+            elif kind == 'if':
+                built[node] = ('if', children[0], children[1], None)
+            elif kind == 'if_else':
+                built[node] = ('if', children[0], children[1], children[2])
+            elif kind == 'input':
+                built[node] = ('input', children[0] if children else None)
+            elif kind == 'def':
+                built[node] = ('def', literal[0], list(literal[1]), children[0])
+            else:
+                built[node] = (kind,) + tuple(children)
+        return built[0] if built else []
+
+    # ------------------------------------------------------------------
+    # Binary serialization
+    # ------------------------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        out = [MAGIC, struct.pack('<HII', VERSION, len(self.kinds), len(self.literal_table))]
+        for arr in (self.kinds, self.firsts, self.counts, self.literals, self.lines):
+            if sys.byteorder == 'big':
+                arr = array(arr.typecode, arr)
+                arr.byteswap()
+            out.append(arr.tobytes())
+        for value in self.literal_table:
+            out.append(_pack_literal(value))
+        return b''.join(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ASTArena':
+        if data[:4] != MAGIC:
+            raise ValueError("❌ Error: Not an EmojiScript AST arena.")
+        version, nodes, literal_count = struct.unpack_from('<HII', data, 4)
+        if version != VERSION:
+            raise ValueError(f"❌ Error: Unsupported AST arena version {version}.")
+        arena = cls()
+        pos = 4 + struct.calcsize('<HII')
+        for arr in (arena.kinds, arena.firsts, arena.counts, arena.literals, arena.lines):
+            size = nodes * arr.itemsize
+            arr.frombytes(data[pos:pos + size])
+            if sys.byteorder == 'big':
+                arr.byteswap()
+            pos += size
+        for _ in range(literal_count):
+            value, pos = _unpack_literal(data, pos)
+            arena.literal_table.append(value)
+        return arena
+
+
+def _pack_str(s: str) -> bytes:
+    raw = s.encode('utf-8')
+    return struct.pack('<I', len(raw)) + raw
+
+
+def _unpack_str(data: bytes, pos: int):
+    (size,) = struct.unpack_from('<I', data, pos)
+    pos += 4
+    return data[pos:pos + size].decode('utf-8'), pos + size
+
+
+def _pack_literal(value) -> bytes:
+    if isinstance(value, bool):
+        return b'b' + (b'\x01' if value else b'\x00')
+    if isinstance(value, int):
+        return b'i' + _pack_str(str(value))
+    if isinstance(value, float):
+        return b'f' + struct.pack('<d', value)
+    if isinstance(value, str):
+        return b's' + _pack_str(value)
+    if isinstance(value, tuple):
+        name, params = value
+        return b'd' + _pack_str(name) + struct.pack('<I', len(params)) + b''.join(_pack_str(p) for p in params)
+    raise ValueError(f"❌ Error: Cannot serialize literal {value!r}.")
+
+
+def _unpack_literal(data: bytes, pos: int):
+    tag = data[pos:pos + 1]
+    pos += 1
+    if tag == b'b':
+        return data[pos] == 1, pos + 1
+    if tag == b'i':
+        text, pos = _unpack_str(data, pos)
+        return int(text), pos
+    if tag == b'f':
+        return struct.unpack_from('<d', data, pos)[0], pos + 8
+    if tag == b's':
+        return _unpack_str(data, pos)
+    if tag == b'd':
+        name, pos = _unpack_str(data, pos)
+        (count,) = struct.unpack_from('<I', data, pos)
+        pos += 4
+        params = []
+        for _ in range(count):
+            param, pos = _unpack_str(data, pos)
+            params.append(param)
+        return (name, tuple(params)), pos
+    raise ValueError(f"❌ Error: Corrupt AST arena literal tag {tag!r}.")
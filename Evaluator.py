@@ -1,5 +1,7 @@
 # evaluator.py
 
+import operator as _op
+
 from lark import Tree, Token
 
 class Environment:
@@ -19,6 +21,133 @@ class Environment:
         self.variables[name] = value
 
 
+# Check-free operator implementations, keyed by (operand type, operator).
+# Mirrors apply_operator: the result type is the operand type for arithmetic
+# and "bool" for comparisons and logic.
+SPECIALIZED_OPS = {}
+for _t in ("int", "float"):
+    SPECIALIZED_OPS[(_t, "+")] = (_t, _op.add)
+    SPECIALIZED_OPS[(_t, "-")] = (_t, _op.sub)
+    SPECIALIZED_OPS[(_t, "*")] = (_t, _op.mul)
+    SPECIALIZED_OPS[(_t, "/")] = (_t, _op.truediv)
+    SPECIALIZED_OPS[(_t, ">")] = ("bool", _op.gt)
+    SPECIALIZED_OPS[(_t, "<")] = ("bool", _op.lt)
+for _t in ("int", "float", "string", "bool", "char"):
+    SPECIALIZED_OPS[(_t, "==")] = ("bool", _op.eq)
+    SPECIALIZED_OPS[(_t, "!=")] = ("bool", _op.ne)
+SPECIALIZED_OPS[("string", "+")] = ("string", _op.add)
+SPECIALIZED_OPS[("bool", "&&")] = ("bool", lambda a, b: a and b)
+SPECIALIZED_OPS[("bool", "||")] = ("bool", lambda a, b: a or b)
+
+TOKEN_TYPES = {
+    "INT": "int",
+    "FLOAT": "float",
+    "CHAR": "char",
+    "STRING": "string",
+    "BOOL": "bool",
+}
+
+
+class TypeChecker:
+    """Static type-checking pass over the Lark tree.
+
+    check() walks the program with a scoped type environment and returns the
+    list of type errors. When there are none, every tree node is annotated
+    (``checked``, ``static_type`` and, for bin_expr, ``op_impl``) so the
+    Evaluator can take its check-free paths.
+    """
+
+    def __init__(self):
+        self.errors = []
+        self.visited = []
+
+    def check(self, tree):
+        self.errors = []
+        self.visited = []
+        self.check_node(tree, Environment())
+        if not self.errors:
+            for node, static_type, op_impl in self.visited:
+                node.checked = True
+                node.static_type = static_type
+                if op_impl is not None:
+                    node.op_impl = op_impl
+        return self.errors
+
+    def check_node(self, node, env):
+        if isinstance(node, Token):
+            if node.type == "EMOJI" and node.value == "⏱️":
+                return "timer"
+            if node.type in TOKEN_TYPES:
+                return TOKEN_TYPES[node.type]
+            self.errors.append(f"Unknown token type: {node.type}")
+            return None
+
+        if isinstance(node, Tree):
+            node_type = node.data
+            result = None
+            op_impl = None
+
+            if node_type == "program":
+                for stmt in node.children:
+                    result = self.check_node(stmt, env)
+
+            elif node_type == "block":
+                block_env = Environment(parent=env)
+                for stmt in node.children:
+                    result = self.check_node(stmt, block_env)
+
+            elif node_type == "var_decl":
+                var_type = node.children[0].value
+                var_name = node.children[1].value
+                value_type = self.check_node(node.children[2], env)
+                if value_type is not None and value_type != var_type:
+                    self.errors.append(f"Type mismatch: variable '{var_name}' declared as {var_type}, got {value_type}")
+                env.set(var_name, var_type)
+                result = var_type
+
+            elif node_type == "assignment":
+                var_name = node.children[0].value
+                value_type = self.check_node(node.children[1], env)
+                try:
+                    old_type = env.get(var_name)
+                except Exception as e:
+                    self.errors.append(str(e))
+                    old_type = None
+                if old_type is not None and value_type is not None and old_type != value_type:
+                    self.errors.append(f"Type mismatch in assignment to '{var_name}'")
+                if old_type is not None:
+                    env.set(var_name, old_type)
+                result = old_type
+
+            elif node_type == "identifier":
+                try:
+                    result = env.get(node.children[0].value)
+                except Exception as e:
+                    self.errors.append(str(e))
+
+            elif node_type == "bin_expr":
+                left = self.check_node(node.children[0], env)
+                operator = node.children[1].value
+                right = self.check_node(node.children[2], env)
+                if left is not None and right is not None:
+                    if left != right:
+                        self.errors.append(f"Cannot operate on different types: {left} and {right}")
+                    elif (left, operator) not in SPECIALIZED_OPS:
+                        self.errors.append(f"Operator {operator} not supported for type {left}")
+                    else:
+                        result, op_impl = SPECIALIZED_OPS[(left, operator)]
+
+            else:
+                self.errors.append(f"Unknown node: {node}")
+                return None
+
+            self.visited.append((node, result, op_impl))
+            return result
+
+        self.errors.append(f"Unknown node: {node}")
+        return None
+
+
 class Evaluator:
     def __init__(self):
         self.start_time = None
@@ -68,6 +197,21 @@ class Evaluator:
                     result = self.evaluate(stmt, block_env)
                 return result
 
+            # Statically checked nodes skip the runtime type checks
+            if getattr(node, "checked", False):
+                if node_type == "var_decl":
+                    value = self.evaluate(node.children[2], env)
+                    env.set(node.children[1].value, value)
+                    return value
+                if node_type == "assignment":
+                    value = self.evaluate(node.children[1], env)
+                    env.set(node.children[0].value, value)
+                    return value
+                if node_type == "bin_expr":
+                    left = self.evaluate(node.children[0], env)
+                    right = self.evaluate(node.children[2], env)
+                    return {"type": node.static_type, "value": node.op_impl(left["value"], right["value"])}
+
             # Variable declaration: var_type name = value
             if node_type == "var_decl":
                 var_type = node.children[0].value  # Token
@@ -160,6 +304,9 @@ if __name__ == "__main__":
 
     parser = Lark(grammar, parser="lalr")
     tree = parser.parse("int x = 5 + 3; x;")
+    errors = TypeChecker().check(tree)
+    if errors:
+        raise Exception("Type errors:\n" + "\n".join(errors))
     env = Environment()
     evaluator = Evaluator()
     result = evaluator.evaluate(tree, env)
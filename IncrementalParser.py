@@ -0,0 +1,314 @@
+# IncrementalParser.py
+#
+# Incremental front end for editor and REPL workloads. Keeps the token stream
+# and the statement/block structure (👉 ... 🔚) of the previous version and,
+# for each edit, re-tokenizes only the edited lines and re-parses only the
+# innermost enclosing block body, resynchronizing at the first untouched
+# statement. The resulting AST always matches a full Lexer + Parser run.
+
+import time
+from bisect import bisect_left
+from typing import Any, List, Optional
+
+from emoji import Lexer, Parser, Token
+
+BLOCK_KINDS = ('if', 'while', 'repeat', 'def')
+
+
+def ends_in_string(line: str) -> bool:
+    """Return True if a string literal opened on this line is still open at its end.
+
+    Follows the Lexer's rules: 💭 comments run to the end of the line and a
+    backslash escapes the next character inside a string.
+    """
+    quote = None
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if quote:
+            if char == '\\':
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char == '💭':
+            return False
+        elif char in '"\'':
+            quote = char
+        i += 1
+    return quote is not None
+
+
+class StatementSpan:
+    """Token range [start, end) of one parsed statement plus its block bodies."""
+
+    __slots__ = ('start', 'end', 'children', 'bodies')
+
+    def __init__(self, start: int, end: int, children: List['StatementSpan']):
+        self.start = start
+        self.end = end
+        self.children = children
+        self.bodies: List['BlockBody'] = []
+
+
+class BlockBody:
+    """One statement list of a block: the AST list, its token range and the spans inside it."""
+
+    __slots__ = ('statements', 'start', 'end', 'spans', 'stop_types')
+
+    def __init__(self, statements: List[Any], start: int, end: int, spans: List[StatementSpan], stop_types):
+        self.statements = statements
+        self.start = start
+        self.end = end
+        self.spans = spans
+        self.stop_types = stop_types
+
+
+class SpanParser(Parser):
+    """Parser that also records a StatementSpan tree for every statement it parses."""
+
+    def __init__(self, tokens: List[Token]):
+        super().__init__(tokens)
+        self.span_stack: List[List[StatementSpan]] = [[]]
+
+    def statement(self):
+        start = self.pos
+        children: List[StatementSpan] = []
+        self.span_stack.append(children)
+        try:
+            node = super().statement()
+        finally:
+            self.span_stack.pop()
+        span = StatementSpan(start, self.pos, children)
+        if node[0] in BLOCK_KINDS:
+            span.bodies = self.block_bodies(node, span)
+        self.span_stack[-1].append(span)
+        return node
+
+    def block_bodies(self, node, span: StatementSpan) -> List[BlockBody]:
+        then_pos = span.start
+        while self.tokens[then_pos].type != 'THEN':
+            then_pos += 1
+        body_start = then_pos + 1
+        body_end = span.end - 1  # position of 🔚
+        if node[0] != 'if':
+            stmts = node[3] if node[0] == 'def' else node[2]
+            return [BlockBody(stmts, body_start, body_end, span.children, ('END',))]
+
+        then_spans = span.children[:len(node[2])]
+        if node[3] is None:
+            return [BlockBody(node[2], body_start, body_end, then_spans, ('ELSE', 'END'))]
+        else_pos = then_spans[-1].end if then_spans else body_start
+        else_spans = span.children[len(node[2]):]
+        return [
+            BlockBody(node[2], body_start, else_pos, then_spans, ('ELSE', 'END')),
+            BlockBody(node[3], else_pos + 2, body_end, else_spans, ('END',)),
+        ]
+
+    def parse_with_spans(self):
+        statements = self.parse()
+        return statements, self.span_stack[0]
+
+
+class ResyncFailed(Exception):
+    """The edit changed the block structure around the body being re-parsed."""
+
+
+class IncrementalParser:
+    """Keeps source, tokens, AST and statement spans up to date across edits.
+
+    Usage:
+        front = IncrementalParser(code)
+        ast = front.apply_edit(start, end, text)   # character offsets into front.code
+
+    Per-edit latency is recorded in ``edit_times`` and ``last_edit`` describes
+    how much work the last edit needed ('block', 'program' or 'full').
+    """
+
+    def __init__(self, code: str):
+        self.code = code
+        self.edit_times: List[float] = []
+        self.last_edit: Optional[dict] = None
+        self.full_rebuild()
+
+    def full_rebuild(self):
+        self.tokens = Lexer(self.code).tokenize()
+        self.multiline_strings = any(ends_in_string(line) for line in self.code.split('\n'))
+        self.full_parse()
+
+    def full_parse(self):
+        try:
+            self.ast, spans = SpanParser(self.tokens).parse_with_spans()
+        except SyntaxError:
+            self.ast = None
+            self.root = None
+            raise
+        self.root = BlockBody(self.ast, 0, len(self.tokens) - 1, spans, ('EOF',))
+
+    # ------------------------------------------------------------------
+    # Editing
+    # ------------------------------------------------------------------
+
+    def apply_edit(self, start: int, end: int, text: str) -> List[Any]:
+        """Replace code[start:end] with text and return the updated AST.
+
+        Raises SyntaxError exactly when a full re-parse of the new code would.
+        """
+        began = time.perf_counter()
+        level = None
+        old_code = self.code
+        self.code = old_code[:start] + text + old_code[end:]
+        try:
+            level = self.update(old_code, start, end, text)
+        except SyntaxError:
+            level = 'error'
+            raise
+        finally:
+            elapsed = time.perf_counter() - began
+            self.edit_times.append(elapsed)
+            self.last_edit = {'seconds': elapsed, 'level': level}
+        return self.ast
+
+    def update(self, old_code: str, start: int, end: int, text: str) -> str:
+        if self.multiline_strings:
+            self.full_rebuild()
+            return 'full'
+
+        # Line range [first, last] (1-based) of the old code touched by the edit
+        first = old_code.count('\n', 0, start) + 1
+        last = first + old_code.count('\n', start, end)
+        line_start = old_code.rfind('\n', 0, start) + 1
+        line_end = old_code.find('\n', end)
+        if line_end == -1:
+            line_end = len(old_code)
+        new_text = old_code[line_start:start] + text + old_code[end:line_end]
+        new_lines = new_text.split('\n')
+        if any(ends_in_string(line) for line in new_lines):
+            self.full_rebuild()
+            return 'full'
+
+        # Re-tokenize only the edited lines
+        lexer = Lexer(new_text)
+        lexer.line = first
+        new_tokens = lexer.tokenize()[:-1]
+        tokens = self.tokens
+        eof = len(tokens) - 1
+        lo = bisect_left(tokens, first, 0, eof, key=lambda t: t.line)
+        hi = bisect_left(tokens, last + 1, lo, eof, key=lambda t: t.line)
+        line_delta = len(new_lines) - (last - first + 1)
+        if line_delta:
+            for token in tokens[hi:]:
+                token.line += line_delta
+        tokens[lo:hi] = new_tokens
+        delta = len(new_tokens) - (hi - lo)
+
+        if self.root is None:
+            self.full_parse()
+            return 'full'
+
+        # Re-parse the innermost enclosing block body, falling back outwards
+        for body in reversed(self.enclosing_bodies(lo, hi)):
+            try:
+                commit = self.reparse_body(body, lo, hi, delta)
+            except (ResyncFailed, SyntaxError):
+                continue
+            self.shift_positions(self.root, lo, hi, delta, skip=body)
+            commit()
+            return 'program' if body is self.root else 'block'
+
+        self.full_parse()
+        return 'full'
+
+    def enclosing_bodies(self, lo: int, hi: int) -> List[BlockBody]:
+        """Bodies from the program down to the innermost one strictly containing [lo, hi)."""
+        path = [self.root]
+        body = self.root
+        while True:
+            inner = None
+            idx = bisect_left(body.spans, lo + 1, key=lambda s: s.end)
+            if idx < len(body.spans):
+                for candidate in body.spans[idx].bodies:
+                    if candidate.start <= lo and hi <= candidate.end:
+                        inner = candidate
+                        break
+            if inner is None:
+                return path
+            path.append(inner)
+            body = inner
+
+    def reparse_body(self, body: BlockBody, lo: int, hi: int, delta: int):
+        """Re-parse the stale statements of body against the new tokens.
+
+        Statements in a body are contiguous, so parsing restarts at the first
+        span whose lookahead token (its end) reaches the edit and stops at the
+        first old span that starts after the edited tokens. Returns a callable
+        that splices the result into the AST and span tree.
+        """
+        spans = body.spans
+        first = bisect_left(spans, lo, key=lambda s: s.end)
+        resume = bisect_left(spans, hi, lo=first, key=lambda s: s.start)
+        body_end = body.end + delta
+        parser = SpanParser(self.tokens)
+        parser.pos = spans[first].start if first < len(spans) else body.start
+        nodes = []
+        while True:
+            if resume < len(spans):
+                target = spans[resume].start + delta
+                if parser.pos == target:
+                    break
+                if parser.pos > target:
+                    resume += 1
+                    continue
+            elif parser.pos == body_end:
+                break
+            if parser.pos >= body_end or parser.current().type in body.stop_types:
+                raise ResyncFailed()
+            nodes.append(parser.statement())
+        new_spans = parser.span_stack[0]
+
+        def commit():
+            for span in spans[resume:]:
+                self.shift_span(span, delta)
+            spans[first:resume] = new_spans
+            body.statements[first:resume] = nodes
+            body.end = body_end
+
+        return commit
+
+    def shift_span(self, span: StatementSpan, delta: int):
+        span.start += delta
+        span.end += delta
+        for body in span.bodies:
+            body.start += delta
+            body.end += delta
+            for inner in body.spans:
+                self.shift_span(inner, delta)
+
+    def shift_positions(self, body: BlockBody, lo: int, hi: int, delta: int, skip: BlockBody):
+        """Move every boundary after the edited tokens, except inside skip."""
+        if body is skip or not delta:
+            return
+        if body.start >= hi and body.start > lo:
+            body.start += delta
+        if body.end >= hi:
+            body.end += delta
+        idx = bisect_left(body.spans, lo, key=lambda s: s.end)
+        for span in body.spans[idx:]:
+            if span.start >= hi and span.start > lo:
+                span.start += delta
+            if span.end >= hi:
+                span.end += delta
+            for inner in span.bodies:
+                self.shift_positions(inner, lo, hi, delta, skip)
+
+    def latency_stats(self) -> dict:
+        """Summary of per-edit latencies in seconds."""
+        times = sorted(self.edit_times)
+        if not times:
+            return {'edits': 0}
+        return {
+            'edits': len(times),
+            'mean': sum(times) / len(times),
+            'p50': times[len(times) // 2],
+            'p99': times[min(len(times) - 1, int(len(times) * 0.99))],
+            'max': times[-1],
+        }
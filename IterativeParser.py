@@ -0,0 +1,238 @@
+# IterativeParser.py
+#
+# Drop-in replacement for emoji.Parser that never recurses on the Python
+# stack. Expressions are parsed with a table-driven precedence-climbing loop
+# (explicit operator and operand stacks per expression, plus a stack of
+# suspended expressions for 🔢/🎲 operands, parentheses and call arguments),
+# and nested ❓/🔁/🔂/🎯 blocks are tracked with an explicit block stack.
+# The tuple ASTs and SyntaxError messages are identical to emoji.Parser.
+
+from typing import Any, List
+
+from emoji import Parser
+
+# token type -> (precedence level, binop symbol)
+# Levels follow Parser's call chain: logic_or(0) -> logic_and(1) ->
+# logic_not(2) -> comparison(3) -> term(4) -> factor(5) -> unary(6).
+BINARY_OPS = {
+    'OR': (0, None),
+    'AND': (1, None),
+    'EQ': (3, '=='),
+    'NEQ': (3, '!='),
+    'GT': (3, '>'),
+    'LT': (3, '<'),
+    'PLUS': (4, '+'),
+    'MINUS': (4, '-'),
+    'MULT': (5, '*'),
+    'DIV': (5, '/'),
+}
+NOT_LEVEL = 2
+COMPARISON_LEVEL = 3
+UNARY_LEVEL = 6
+
+BLOCK_HEADERS = ('IF', 'WHILE', 'REPEAT', 'DEFINE')
+
+
+class ExprFrame:
+    """One expression being parsed: pending operators, operands and what it feeds."""
+
+    __slots__ = ('kind', 'data', 'ops', 'operands', 'compared')
+
+    def __init__(self, kind: str, data=None):
+        self.kind = kind          # 'TOP', 'RANGE', 'RANDOM', 'LPAREN' or 'ARG'
+        self.data = data          # collected operands / (callee, args) for the parent
+        self.ops: List[tuple] = []
+        self.operands: List[Any] = []
+        # comparison() applies at most one comparison operator between and/or
+        self.compared = False
+
+    def reduce(self, level: int):
+        ops, operands = self.ops, self.operands
+        while ops and ops[-1][0] >= level:
+            _, kind, symbol = ops.pop()
+            if kind == 'NOT':
+                operands.append(('not', operands.pop()))
+            elif kind == 'NEG':
+                operands.append(('unop', '-', operands.pop()))
+            else:
+                right = operands.pop()
+                left = operands.pop()
+                if kind == 'OR':
+                    operands.append(('or', left, right))
+                elif kind == 'AND':
+                    operands.append(('and', left, right))
+                else:
+                    operands.append(('binop', symbol, left, right))
+
+
+class BlockFrame:
+    """An open ❓/🔁/🔂/🎯 block whose body is still being parsed."""
+
+    __slots__ = ('kind', 'header', 'body', 'then_body', 'else_body')
+
+    def __init__(self, kind: str, header: tuple):
+        self.kind = kind
+        self.header = header
+        self.body: List[Any] = []
+        self.then_body = self.body
+        self.else_body = None
+
+
+class IterativeParser(Parser):
+    def statement(self):
+        blocks: List[BlockFrame] = []
+        while True:
+            if blocks and self.block_ends(blocks[-1]):
+                node = self.close_block(blocks.pop())
+            elif self.current().type in BLOCK_HEADERS:
+                blocks.append(self.open_block())
+                continue
+            else:
+                # Simple statements only recurse into expression(), which is iterative
+                node = super().statement()
+            if not blocks:
+                return node
+            blocks[-1].body.append(node)
+
+    def open_block(self) -> BlockFrame:
+        kind = self.current().type
+        if kind == 'DEFINE':
+            self.consume('DEFINE')
+            name = self.consume('ID').value
+            params = []
+            if self.match('PARAMS'):
+                self.consume('PARAMS')
+                while not self.match('THEN'):
+                    params.append(self.consume('ID').value)
+            self.consume('THEN')
+            return BlockFrame('def', (name, params))
+        self.consume(kind)
+        expr = self.expression()
+        self.consume('THEN')
+        return BlockFrame(kind.lower(), (expr,))
+
+    def block_ends(self, frame: BlockFrame) -> bool:
+        if frame.kind == 'if' and frame.else_body is None and self.match('ELSE'):
+            self.consume('ELSE')
+            self.consume('THEN')
+            frame.else_body = []
+            frame.body = frame.else_body
+        return self.match('END')
+
+    def close_block(self, frame: BlockFrame):
+        self.consume('END')
+        if frame.kind == 'if':
+            return ('if', frame.header[0], frame.then_body, frame.else_body)
+        return (frame.kind,) + frame.header + (frame.body,)
+
+    def expression(self):
+        suspended: List[ExprFrame] = []
+        frame = ExprFrame('TOP')
+        level = 0
+        operand = None
+        while True:
+            if operand is None:
+                # Operand position: prefix operators, then a primary
+                t = self.current().type
+                if t == 'NOT' and level <= NOT_LEVEL:
+                    self.advance()
+                    frame.ops.append((NOT_LEVEL, 'NOT', None))
+                    level = NOT_LEVEL
+                    continue
+                if t == 'MINUS':
+                    self.advance()
+                    frame.ops.append((UNARY_LEVEL, 'NEG', None))
+                    level = UNARY_LEVEL
+                    continue
+                if t in ('RANGE', 'RANDOM', 'LPAREN'):
+                    self.advance()
+                    suspended.append(frame)
+                    frame = ExprFrame(t, [] if t != 'LPAREN' else None)
+                    level = 0
+                    continue
+                operand = self.atom()
+
+            # Postfix calls: callee(arg arg ...)
+            if self.match('LPAREN'):
+                self.advance()
+                if self.match('RPAREN'):
+                    self.advance()
+                    operand = ('call', operand, [])
+                    continue
+                suspended.append(frame)
+                frame = ExprFrame('ARG', (operand, []))
+                level = 0
+                operand = None
+                continue
+            frame.operands.append(operand)
+            operand = None
+
+            # Infix operators
+            op = BINARY_OPS.get(self.current().type)
+            if op and not (op[0] == COMPARISON_LEVEL and frame.compared):
+                op_level, symbol = op
+                frame.reduce(op_level)
+                frame.ops.append((op_level, self.current().type, symbol))
+                if op_level == COMPARISON_LEVEL:
+                    frame.compared = True
+                elif op_level < COMPARISON_LEVEL:
+                    frame.compared = False
+                self.advance()
+                level = op_level + 1
+                continue
+
+            # This expression is complete; hand it to whatever was waiting for it
+            frame.reduce(-1)
+            node = frame.operands[0]
+            if not suspended:
+                return node
+            if frame.kind in ('RANGE', 'RANDOM'):
+                frame.data.append(node)
+                if len(frame.data) < 2:
+                    frame = ExprFrame(frame.kind, frame.data)
+                    level = 0
+                    continue
+                operand = (frame.kind.lower(),) + tuple(frame.data)
+            elif frame.kind == 'LPAREN':
+                self.consume('RPAREN')
+                operand = node
+            else:
+                callee, args = frame.data
+                args.append(node)
+                if not self.match('RPAREN'):
+                    frame = ExprFrame('ARG', frame.data)
+                    level = 0
+                    continue
+                self.advance()
+                operand = ('call', callee, args)
+            frame = suspended.pop()
+
+    def atom(self):
+        """Primaries that contain no nested expression."""
+        if self.match('NUM'):
+            value = self.current().value
+            self.advance()
+            return ('num', value)
+        elif self.match('STR'):
+            value = self.current().value
+            self.advance()
+            return ('str', value)
+        elif self.match('TRUE'):
+            self.advance()
+            return ('bool', True)
+        elif self.match('FALSE'):
+            self.advance()
+            return ('bool', False)
+        elif self.match('INPUT'):
+            self.consume('INPUT')
+            if self.match('STR'):
+                prompt = ('str', self.current().value)
+                self.advance()
+                return ('input', prompt)
+            return ('input', None)
+        elif self.match('ID'):
+            name = self.current().value
+            self.advance()
+            return ('var', name)
+        else:
+            raise SyntaxError(f"Unexpected token: {self.current()}")
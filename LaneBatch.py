@@ -0,0 +1,653 @@
+# LaneBatch.py
+#
+# Lane-parallel batch evaluation: run one program over N inputs at once.
+# Every variable holds a vector with one value per lane (a NumPy array, or a
+# plain list when NumPy is not installed), and ❓/🔁/🔂 run their bodies
+# under a boolean mask of the lanes that took that path, so lanes can
+# diverge. Each lane's 📝 reads the next entry of its own row of inputs and
+# each lane's 🖨️ lines are collected separately.
+#
+# Vectors hold all bools, all ints, all floats, or numbers (each lane an int
+# or a float, tracked with a mask so ints still print and count as ints).
+# When a lane cannot continue in the batch (it raises an error, its input is
+# not a number, its int would leave int64 or float precision, or its value
+# is a bool where most lanes hold numbers or the reverse) it is retired and later re-run on its own with LaneInterpreter,
+# which reproduces its exact output and error. Programs using constructs
+# that are not vectorized (🎯, calls, 🎲, ⏱️, 🔢, 📚) run lane by lane.
+#
+# Usage:
+#     results = run_batch(ast, [['7'], ['3'], ['12']])
+#     results[0].output, results[0].error
+
+from typing import Any, List, Optional, Sequence
+
+from emoji import Interpreter, flatten
+from ParallelRepeat import iter_nodes
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+VECTOR_NODES = {'num', 'str', 'bool', 'var', 'assign', 'binop', 'unop', 'and', 'or', 'not',
+                'if', 'while', 'repeat', 'print', 'input'}
+COMPARISONS = {'==', '!=', '<', '>'}
+NUMBER_KINDS = (bool, int, float)
+
+# int64 limits used to retire lanes before NumPy could overflow or round
+INT_LIMIT = 1 << 62
+EXACT_FLOAT_LIMIT = 1 << 53
+
+
+class Unvectorizable(Exception):
+    """Raised when the whole batch has to fall back to per-lane execution."""
+
+
+class LaneResult:
+    """Output lines and final error of one lane."""
+
+    __slots__ = ('output', 'error')
+
+    def __init__(self, output: List[str], error: Optional[BaseException] = None):
+        self.output = output
+        self.error = error
+
+    def __repr__(self):
+        return f"LaneResult({self.output!r}, {self.error!r})"
+
+
+class LaneInterpreter(Interpreter):
+    """Interpreter for a single lane: 📝 reads from a list, 🖨️ appends to output."""
+
+    def __init__(self, inputs: Sequence[str], seed=None):
+        super().__init__(seed)
+        self.inputs = inputs
+        self.next_input = 0
+        self.output: List[str] = []
+
+    def eval(self, node):
+        if node is not None and node[0] == 'input':
+            self.input_prompt(node[1])
+            if self.next_input >= len(self.inputs):
+                raise EOFError("EOF when reading a line")
+            self.next_input += 1
+            return self.convert_input(self.inputs[self.next_input - 1])
+        return super().eval(node)
+
+    def emit(self, text):
+        self.output.append(str(text))
+
+    def run(self, ast) -> LaneResult:
+        try:
+            self.execute(ast)
+        except Exception as e:
+            return LaneResult(self.output, e)
+        return LaneResult(self.output)
+
+
+class Number:
+    """Vector kind whose lanes hold a mix of ints and floats."""
+
+
+class Vector:
+    """One value per lane, all of the same kind (bool, int, float or Number).
+
+    Number vectors also carry ints, the mask of lanes holding an int.
+    """
+
+    __slots__ = ('kind', 'data', 'ints')
+
+    def __init__(self, kind: type, data, ints=None):
+        self.kind = kind
+        self.data = data
+        self.ints = ints
+
+
+class ListLanes:
+    """Pure-Python lane operations on lists; values in unmasked lanes are junk."""
+
+    name = 'python'
+    exact_ints = True
+
+    def __init__(self, lanes: int):
+        self.lanes = lanes
+
+    def mask(self, value: bool):
+        return [value] * self.lanes
+
+    def full(self, value, kind: type):
+        return [kind(value)] * self.lanes
+
+    def from_list(self, values: List[Any], kind: type):
+        return values
+
+    def item(self, data, lane: int):
+        return data[lane]
+
+    def any(self, mask) -> bool:
+        return any(mask)
+
+    def count(self, mask) -> int:
+        return sum(mask)
+
+    def indices(self, mask) -> List[int]:
+        return [lane for lane, active in enumerate(mask) if active]
+
+    def both(self, a, b):
+        return [x and y for x, y in zip(a, b)]
+
+    def either(self, a, b):
+        return [x or y for x, y in zip(a, b)]
+
+    def without(self, a, b):
+        return [x and not y for x, y in zip(a, b)]
+
+    def where(self, mask, a, b):
+        return [x if m else y for m, x, y in zip(mask, a, b)]
+
+    def truthy(self, vector: Vector):
+        return [bool(x) for x in vector.data]
+
+    def as_int(self, data):
+        return [int(x) for x in data]
+
+    def to_number(self, data):
+        # Lists keep every lane's own int or float
+        return data
+
+    def zeros(self, data, mask):
+        return [m and x == 0 for m, x in zip(mask, data)]
+
+    def beyond(self, data, limit: int, mask):
+        return self.mask(False)
+
+    def greater_than(self, data, value):
+        return [x > value for x in data]
+
+    def arith(self, op: str, a, b, mask):
+        if op == '+':
+            return [x + y if m else 0 for m, x, y in zip(mask, a, b)]
+        if op == '-':
+            return [x - y if m else 0 for m, x, y in zip(mask, a, b)]
+        if op == '*':
+            return [x * y if m else 0 for m, x, y in zip(mask, a, b)]
+        return [x / y if m else 0.0 for m, x, y in zip(mask, a, b)]
+
+    def compare(self, op: str, a, b):
+        if op == '==':
+            return [x == y for x, y in zip(a, b)]
+        if op == '!=':
+            return [x != y for x, y in zip(a, b)]
+        if op == '<':
+            return [x < y for x, y in zip(a, b)]
+        return [x > y for x, y in zip(a, b)]
+
+    def negate(self, data, mask):
+        return [-x if m else 0 for m, x in zip(mask, data)]
+
+    def int_zeros(self, data, ints):
+        """data with -0.0 replaced by 0.0 on int lanes (lists hold real ints: nothing to do)."""
+        return data
+
+
+class NumpyLanes(ListLanes):
+    """Lane operations on NumPy arrays (bool, int64 and float64)."""
+
+    name = 'numpy'
+    exact_ints = False
+    DTYPES = {bool: 'bool', int: 'int64', float: 'float64', Number: 'float64'}
+
+    def mask(self, value: bool):
+        return numpy.full(self.lanes, value, dtype=bool)
+
+    def full(self, value, kind: type):
+        return numpy.full(self.lanes, value, dtype=self.DTYPES[kind])
+
+    def from_list(self, values: List[Any], kind: type):
+        return numpy.array(values, dtype=self.DTYPES[kind])
+
+    def item(self, data, lane: int):
+        return data[lane].item()
+
+    def any(self, mask) -> bool:
+        return bool(mask.any())
+
+    def count(self, mask) -> int:
+        return int(numpy.count_nonzero(mask))
+
+    def indices(self, mask) -> List[int]:
+        return numpy.flatnonzero(mask).tolist()
+
+    def both(self, a, b):
+        return a & b
+
+    def either(self, a, b):
+        return a | b
+
+    def without(self, a, b):
+        return a & ~b
+
+    def where(self, mask, a, b):
+        return numpy.where(mask, a, b)
+
+    def truthy(self, vector: Vector):
+        return vector.data if vector.kind is bool else vector.data != 0
+
+    def as_int(self, data):
+        return data.astype('int64')
+
+    def to_number(self, data):
+        return data.astype('float64')
+
+    def zeros(self, data, mask):
+        return mask & (data == 0)
+
+    def beyond(self, data, limit: int, mask):
+        # Compare as floats so the check itself cannot overflow
+        return mask & (numpy.abs(data.astype('float64')) >= limit)
+
+    def greater_than(self, data, value):
+        return data > value
+
+    def arith(self, op: str, a, b, mask):
+        with numpy.errstate(all='ignore'):
+            if op == '+':
+                return a + b
+            if op == '-':
+                return a - b
+            if op == '*':
+                return a * b
+            return a / b
+
+    def compare(self, op: str, a, b):
+        if op == '==':
+            return a == b
+        if op == '!=':
+            return a != b
+        if op == '<':
+            return a < b
+        return a > b
+
+    def negate(self, data, mask):
+        return -data
+
+    def int_zeros(self, data, ints):
+        # Number lanes are float64, so an int 0 negated or multiplied by a
+        # negative comes out as -0.0; adding 0.0 turns it back into 0.0
+        return numpy.where(ints, data + 0.0, data)
+
+
+def make_lanes(lanes: int, backend: Optional[str] = None) -> ListLanes:
+    """'numpy', 'python', or None for NumPy when it is installed."""
+    if backend is None:
+        backend = 'numpy' if numpy is not None else 'python'
+    if backend == 'numpy':
+        if numpy is None:
+            raise ImportError("the numpy backend needs NumPy installed")
+        return NumpyLanes(lanes)
+    if backend == 'python':
+        return ListLanes(lanes)
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def is_vectorizable(ast) -> bool:
+    return all(node[0] in VECTOR_NODES for node in iter_nodes(ast))
+
+
+class LaneBatch:
+    """Runs one program over many lanes; see the module comment.
+
+    Usage:
+        batch = LaneBatch(inputs)           # inputs[lane] = that lane's 📝 answers
+        results = batch.run(ast)
+        batch.vectorized, batch.retired     # how the lanes were executed
+    """
+
+    def __init__(self, inputs: Sequence[Sequence[str]], backend: Optional[str] = None):
+        self.inputs = inputs
+        self.ops = make_lanes(len(inputs), backend)
+        self.reference = Interpreter()
+        self.alive = self.ops.mask(True)
+        self.variables = {}
+        self.defined = {}
+        self.cursors = [0] * len(inputs)
+        self.outputs: List[List[str]] = [[] for _ in inputs]
+        self.vectorized = False
+        self.retired = 0
+        self.ast = None
+
+    def run(self, ast) -> List[LaneResult]:
+        self.ast = ast
+        lanes = len(self.inputs)
+        if is_vectorizable(ast):
+            try:
+                self.execute_block(ast, self.alive)
+                self.vectorized = True
+            except Unvectorizable:
+                pass
+        if not self.vectorized:
+            return [self.run_lane(lane) for lane in range(lanes)]
+        alive = set(self.ops.indices(self.alive))
+        self.retired = lanes - len(alive)
+        return [LaneResult(self.outputs[lane]) if lane in alive else self.run_lane(lane)
+                for lane in range(lanes)]
+
+    def run_lane(self, lane: int) -> LaneResult:
+        return LaneInterpreter(self.inputs[lane]).run(self.ast)
+
+    def retire(self, mask):
+        self.alive = self.ops.without(self.alive, mask)
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def execute_block(self, statements, mask):
+        ops = self.ops
+        for stmt in statements:
+            mask = ops.both(mask, self.alive)
+            if not ops.any(mask):
+                return
+            self.execute(stmt, mask)
+
+    def execute(self, node, mask):
+        kind = node[0]
+        ops = self.ops
+        if kind == 'if':
+            taken = self.condition(node[1], mask)
+            self.execute_block(node[2], taken)
+            if node[3]:
+                self.execute_block(node[3], ops.without(mask, taken))
+        elif kind == 'while':
+            active = mask
+            while True:
+                active = ops.both(self.condition(node[1], ops.both(active, self.alive)), self.alive)
+                if not ops.any(active):
+                    break
+                self.execute_block(node[2], active)
+        elif kind == 'repeat':
+            self.execute_repeat(node, mask)
+        elif kind == 'print':
+            self.print_value(self.value(node[1], mask), ops.both(mask, self.alive))
+        else:
+            self.value(node, mask)
+
+    def execute_repeat(self, node, mask):
+        ops = self.ops
+        count = self.value(node[1], mask)
+        if not isinstance(count, Vector):
+            count = flatten(count)
+            if type(count) not in (bool, int):
+                self.retire(mask)  # range() raises TypeError
+                return
+            for _ in range(count):
+                self.execute_block(node[2], mask)
+            return
+        if count.kind is float:
+            self.retire(mask)
+            return
+        if count.kind is Number:
+            self.retire(ops.without(mask, count.ints))  # range() of a float
+        iteration = 0
+        while True:
+            active = ops.both(ops.both(mask, self.alive), ops.greater_than(count.data, iteration))
+            if not ops.any(active):
+                break
+            self.execute_block(node[2], active)
+            iteration += 1
+
+    def print_value(self, value, mask):
+        lanes = self.ops.indices(mask)
+        if isinstance(value, Vector):
+            for lane in lanes:
+                self.outputs[lane].append(str(self.lane_value(value, lane)))
+            return
+        value = flatten(value)
+        text = self.reference.translate_output(value) if isinstance(value, str) else str(value)
+        for lane in lanes:
+            self.outputs[lane].append(text)
+
+    def lane_value(self, vector: Vector, lane: int):
+        value = self.ops.item(vector.data, lane)
+        if vector.kind is Number and not self.ops.exact_ints and self.ops.item(vector.ints, lane):
+            return int(value)
+        return value
+
+    def condition(self, node, mask):
+        """Mask of the lanes in mask for which node is truthy."""
+        value = self.value(node, mask)
+        if isinstance(value, Vector):
+            return self.ops.both(mask, self.ops.truthy(value))
+        return mask if value else self.ops.mask(False)
+
+    # ------------------------------------------------------------------
+    # Expressions: a Vector, or a plain value shared by every lane
+    # ------------------------------------------------------------------
+
+    def value(self, node, mask):
+        kind = node[0]
+        ops = self.ops
+        if kind in ('num', 'str', 'bool'):
+            return node[1]
+        if kind == 'var':
+            name = node[1]
+            if name not in self.variables:
+                self.retire(mask)  # NameError in every lane
+                return 0
+            self.retire(ops.without(mask, self.defined[name]))
+            return self.variables[name]
+        if kind == 'assign':
+            value = self.value(node[2], mask)
+            self.assign(node, value, ops.both(mask, self.alive))
+            return value
+        if kind == 'binop':
+            left = self.value(node[2], mask)
+            right = self.value(node[3], mask)
+            return self.binop(node[1], left, right, ops.both(mask, self.alive))
+        if kind == 'unop':
+            return self.unop(node[1], self.value(node[2], mask), ops.both(mask, self.alive))
+        if kind == 'not':
+            operand = self.value(node[1], mask)
+            if isinstance(operand, Vector):
+                return Vector(bool, ops.without(ops.mask(True), ops.truthy(operand)))
+            return not operand
+        if kind in ('and', 'or'):
+            return self.logic(kind, node, mask)
+        if kind == 'input':
+            return self.read_input(mask)
+        raise Unvectorizable(kind)
+
+    def logic(self, kind, node, mask):
+        ops = self.ops
+        left = self.value(node[1], mask)
+        mask = ops.both(mask, self.alive)
+        truthy = ops.truthy(left) if isinstance(left, Vector) else ops.mask(bool(left))
+        # 👨‍👩‍👧 evaluates the right side where the left is truthy, 👩‍👧 where it is not
+        right_mask = ops.both(mask, truthy) if kind == 'and' else ops.without(mask, truthy)
+        short = kind == 'or'
+        if not ops.any(right_mask):
+            return short
+        right = self.value(node[2], right_mask)
+        rest = ops.without(ops.both(mask, self.alive), right_mask)
+        if not ops.any(rest):
+            return right
+        return self.merge(ops.both(right_mask, self.alive), right, rest, short)
+
+    def read_input(self, mask):
+        read = {int: {}, float: {}}
+        failed = set()
+        for lane in self.ops.indices(mask):
+            row = self.inputs[lane]
+            if self.cursors[lane] >= len(row):
+                failed.add(lane)  # EOFError
+                continue
+            value = self.reference.convert_input(row[self.cursors[lane]])
+            self.cursors[lane] += 1
+            if type(value) in read and (self.ops.exact_ints or type(value) is float or abs(value) < INT_LIMIT):
+                read[type(value)][lane] = value
+            else:
+                failed.add(lane)
+        if read[int] and read[float]:
+            kind = Number
+            if not self.ops.exact_ints:
+                failed.update(lane for lane, value in read[int].items() if abs(value) >= EXACT_FLOAT_LIMIT)
+        else:
+            kind = int if read[int] else float
+        if failed:
+            self.retire(self.ops.from_list([lane in failed for lane in range(len(self.inputs))], bool))
+        values = [0] * len(self.inputs)
+        for lanes in read.values():
+            for lane, value in lanes.items():
+                if lane not in failed:
+                    values[lane] = value
+        if kind is Number:
+            return Vector(Number, self.ops.from_list(values, Number),
+                          self.ops.from_list([type(value) is int for value in values], bool))
+        return Vector(kind, self.ops.from_list(values, kind))
+
+    def assign(self, node, value, mask):
+        ops = self.ops
+        name = node[1]
+        if name.lower() in Interpreter.RESERVED_NAMES:
+            self.retire(mask)
+            return
+        defined = self.defined.get(name)
+        if defined is None:
+            defined = ops.mask(False)
+        if len(node) > 3 and node[3] == 'new_var':
+            # 📦 of a variable this lane already declared
+            self.retire(ops.both(mask, defined))
+            mask = ops.both(mask, self.alive)
+        outside = ops.without(ops.both(self.alive, defined), mask)
+        if ops.any(outside):
+            value = self.merge(mask, value, outside, self.variables[name])
+        self.variables[name] = value
+        self.defined[name] = ops.either(defined, mask)
+
+    def merge(self, inside, new, outside, old):
+        """new in the inside lanes, old in the outside lanes, as one homogeneous value."""
+        ops = self.ops
+        if not isinstance(new, Vector) and not isinstance(old, Vector) and type(new) is type(old) and new == old:
+            return new
+        new = self.vector(new)
+        old = self.vector(old)
+        if new.kind is not old.kind and new.kind is not bool and old.kind is not bool:
+            new = self.numeric(new)
+            old = self.numeric(old)
+        if new.kind is not old.kind:
+            # A bool against numbers: keep the larger group in the batch; the
+            # other lanes run on their own
+            if ops.count(inside) >= ops.count(outside):
+                self.retire(outside)
+                return new
+            self.retire(inside)
+            return old
+        if new.kind is Number:
+            return Vector(Number, ops.where(inside, new.data, old.data), ops.where(inside, new.ints, old.ints))
+        return Vector(new.kind, ops.where(inside, new.data, old.data))
+
+    def numeric(self, vector: Vector) -> Vector:
+        """vector as a Number vector (bools become ints)."""
+        ops = self.ops
+        if vector.kind is Number:
+            return vector
+        if vector.kind is float:
+            return Vector(Number, vector.data, ops.mask(False))
+        data = ops.as_int(vector.data) if vector.kind is bool else vector.data
+        if not ops.exact_ints:
+            self.retire(ops.beyond(data, EXACT_FLOAT_LIMIT, self.alive))
+        return Vector(Number, ops.to_number(data), ops.mask(True))
+
+    def vector(self, value) -> Vector:
+        if isinstance(value, Vector):
+            return value
+        if type(value) not in NUMBER_KINDS or (type(value) is int and not self.ops.exact_ints and abs(value) >= INT_LIMIT):
+            raise Unvectorizable(type(value).__name__)
+        return Vector(type(value), self.ops.full(value, type(value)))
+
+    # ------------------------------------------------------------------
+    # Operators
+    # ------------------------------------------------------------------
+
+    def binop(self, op, left, right, mask):
+        ops = self.ops
+        if not isinstance(left, Vector) and not isinstance(right, Vector):
+            try:
+                return self.reference.apply_binop(op, left, right)
+            except Exception:
+                self.retire(mask)
+                return 0
+        for operand in (left, right):
+            if not isinstance(operand, Vector) and type(flatten(operand)) not in NUMBER_KINDS:
+                # A string against numbers: comparisons are constant, the rest raise TypeError,
+                # except ✖️ which would build a different string in every lane
+                if op in COMPARISONS:
+                    return op == '!='
+                if op == '*':
+                    raise Unvectorizable('string repetition')
+                self.retire(mask)
+                return 0
+        left = self.vector(left)
+        right = self.vector(right)
+        if left.kind in (bool, int) and right.kind in (bool, int) and op != '/':
+            return self.int_binop(op, left, right, mask)
+        left = self.numeric(left)
+        right = self.numeric(right)
+        mask = ops.both(mask, self.alive)
+        if op in COMPARISONS:
+            return Vector(bool, ops.compare(op, left.data, right.data))
+        if op == '/':
+            self.retire(ops.zeros(right.data, mask))
+            return Vector(float, ops.arith(op, left.data, right.data, ops.both(mask, self.alive)))
+        if op not in ('+', '-', '*'):
+            self.retire(mask)
+            return 0
+        data = ops.arith(op, left.data, right.data, mask)
+        ints = ops.both(left.ints, right.ints)
+        if not ops.any(ints):
+            return Vector(float, data)
+        if not ops.exact_ints:
+            # int op int lanes are only exact while the result fits a float's mantissa
+            self.retire(ops.beyond(data, EXACT_FLOAT_LIMIT, ops.both(mask, ints)))
+        return Vector(Number, ops.int_zeros(data, ints), ints)
+
+    def int_binop(self, op, left, right, mask):
+        ops = self.ops
+        left_data = ops.as_int(left.data) if left.kind is bool else left.data
+        right_data = ops.as_int(right.data) if right.kind is bool else right.data
+        if not ops.exact_ints:
+            # Retire lanes whose int64 result could overflow
+            self.retire(ops.beyond(left_data, INT_LIMIT, mask))
+            self.retire(ops.beyond(right_data, INT_LIMIT, mask))
+            if op == '*':
+                self.retire(ops.beyond(ops.arith('*', ops.to_number(left_data), right_data, mask), INT_LIMIT, mask))
+            mask = ops.both(mask, self.alive)
+        if op in COMPARISONS:
+            return Vector(bool, ops.compare(op, left_data, right_data))
+        if op not in ('+', '-', '*'):
+            self.retire(mask)
+            return 0
+        return Vector(int, ops.arith(op, left_data, right_data, mask))
+
+    def unop(self, op, operand, mask):
+        if not isinstance(operand, Vector):
+            try:
+                return self.reference.apply_unop(op, operand)
+            except Exception:
+                self.retire(mask)
+                return 0
+        ops = self.ops
+        data = ops.as_int(operand.data) if operand.kind is bool else operand.data
+        if op != '-':
+            self.retire(mask)
+            return 0
+        if operand.kind is Number:
+            return Vector(Number, ops.int_zeros(ops.negate(data, mask), operand.ints), operand.ints)
+        if operand.kind is not float:
+            self.retire(ops.beyond(data, INT_LIMIT, mask))
+            mask = ops.both(mask, self.alive)
+        return Vector(float if operand.kind is float else int, ops.negate(data, mask))
+
+def run_batch(ast, inputs: Sequence[Sequence[str]], backend: Optional[str] = None) -> List[LaneResult]:
+    """Run ast once per row of inputs; results[lane] matches LaneInterpreter(inputs[lane]).run(ast)."""
+    return LaneBatch(inputs, backend).run(ast)
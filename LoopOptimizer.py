@@ -0,0 +1,315 @@
+# LoopOptimizer.py
+#
+# AST pass that speeds up 🔁 and 🔂 loops, and an Interpreter that runs the
+# rewritten nodes:
+#
+#   - Invariant hoisting: pure sub-expressions whose variables are never
+#     assigned in the loop are wrapped in ('invariant', slot, expr). The value
+#     is computed the first time it is needed after entering the loop and then
+#     reused, so an expression that would raise still raises at the same point.
+#   - Induction variables: `🔁 i ⬇️ bound 👉 ... i ➡️ i ➕ k 🔚` (and the
+#     ⬆️ / ➖ mirror) with an invariant bound and i assigned nowhere else becomes
+#     ('counted_while', ...), which iterates a native range and stores i
+#     directly into its scope.
+#   - 🔂 bodies run in a tight loop with the count evaluated once.
+#
+# Scoping is dynamic and a function can assign any variable of its caller, so
+# loops whose body (or condition) contains a call or a 🎯 definition are left
+# as they are. Calls to pure builtins are the exception: they behave like
+# operators, unless the program could shadow the builtin's name (it assigns
+# or defines that name, or uses 📚). Output, results and errors are identical
+# to emoji.Interpreter.
+#
+# Lazily parsed 🎯 bodies (Parser(lazy=True)) are not parsed up front: a body
+# is optimized when it is first called, and its unparsed tokens are scanned
+# for names that could shadow a builtin.
+
+import itertools
+import math
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from emoji import Interpreter, LazyBody, flatten
+from ParallelRepeat import iter_nodes
+
+# Nodes that may let the loop body change variables behind our back
+OPAQUE_NODES = {'call', 'def'}
+# Expression kinds that are worth hoisting when all their inputs are invariant
+PURE_NODES = {'num', 'str', 'bool', 'var', 'binop', 'unop', 'and', 'or', 'not', 'range', 'invariant'}
+ATOMS = {'num', 'str', 'bool', 'var', 'invariant'}
+
+_MISSING = object()
+
+
+def writes_of(body) -> Dict[str, int]:
+    """Assigned name -> number of assignments anywhere in body."""
+    counts: Dict[str, int] = {}
+    for n in iter_nodes(body):
+        if n[0] == 'assign':
+            counts[n[1]] = counts.get(n[1], 0) + 1
+    return counts
+
+
+def is_unparsed(body) -> bool:
+    return type(body) is LazyBody and body.statements is None
+
+
+def lazy_shadows(body: LazyBody, shadowed: set) -> bool:
+    """Add every name an unparsed body could bind to shadowed; False if it uses 📚.
+
+    Conservative: any identifier that is not directly called counts.
+    """
+    parser = body.parser
+    if parser is None:
+        # Parsed since the caller looked; walk the statements instead
+        for n in iter_nodes(body):
+            if n[0] == 'import':
+                return False
+            if n[0] in ('assign', 'def'):
+                shadowed.add(n[1])
+            if n[0] == 'def':
+                shadowed.update(n[2])
+        return True
+    tokens = parser.tokens
+    for i in range(body.start, body.end):
+        token = tokens[i]
+        if token.type == 'IMPORT':
+            return False
+        if token.type == 'ID' and tokens[i + 1].type != 'LPAREN':
+            shadowed.add(token.value)
+    return True
+
+
+def is_pure_call(node, pure_calls: FrozenSet[str]) -> bool:
+    return node[0] == 'call' and node[1][0] == 'var' and node[1][1] in pure_calls
+
+
+def is_invariant(expr, writes, pure_calls: FrozenSet[str] = frozenset()) -> bool:
+    for n in iter_nodes(expr):
+        if n[0] == 'call':
+            if not is_pure_call(n, pure_calls):
+                return False
+        elif n[0] not in PURE_NODES or (n[0] == 'var' and n[1] in writes):
+            return False
+    return True
+
+
+class LoopOptimizer:
+    """Rewrites loops in a program (including 🎯 bodies); see the module comment."""
+
+    def __init__(self, builtins: Optional[Dict[str, Any]] = None):
+        self.slot_ids = itertools.count()
+        self.stats = {'hoisted': 0, 'counted': 0, 'repeat': 0, 'skipped': 0}
+        self.builtins = builtins if builtins is not None else {}
+        self.pure_calls: FrozenSet[str] = frozenset()
+        # id(LazyBody) -> [body, pure_calls when it was defined, optimized statements or None]
+        self.lazy_bodies: Dict[int, list] = {}
+
+    def optimize(self, program: List[Any]) -> List[Any]:
+        self.pure_calls = self.unshadowed_pure_builtins(program)
+        return self.optimize_block(program)
+
+    def unshadowed_pure_builtins(self, program) -> FrozenSet[str]:
+        shadowed: set = set()
+        pending = [program]
+        while pending:
+            for n in iter_nodes(pending.pop(), prune={'def'}):
+                if n[0] == 'import':
+                    return frozenset()
+                if n[0] in ('assign', 'def'):
+                    shadowed.add(n[1])
+                if n[0] == 'def':
+                    shadowed.update(n[2])
+                    if not is_unparsed(n[3]):
+                        pending.append(n[3])
+                    elif not lazy_shadows(n[3], shadowed):
+                        return frozenset()
+        return frozenset(name for name, builtin in self.builtins.items()
+                         if builtin.pure and name not in shadowed)
+
+    def optimize_block(self, statements):
+        return [self.optimize_statement(stmt) for stmt in statements]
+
+    def optimize_statement(self, stmt):
+        kind = stmt[0]
+        if kind == 'if':
+            else_body = self.optimize_block(stmt[3]) if stmt[3] is not None else None
+            return ('if', stmt[1], self.optimize_block(stmt[2]), else_body)
+        if kind == 'def':
+            if is_unparsed(stmt[3]):
+                # Optimized on its first call (see optimize_body)
+                self.lazy_bodies[id(stmt[3])] = [stmt[3], self.pure_calls, None]
+                return stmt
+            return ('def', stmt[1], stmt[2], self.optimize_block(stmt[3]))
+        if kind in ('while', 'repeat'):
+            return self.optimize_loop(kind, stmt[1], self.optimize_block(stmt[2]))
+        return stmt
+
+    def optimize_body(self, body: LazyBody) -> List[Any]:
+        """Parsed and optimized statements of a lazy 🎯 body left alone by optimize()."""
+        entry = self.lazy_bodies.get(id(body))
+        if entry is None or entry[0] is not body:
+            # Not from a program this optimizer saw (e.g. a 📚 module)
+            return body.parse()
+        if entry[2] is None:
+            pure_calls = self.pure_calls
+            self.pure_calls = entry[1]
+            try:
+                entry[2] = self.optimize_block(body.parse())
+            finally:
+                self.pure_calls = pure_calls
+        return entry[2]
+
+    def optimize_loop(self, kind, header, body):
+        if any(n[0] in OPAQUE_NODES and not is_pure_call(n, self.pure_calls) for n in iter_nodes([header, body])):
+            self.stats['skipped'] += 1
+            return (kind, header, body)
+        writes = writes_of(body)
+        slots: List[int] = []
+        if kind == 'repeat':
+            body = self.hoist_block(body, writes, slots)
+            self.stats['repeat'] += 1
+            return ('fast_repeat', tuple(slots), header, body)
+
+        step = self.induction_step(header, body, writes)
+        cond = self.hoist(header, writes, slots)
+        body = self.hoist_block(body, writes, slots)
+        if step is not None:
+            self.stats['counted'] += 1
+            return ('counted_while', tuple(slots), cond, body, step)
+        return ('hoisted_while', tuple(slots), cond, body)
+
+    def induction_step(self, cond, body, writes) -> Optional[int]:
+        """Step k if the loop is `i ⬇️ bound ... i ➡️ i ➕ k` (or the ⬆️/➖ mirror), else None."""
+        if cond[0] != 'binop' or cond[1] not in ('<', '>') or cond[2][0] != 'var':
+            return None
+        name = cond[2][1]
+        if name.lower() in Interpreter.RESERVED_NAMES or writes.get(name) != 1:
+            return None
+        if not is_invariant(cond[3], writes, self.pure_calls) or not body:
+            return None
+        last = body[-1]
+        if last[0] != 'assign' or len(last) > 3 or last[1] != name:
+            return None
+        value = last[2]
+        if value[0] != 'binop' or value[1] not in ('+', '-') or value[2] != ('var', name):
+            return None
+        if value[3][0] != 'num' or type(value[3][1]) is not int or value[3][1] <= 0:
+            return None
+        step = value[3][1] if value[1] == '+' else -value[3][1]
+        if (step > 0) != (cond[1] == '<'):
+            return None
+        return step
+
+    def hoist(self, expr, writes, slots):
+        kind = expr[0]
+        if kind in ATOMS:
+            return expr
+        if is_invariant(expr, writes, self.pure_calls):
+            slot = next(self.slot_ids)
+            slots.append(slot)
+            self.stats['hoisted'] += 1
+            return ('invariant', slot, expr)
+        if kind == 'binop':
+            return ('binop', expr[1], self.hoist(expr[2], writes, slots), self.hoist(expr[3], writes, slots))
+        if kind == 'unop':
+            return ('unop', expr[1], self.hoist(expr[2], writes, slots))
+        if kind in ('and', 'or', 'range', 'random'):
+            return (kind, self.hoist(expr[1], writes, slots), self.hoist(expr[2], writes, slots))
+        if kind == 'not':
+            return ('not', self.hoist(expr[1], writes, slots))
+        if kind == 'call':
+            return ('call', expr[1], [self.hoist(arg, writes, slots) for arg in expr[2]])
+        return expr
+
+    def hoist_block(self, statements, writes, slots):
+        return [self.hoist_statement(stmt, writes, slots) for stmt in statements]
+
+    def hoist_statement(self, stmt, writes, slots):
+        kind = stmt[0]
+        if kind == 'assign':
+            return ('assign', stmt[1], self.hoist(stmt[2], writes, slots)) + stmt[3:]
+        if kind in ('print', 'return'):
+            return (kind, self.hoist(stmt[1], writes, slots))
+        if kind == 'if':
+            else_body = self.hoist_block(stmt[3], writes, slots) if stmt[3] is not None else None
+            return ('if', self.hoist(stmt[1], writes, slots), self.hoist_block(stmt[2], writes, slots), else_body)
+        # Nested loops have already hoisted their own invariants
+        return stmt
+
+
+class LoopOptimizingInterpreter(Interpreter):
+    """Interpreter that runs programs through LoopOptimizer first.
+
+    Usage:
+        LoopOptimizingInterpreter().execute(ast)
+    """
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.optimizer = LoopOptimizer(self.builtins)
+        self.optimized: Dict[int, Tuple[list, list]] = {}
+        self.hoisted: Dict[int, Any] = {}
+
+    def execute(self, ast: List[Any]):
+        cached = self.optimized.get(id(ast))
+        if cached is None or cached[0] is not ast:
+            cached = self.optimized[id(ast)] = (ast, self.optimizer.optimize(ast))
+        return super().execute(cached[1])
+
+    def eval(self, node):
+        if node is None:
+            return None
+        kind = node[0]
+        if kind == 'invariant':
+            value = self.hoisted.get(node[1], _MISSING)
+            if value is _MISSING:
+                value = self.hoisted[node[1]] = super().eval(node[2])
+            return value
+        if kind == 'counted_while':
+            return self.eval_counted_while(node)
+        if kind == 'hoisted_while':
+            self.enter_loop(node[1])
+            return super().eval(('while', node[2], node[3]))
+        if kind == 'fast_repeat':
+            return self.eval_fast_repeat(node)
+        return super().eval(node)
+
+    def call_function(self, func, args):
+        if type(func) is tuple and func[0] == 'function' and type(func[2]) is LazyBody:
+            func = (func[0], func[1], self.optimizer.optimize_body(func[2]))
+        return super().call_function(func, args)
+
+    def enter_loop(self, slots):
+        for slot in slots:
+            self.hoisted.pop(slot, None)
+
+    def eval_fast_repeat(self, node):
+        _, slots, count_node, body = node
+        count = flatten(self.eval(count_node))
+        self.enter_loop(slots)
+        eval = self.eval
+        result = None
+        for _ in range(count):
+            for stmt in body:
+                result = eval(stmt)
+        return result
+
+    def eval_counted_while(self, node):
+        _, slots, cond, body, step = node
+        self.enter_loop(slots)
+        name = cond[2][1]
+        start = self.get_var(name)
+        bound = self.eval(cond[3])
+        if type(start) is not int or type(bound) not in (int, float) or not math.isfinite(bound):
+            # The fast path would not reproduce the generic comparison; run it normally
+            return super().eval(('while', cond, body))
+        scope = next(scope for scope in reversed(self.scopes) if name in scope)
+        stop = math.ceil(bound) if step > 0 else math.floor(bound)
+        eval = self.eval
+        statements = body[:-1]
+        result = None
+        for value in range(start, stop, step):
+            for stmt in statements:
+                eval(stmt)
+            result = scope[name] = value + step
+        return result
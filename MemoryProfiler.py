@@ -0,0 +1,295 @@
+# MemoryProfiler.py
+#
+# tracemalloc-based memory profiling for EmojiScript programs. Allocations
+# are attributed to EmojiScript source lines and 🎯 functions instead of to
+# the emoji.py internals that happen to perform them:
+#
+#   - net bytes: memory still allocated when the statement finishes
+#     (includes nested statements and calls)
+#   - peak bytes: highest traced memory while the statement ran, measured
+#     above the level at which it started
+#
+# The interpreter also snapshots the live size of every scope in
+# self.scopes whenever traced memory reaches a new high (in steps of at
+# least PEAK_STEP), so the report shows which scopes were holding the
+# memory at peak.
+#
+# Usage:
+#     python3 MemoryProfiler.py program.emoji [--json profile.json]
+
+import json
+import sys
+import tracemalloc
+from array import array
+from typing import Any, Dict, List, Optional
+
+from emoji import Builtin, Interpreter, Lexer, Parser, StringBuilder
+
+# Re-measure scope sizes only after memory grew by this fraction since the
+# last snapshot, so growing loops do not pay for a full walk every statement
+PEAK_STEP = 0.1
+
+
+class LineParser(Parser):
+    """Parser that remembers the source line of every statement node."""
+
+    def __init__(self, tokens):
+        super().__init__(tokens)
+        self.lines: Dict[int, int] = {}
+
+    def statement(self):
+        line = self.current().line
+        node = super().statement()
+        if id(node) in self.lines:
+            # Constant nodes such as ('timer',) are one shared tuple; give
+            # each statement its own copy so it keeps its own line
+            node = tuple(list(node))
+        self.lines[id(node)] = line
+        return node
+
+
+def value_size(value, seen: Optional[set] = None) -> int:
+    """Approximate deep size in bytes of an EmojiScript value."""
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, list):
+        size += sum(value_size(item, seen) for item in value)
+    elif isinstance(value, StringBuilder):
+        size += sys.getsizeof(value.parts) + sum(value_size(part, seen) for part in value.parts)
+    elif isinstance(value, tuple) and value and value[0] == 'function':
+        pass  # function bodies belong to the program, not the scope
+    elif isinstance(value, (tuple, dict)):
+        items = value.items() if isinstance(value, dict) else enumerate(value)
+        size += sum(value_size(item, seen) for _, item in items)
+    return size
+
+
+class Usage:
+    """Counters for one source line or function."""
+
+    __slots__ = ('hits', 'net', 'peak')
+
+    def __init__(self):
+        self.hits = 0
+        self.net = 0
+        self.peak = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'net_bytes': self.net, 'peak_bytes': self.peak}
+
+
+class Frame:
+    # Readings live in a preallocated array: int objects created after the
+    # baseline reading would otherwise be counted as the statement's memory
+    __slots__ = ('usage', 'readings')
+
+    def __init__(self, usage: Usage):
+        self.usage = usage
+        self.readings = array('q', (0, 0))
+
+    @property
+    def start(self) -> int:
+        return self.readings[0]
+
+    @start.setter
+    def start(self, value: int):
+        self.readings[0] = value
+
+    @property
+    def peak(self) -> int:
+        return self.readings[1]
+
+    @peak.setter
+    def peak(self, value: int):
+        self.readings[1] = value
+
+
+class MemoryProfiler(Interpreter):
+    """Interpreter that attributes traced memory to source lines and functions.
+
+    Usage:
+        profiler = MemoryProfiler()
+        profiler.profile(code)
+        print(profiler.report())
+        profiler.dump_json('profile.json')
+    """
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.source_lines: List[str] = []
+        self.statement_lines: Dict[int, int] = {}
+        self.lines: Dict[int, Usage] = {}
+        self.functions: Dict[str, Usage] = {}
+        self.frames: List[Frame] = []
+        self.scope_names: List[str] = ['<globals>']
+        self.peak_bytes = 0
+        self.peak_scopes: List[Dict[str, Any]] = []
+        self.snapshot_at = 0
+
+    def profile(self, code: str):
+        self.source_lines = code.split('\n')
+        parser = LineParser(Lexer(code).tokenize())
+        ast = parser.parse()
+        self.statement_lines = parser.lines
+        tracemalloc.start()
+        try:
+            return self.execute(ast)
+        finally:
+            self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    # ------------------------------------------------------------------
+    # Attribution
+    # ------------------------------------------------------------------
+
+    def enter(self, usage: Usage):
+        # Push the frame before the baseline reading, so the frame itself is
+        # not counted as memory the statement allocated
+        frame = Frame(usage)
+        self.frames.append(frame)
+        current, peak = tracemalloc.get_traced_memory()
+        if len(self.frames) > 1:
+            parent = self.frames[-2]
+            parent.peak = max(parent.peak, peak)
+        tracemalloc.reset_peak()
+        frame.start = frame.peak = current
+
+    def leave(self):
+        current, peak = tracemalloc.get_traced_memory()
+        frame = self.frames.pop()
+        frame.peak = max(frame.peak, peak)
+        usage = frame.usage
+        usage.hits += 1
+        usage.net += current - frame.start
+        usage.peak = max(usage.peak, frame.peak - frame.start)
+        if self.frames:
+            parent = self.frames[-1]
+            parent.peak = max(parent.peak, frame.peak)
+        if frame.peak > self.peak_bytes:
+            self.peak_bytes = frame.peak
+        if current > self.snapshot_at:
+            self.snapshot_scopes()
+            self.snapshot_at = int(current * (1 + PEAK_STEP))
+        tracemalloc.reset_peak()
+
+    def eval(self, node):
+        line = self.statement_lines.get(id(node)) if node is not None else None
+        if line is None:
+            return super().eval(node)
+        usage = self.lines.get(line)
+        if usage is None:
+            usage = self.lines[line] = Usage()
+        self.enter(usage)
+        try:
+            return super().eval(node)
+        finally:
+            self.leave()
+
+    def call_function(self, func, args):
+        builtin = type(func) is Builtin
+        if builtin:
+            name = func.name
+        else:
+            # The callee's name is not part of the function value; find it in globals
+            name = next((key for key, value in self.globals.items() if value is func), '<anonymous>')
+        usage = self.functions.get(name)
+        if usage is None:
+            usage = self.functions[name] = Usage()
+        if not builtin:
+            self.scope_names.append(name)  # builtins run without a scope
+        self.enter(usage)
+        try:
+            return super().call_function(func, args)
+        finally:
+            self.leave()
+            if not builtin:
+                self.scope_names.pop()
+
+    def snapshot_scopes(self):
+        scopes = []
+        for depth, scope in enumerate(self.scopes):
+            sizes = {name: value_size(value) for name, value in scope.items()}
+            largest = sorted(sizes.items(), key=lambda item: item[1], reverse=True)[:5]
+            scopes.append({
+                'depth': depth,
+                'function': self.scope_names[depth] if depth < len(self.scope_names) else '?',
+                'variables': len(scope),
+                'bytes': sys.getsizeof(scope) + sum(sizes.values()),
+                'largest': [{'name': name, 'bytes': size} for name, size in largest],
+            })
+        self.peak_scopes = scopes
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def to_json(self) -> Dict[str, Any]:
+        lines = sorted(self.lines.items(), key=lambda item: item[1].peak, reverse=True)
+        functions = sorted(self.functions.items(), key=lambda item: item[1].peak, reverse=True)
+        return {
+            'peak_bytes': self.peak_bytes,
+            'lines': [dict(line=line, source=self.source_line(line), **usage.to_dict()) for line, usage in lines],
+            'functions': [dict(name=name, **usage.to_dict()) for name, usage in functions],
+            'scopes_at_peak': self.peak_scopes,
+        }
+
+    def dump_json(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, ensure_ascii=False, indent=2)
+
+    def source_line(self, line: int) -> str:
+        return self.source_lines[line - 1].strip() if 0 < line <= len(self.source_lines) else ''
+
+    def report(self, limit: int = 20) -> str:
+        data = self.to_json()
+        out = [f"Peak traced memory: {format_bytes(data['peak_bytes'])}", '',
+               f"{'Line':>5} {'Hits':>8} {'Net':>10} {'Peak':>10}  Source"]
+        for entry in data['lines'][:limit]:
+            out.append(f"{entry['line']:>5} {entry['hits']:>8} {format_bytes(entry['net_bytes']):>10} "
+                       f"{format_bytes(entry['peak_bytes']):>10}  {entry['source']}")
+        if data['functions']:
+            out += ['', f"{'Function':<20} {'Calls':>8} {'Net':>10} {'Peak':>10}"]
+            for entry in data['functions'][:limit]:
+                out.append(f"{entry['name']:<20} {entry['hits']:>8} {format_bytes(entry['net_bytes']):>10} "
+                           f"{format_bytes(entry['peak_bytes']):>10}")
+        if data['scopes_at_peak']:
+            scopes = data['scopes_at_peak']
+            shown = sorted(sorted(scopes, key=lambda scope: scope['bytes'], reverse=True)[:limit],
+                           key=lambda scope: scope['depth'])
+            out += ['', 'Scopes at peak:']
+            for scope in shown:
+                largest = ', '.join(f"{v['name']}={format_bytes(v['bytes'])}" for v in scope['largest'])
+                out.append(f"  [{scope['depth']}] {scope['function']:<18} {scope['variables']:>4} vars "
+                           f"{format_bytes(scope['bytes']):>10}  {largest}")
+            if len(scopes) > len(shown):
+                out.append(f"  ... {len(scopes) - len(shown)} smaller scopes not shown")
+        return '\n'.join(out)
+
+
+def format_bytes(size: int) -> str:
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+if __name__ == "__main__":
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Profile the memory use of an EmojiScript program.")
+    arg_parser.add_argument('program', help="EmojiScript source file")
+    arg_parser.add_argument('--json', metavar='PATH', help="also write the profile as JSON")
+    arg_parser.add_argument('--seed', type=int, default=None, help="seed for 🎲")
+    args = arg_parser.parse_args()
+
+    with open(args.program, encoding='utf-8') as f:
+        code = f.read()
+    profiler = MemoryProfiler(seed=args.seed)
+    profiler.profile(code)
+    print(profiler.report())
+    if args.json:
+        profiler.dump_json(args.json)
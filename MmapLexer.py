@@ -0,0 +1,255 @@
+# MmapLexer.py
+#
+# Zero-copy lexer mode: the source file is mmapped and scanned as UTF-8 bytes,
+# and every token records (start, end) byte offsets into the buffer instead of
+# a decoded value. Identifier names, string escapes and numbers are decoded
+# lazily the first time a token's ``value`` is read. The token stream (types,
+# values and line numbers) is identical to emoji.Lexer on the decoded source.
+#
+# One deliberate divergence: because numbers are decoded lazily, a malformed
+# literal such as ``1.2.3`` does not fail in tokenize() the way emoji.Lexer
+# does. The ValueError is raised when that token's ``value`` is first read,
+# usually by the parser.
+
+import mmap
+import re
+from typing import List, Union
+
+from emoji import SYMBOLS, Lexer, grapheme_end, is_grapheme_extend
+
+_LEXER = Lexer('')
+_KEYWORDS = {key.encode('utf-8'): token_type for key, token_type in _LEXER.emoji_keywords.items()}
+_DIGITS = dict(_LEXER.emoji_digits)
+_KEYWORD_ORDER = sorted(_KEYWORDS, key=len, reverse=True)
+
+
+def _alternation(keys) -> bytes:
+    return b'|'.join(re.escape(k) for k in sorted(keys, key=len, reverse=True))
+
+
+_TOKEN_RE = re.compile(
+    rb'(?P<ws>[ \t\r]+)'
+    rb'|(?P<nl>\n)'
+    rb'|(?P<comment>' + re.escape('💭'.encode('utf-8')) + rb'[^\n]*)'
+    rb'|(?P<kw>' + _alternation(_KEYWORDS) + rb')'
+    rb'|(?P<digits>(?:' + _alternation(k.encode('utf-8') for k in _DIGITS) + rb')+)'
+    rb'|(?P<other>[\x80-\xff][\x80-\xbf]*|[#*](?=\xef\xb8\x8f|\xe2\x83\xa3))'
+    rb'|(?P<num>[0-9][0-9.]*)'
+    rb'|"(?P<dq>[^"\\]*(?:\\[\s\S]?[^"\\]*)*)"?'
+    rb"|'(?P<sq>[^'\\]*(?:\\[\s\S]?[^'\\]*)*)'?"
+    rb'|(?P<ident>[A-Za-z_][A-Za-z0-9_]*)'
+    rb'|(?P<skip>[\s\S])'
+)
+_DIGITS_RE = re.compile('|'.join(re.escape(k) for k in sorted(_DIGITS, key=len, reverse=True)))
+_ESCAPE_RE = re.compile(r'\\(.?)', re.S)
+
+
+def _decode_text(raw: bytes) -> str:
+    return raw.decode('utf-8')
+
+
+def _decode_symbol(raw: bytes) -> str:
+    return SYMBOLS.intern(raw.decode('utf-8'))
+
+
+def _decode_string(raw: bytes) -> str:
+    return _ESCAPE_RE.sub(r'\1', raw.decode('utf-8'))
+
+
+def _decode_number(raw: bytes) -> Union[int, float]:
+    num_str = raw.decode('utf-8')
+    if '\u20e3' in num_str or '🔟' in num_str:
+        # Emoji numerals: 1️⃣0️⃣0️⃣ -> 100
+        num_str = ''.join(_DIGITS[d] for d in _DIGITS_RE.findall(num_str))
+        try:
+            return int(num_str)
+        except Exception:
+            return 0
+    return float(num_str) if '.' in num_str else int(num_str)
+
+
+_DECODERS = {'NUM': _decode_number, 'STR': _decode_string, 'ID': _decode_symbol}
+
+
+def _utf8_length(lead: int) -> int:
+    if lead >= 0xF0:
+        return 4
+    if lead >= 0xE0:
+        return 3
+    if lead >= 0xC0:
+        return 2
+    return 1
+
+
+class OffsetToken:
+    """Token that stores byte offsets into the source buffer and decodes its value on demand."""
+
+    __slots__ = ('type', 'line', 'source', 'start', 'end', '_value')
+
+    _UNSET = object()
+
+    def __init__(self, type: str, source, start: int, end: int, line: int):
+        self.type = type
+        self.line = line
+        self.source = source
+        self.start = start
+        self.end = end
+        self._value = None if type == 'EOF' else OffsetToken._UNSET
+
+    @property
+    def value(self):
+        if self._value is OffsetToken._UNSET:
+            decode = _DECODERS.get(self.type, _decode_text)
+            self._value = decode(self.source[self.start:self.end])
+        return self._value
+
+    def __repr__(self):
+        return f"Token({self.type}, {self.value})"
+
+
+class MmapLexer:
+    """Lexer over an mmapped (or any bytes-like) UTF-8 source.
+
+    Usage:
+        with MmapLexer.open('program.emoji') as lexer:
+            tokens = lexer.tokenize()
+            ast = Parser(tokens).parse()
+
+    Tokens reference the buffer, so read every value you need before the
+    lexer is closed.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.pos = 0
+        self.line = 1
+        self.tokens: List[OffsetToken] = []
+        self._file = None
+
+    @classmethod
+    def open(cls, path: str) -> 'MmapLexer':
+        f = open(path, 'rb')
+        try:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mmapped
+            source = b''
+        lexer = cls(source)
+        lexer._file = f
+        return lexer
+
+    def close(self):
+        if isinstance(self.source, mmap.mmap):
+            self.source.close()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def tokenize(self) -> List[OffsetToken]:
+        source = self.source
+        size = len(source)
+        tokens = self.tokens
+        match = _TOKEN_RE.match
+        while self.pos < size:
+            m = match(source, self.pos)
+            kind = m.lastgroup
+            start, end = m.start(kind), m.end(kind)
+            self.pos = m.end()
+
+            if kind == 'ws' or kind == 'comment' or kind == 'skip':
+                continue
+            if kind == 'nl':
+                self.line += 1
+            elif kind == 'kw':
+                if source[start] >= 0x80 and end < size and self.continues_cluster(end):
+                    end = self.pos = self.keyword_end(start, end)
+                if end < 0:
+                    # Only the start of a longer cluster, as in emoji.Lexer
+                    end = self.pos = self.extend_cluster(start, start + _utf8_length(source[start]))
+                    tokens.append(OffsetToken('ID', source, start, end, self.line))
+                else:
+                    tokens.append(OffsetToken(_KEYWORDS[source[start:end]], source, start, end, self.line))
+            elif kind == 'digits':
+                tokens.append(OffsetToken('NUM', source, start, end, self.line))
+            elif kind == 'other':
+                if end < size and source[end] >= 0x80:
+                    end = self.pos = self.extend_cluster(start, end)
+                tokens.append(OffsetToken('ID', source, start, end, self.line))
+            elif kind == 'num':
+                end = self.pos = self.extend(end, str.isdigit)
+                tokens.append(OffsetToken('NUM', source, start, end, self.line))
+            elif kind == 'dq' or kind == 'sq':
+                tokens.append(OffsetToken('STR', source, start, end, self.line))
+            elif kind == 'ident':
+                end = self.pos = self.extend(end, str.isalnum)
+                tokens.append(OffsetToken('ID', source, start, end, self.line))
+
+        tokens.append(OffsetToken('EOF', source, size, size, self.line))
+        return tokens
+
+    def continues_cluster(self, pos: int) -> bool:
+        """Whether the character at pos attaches to the one before it."""
+        lead = self.source[pos]
+        if lead < 0x80:
+            return False
+        return is_grapheme_extend(bytes(self.source[pos:pos + _utf8_length(lead)]).decode('utf-8', errors='replace'))
+
+    def keyword_end(self, start: int, end: int) -> int:
+        """End of the longest keyword at start that is not cut off mid-cluster, or -1."""
+        source = self.source
+        size = len(source)
+        for key in _KEYWORD_ORDER:
+            stop = start + len(key)
+            if stop < end and source[start:stop] == key and not (stop < size and self.continues_cluster(stop)):
+                return stop
+        return -1
+
+    def extend_cluster(self, start: int, end: int) -> int:
+        """Extend a one-character identifier to its whole grapheme cluster.
+
+        Clusters never contain ASCII, so only the following run of non-ASCII
+        bytes is decoded, in growing windows.
+        """
+        source = self.source
+        size = len(source)
+        window = 64
+        while True:
+            stop = end
+            while stop < size and source[stop] >= 0x80 and stop - start < window:
+                stop += 1
+            while stop < size and 0x80 <= source[stop] < 0xC0:
+                stop -= 1  # back up to a character boundary
+            text = bytes(source[start:stop]).decode('utf-8')
+            cut = grapheme_end(text, 0)
+            if cut < len(text) or stop >= size or source[stop] < 0x80:
+                return start + len(text[:cut].encode('utf-8'))
+            window *= 2
+
+    def extend(self, pos: int, predicate) -> int:
+        """Continue an ASCII identifier/number over non-ASCII characters accepted by predicate.
+
+        Mirrors str.isalnum()/str.isdigit() in the character Lexer, then keeps
+        consuming ASCII word characters the regex would have taken.
+        """
+        source = self.source
+        size = len(source)
+        while pos < size:
+            byte = source[pos]
+            if byte < 0x80:
+                ch = chr(byte)
+                if not (predicate(ch) or (predicate is str.isalnum and ch == '_') or (predicate is str.isdigit and ch == '.')):
+                    break
+                pos += 1
+                continue
+            length = _utf8_length(byte)
+            ch = bytes(source[pos:pos + length]).decode('utf-8', errors='replace')
+            if not predicate(ch):
+                break
+            pos += length
+        return pos
@@ -0,0 +1,93 @@
+# ParallelLexer.py
+#
+# Parallel tokenization for multi-megabyte sources. A quick regex pre-scan
+# finds the newlines that lie outside string literals (💭 comments always end
+# at a newline, so they are never split either), the source is cut at those
+# newlines into chunks, and each chunk is tokenized by emoji.Lexer in a
+# process pool. The pre-scan also counts newlines the same way the serial
+# Lexer does, so every chunk starts with the correct line number and the
+# stitched token stream is identical to Lexer(code).tokenize().
+
+import os
+import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from emoji import SYMBOLS, Lexer, Token
+
+# Strings (possibly unterminated), comments and bare newlines, in the order
+# the Lexer would meet them. Only newlines matched by the last alternative
+# are outside string literals.
+_SCAN_RE = re.compile(
+    r'"[^"\\]*(?:\\[\s\S]?[^"\\]*)*"?'
+    r"|'[^'\\]*(?:\\[\s\S]?[^'\\]*)*'?"
+    r'|💭[^\n]*'
+    r'|\n'
+)
+
+# Below this size the pool start-up costs more than it saves
+MIN_PARALLEL_SIZE = 64 * 1024
+
+
+def safe_newlines(code: str) -> List[int]:
+    """Offsets of every newline that is not inside a string literal."""
+    return [m.start() for m in _SCAN_RE.finditer(code) if m.group() == '\n']
+
+
+def split_chunks(code: str, chunks: int) -> List[Tuple[int, int, int]]:
+    """Split code into at most `chunks` pieces at safe newlines.
+
+    Returns (start, end, first_line) triples; first_line is the line number
+    the serial Lexer would be on at `start`.
+    """
+    newlines = safe_newlines(code)
+    bounds = [(0, 1)]
+    for i in range(1, chunks):
+        target = len(code) * i // chunks
+        idx = bisect_left(newlines, target)
+        if idx == len(newlines):
+            break
+        # Cut just after the newline; the chunk starts on the following line
+        start, line = newlines[idx] + 1, idx + 2
+        if start > bounds[-1][0]:
+            bounds.append((start, line))
+    return [(start, bounds[i + 1][0] if i + 1 < len(bounds) else len(code), line)
+            for i, (start, line) in enumerate(bounds)]
+
+
+def _tokenize_chunk(args) -> Tuple[list, int]:
+    chunk, first_line = args
+    lexer = Lexer(chunk)
+    lexer.line = first_line
+    tokens = lexer.tokenize()
+    return [(t.type, t.value, t.line) for t in tokens[:-1]], tokens[-1].line
+
+
+class ParallelLexer:
+    """Tokenize a large source across a process pool.
+
+    Usage:
+        tokens = ParallelLexer(code, workers=4).tokenize()
+    """
+
+    def __init__(self, code: str, workers: Optional[int] = None, chunks_per_worker: int = 4):
+        self.code = code
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+
+    def tokenize(self) -> List[Token]:
+        if self.workers == 1 or len(self.code) < MIN_PARALLEL_SIZE:
+            return Lexer(self.code).tokenize()
+
+        pieces = [(self.code[start:end], line)
+                  for start, end, line in split_chunks(self.code, self.workers * self.chunks_per_worker)]
+        tokens: List[Token] = []
+        last_line = 1
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for chunk_tokens, last_line in pool.map(_tokenize_chunk, pieces):
+                # Names come back unpickled as fresh strings; intern them here
+                tokens.extend(Token(type, SYMBOLS.intern(value) if type == 'ID' else value, line)
+                              for type, value, line in chunk_tokens)
+        tokens.append(Token('EOF', None, last_line))
+        return tokens
@@ -0,0 +1,292 @@
+# ParallelRepeat.py
+#
+# Automatic parallel execution of independent 🔂 repeat iterations.
+#
+# A dependence analysis on each ('repeat', count, body) node classifies every
+# variable the body writes as either
+#   - a reduction: only ever updated as `v ➡️ v <op> e` (op in ➕ ➖ ✖️ ➗)
+#     with e not reading v, and v read nowhere else in the body, or
+#   - private: unconditionally assigned at the top of the body before any
+#     read, so no iteration sees a value written by an earlier one.
+# Bodies that print, read input, draw random numbers, use the timer, define
+# or return from functions, import with 📚, declare with 📦, or call impure
+# functions stay sequential. Parallel loops run contiguous iteration ranges in a process
+# pool; each worker logs its reduction contributions in iteration order and
+# the parent folds them left to right, so results are bit-identical to the
+# sequential loop (including float rounding and string concatenation order).
+# Any error in a worker makes the parent re-run the loop sequentially, which
+# reproduces the exact error.
+
+import operator
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import AbstractSet, Dict, List, Optional, Set
+
+from emoji import Interpreter, LazyBody
+
+IMPURE_NODES = {'print', 'input', 'random', 'timer', 'def', 'return', 'import'}
+REDUCTION_OPS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv}
+
+
+def iter_nodes(node, prune: AbstractSet[str] = frozenset()):
+    """Yield every AST node (tuple with a kind string) inside node, including node.
+
+    Nodes whose kind is in prune are yielded but their children are not.
+    """
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (list, LazyBody)):
+            stack.extend(reversed(item))
+        elif isinstance(item, tuple) and item and isinstance(item[0], str):
+            yield item
+            if item[0] not in prune:
+                stack.extend(reversed([child for child in item[1:] if isinstance(child, (tuple, list, LazyBody))]))
+
+
+def reads_of(node) -> Set[str]:
+    return {n[1] for n in iter_nodes(node) if n[0] == 'var'}
+
+
+def reduction_operand(stmt) -> Optional[tuple]:
+    """Return (var, op, operand_expr) if stmt is `v ➡️ v <op> e` with e not reading v."""
+    if stmt[0] != 'assign' or len(stmt) > 3:
+        return None
+    value = stmt[2]
+    if value[0] != 'binop' or value[1] not in REDUCTION_OPS or value[2] != ('var', stmt[1]):
+        return None
+    if stmt[1] in reads_of(value[3]):
+        return None
+    return stmt[1], value[1], value[3]
+
+
+class RepeatPlan:
+    """Structural analysis of one repeat body (independent of runtime state)."""
+
+    __slots__ = ('node', 'parallel', 'reductions', 'privates', 'called')
+
+    def __init__(self, node):
+        self.node = node
+        self.parallel = False
+        self.reductions: Dict[str, str] = {}
+        self.privates: List[str] = []
+        self.called: Set[str] = set()
+
+
+def analyze_repeat(node) -> RepeatPlan:
+    plan = RepeatPlan(node)
+    body = node[2]
+    writes: Dict[str, List[tuple]] = {}
+    reduction_stmts: Dict[int, str] = {}
+    for n in iter_nodes(body):
+        kind = n[0]
+        if kind in IMPURE_NODES:
+            return plan
+        if kind == 'assign':
+            if len(n) > 3 or n[1].lower() in Interpreter.RESERVED_NAMES:
+                return plan
+            writes.setdefault(n[1], []).append(n)
+        elif kind == 'call':
+            if n[1][0] != 'var':
+                return plan
+            plan.called.add(n[1][1])
+
+    # Reductions: every write has reduction form and the variable is read
+    # only as the left operand of those writes
+    for name, stmts in writes.items():
+        forms = [reduction_operand(s) for s in stmts]
+        if not all(forms) or len({f[1] for f in forms}) != 1:
+            continue
+        other_reads = sum(1 for n in iter_nodes(body) if n == ('var', name)) - len(stmts)
+        if other_reads == 0:
+            plan.reductions[name] = forms[0][1]
+            for s in stmts:
+                reduction_stmts[id(s)] = name
+
+    # Privates: defined by an unconditional top-level assignment before any read
+    defined: Set[str] = set()
+    for stmt in body:
+        if id(stmt) in reduction_stmts:
+            reads = reads_of(stmt[2][3])
+        else:
+            reads = reads_of(stmt)
+        for name in reads:
+            if name in writes and name not in plan.reductions and name not in defined:
+                return plan
+        if stmt[0] == 'assign' and stmt[1] not in plan.reductions:
+            defined.add(stmt[1])
+    for name in writes:
+        if name not in plan.reductions:
+            if name not in defined:
+                return plan
+            plan.privates.append(name)
+
+    plan.parallel = True
+    return plan
+
+
+class ReductionResult:
+    """Stands in for the value of a reduction assignment until the parent has folded it."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class IterationWorker(Interpreter):
+    """Runs a range of iterations, logging reduction contributions instead of applying them."""
+
+    def __init__(self, scopes, reductions):
+        super().__init__()
+        self.globals = scopes[0]
+        self.scopes = scopes
+        self.reductions = reductions
+        self.contributions = {name: [] for name in reductions}
+
+    def eval(self, node):
+        if node is not None and node[0] == 'assign' and node[1] in self.reductions and len(node) == 3:
+            self.contributions[node[1]].append(self.eval(node[2][3]))
+            return ReductionResult(node[1])
+        return super().eval(node)
+
+
+def run_iterations(payload):
+    scopes, body, iterations, reductions, privates = payload
+    worker = IterationWorker(scopes, reductions)
+    result = None
+    try:
+        for _ in range(iterations):
+            result = worker.eval_block(body)
+    except Exception:
+        return None
+    finals = {name: worker.get_var(name) for name in privates} if iterations else {}
+    return worker.contributions, finals, result
+
+
+class ParallelInterpreter(Interpreter):
+    """Interpreter that spreads independent 🔂 loops over a process pool.
+
+    Usage:
+        with ParallelInterpreter(workers=8) as interpreter:
+            interpreter.execute(ast)
+    """
+
+    def __init__(self, workers: Optional[int] = None, min_iterations: int = 1000, seed=None):
+        super().__init__(seed)
+        self.workers = workers or os.cpu_count() or 1
+        self.min_iterations = min_iterations
+        self.plans: Dict[int, RepeatPlan] = {}
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.parallel_stats = {'parallel': 0, 'sequential': 0, 'fallback': 0}
+
+    def close(self):
+        if self.pool:
+            self.pool.shutdown()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def eval(self, node):
+        if node is not None and node[0] == 'repeat':
+            return self.eval_repeat(node)
+        return super().eval(node)
+
+    def eval_repeat(self, node):
+        count = self.eval(node[1])
+        if self.can_parallelize(node, count):
+            done, result = self.run_parallel(node, count)
+            if done:
+                self.parallel_stats['parallel'] += 1
+                return result
+            self.parallel_stats['fallback'] += 1
+        else:
+            self.parallel_stats['sequential'] += 1
+        result = None
+        for _ in range(count):
+            result = self.eval_block(node[2])
+        return result
+
+    def can_parallelize(self, node, count) -> bool:
+        if self.workers < 2 or not isinstance(count, int) or count < self.min_iterations:
+            return False
+        plan = self.plans.get(id(node))
+        if plan is None or plan.node is not node:
+            plan = self.plans[id(node)] = analyze_repeat(node)
+        if not plan.parallel:
+            return False
+        # Reduction variables must exist before the loop (the first update reads them)
+        for name in plan.reductions:
+            if not any(name in scope for scope in self.scopes):
+                return False
+        return self.pure_calls(plan.called, set(plan.reductions) | set(plan.privates), set())
+
+    def pure_calls(self, names, loop_writes, visiting) -> bool:
+        """Check that called functions cannot leak state between iterations.
+
+        Functions run in a fresh scope, but assignments go to the innermost
+        scope that already holds the name. So a function may assign its
+        parameters and names that no scope holds when the loop starts (they
+        land in its own scope), and must not touch names the loop writes.
+        """
+        for name in names:
+            if name in visiting:
+                continue
+            visiting.add(name)
+            func = self.globals.get(name)
+            if not (isinstance(func, tuple) and func and func[0] == 'function'):
+                return False
+            params, body = func[1], func[2]
+            called = set()
+            for n in iter_nodes(body):
+                if n[0] in IMPURE_NODES and n[0] != 'return':
+                    return False
+                if n[0] == 'assign' and n[1] not in params:
+                    if n[1] in loop_writes or any(n[1] in scope for scope in self.scopes):
+                        return False
+                if n[0] == 'call':
+                    if n[1][0] != 'var':
+                        return False
+                    called.add(n[1][1])
+            if (reads_of(body) - set(params)) & loop_writes:
+                return False
+            if not self.pure_calls(called, loop_writes, visiting):
+                return False
+        return True
+
+    def run_parallel(self, node, count):
+        plan = self.plans[id(node)]
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        chunks = min(self.workers, count)
+        sizes = [count // chunks + (1 if i < count % chunks else 0) for i in range(chunks)]
+        payloads = [(self.scopes, node[2], size, plan.reductions, plan.privates) for size in sizes]
+        try:
+            outcomes = list(self.pool.map(run_iterations, payloads))
+        except (pickle.PicklingError, TypeError, AttributeError, SyntaxError):
+            # The scopes cannot be sent to the workers (an unpicklable host
+            # value, or a lazy 🎯 body that does not parse): run it here
+            return False, None
+        if any(outcome is None for outcome in outcomes):
+            return False, None
+
+        # Fold contributions in iteration order, then commit
+        totals = {}
+        try:
+            for name, op in plan.reductions.items():
+                values = [v for contributions, _, _ in outcomes for v in contributions[name]]
+                totals[name] = reduce(REDUCTION_OPS[op], values, self.get_var(name))
+        except Exception:
+            return False, None
+        _, finals, result = outcomes[-1]
+        for name, value in totals.items():
+            self.set_var(name, value)
+        for name in plan.privates:
+            self.set_var(name, finals[name])
+        if isinstance(result, ReductionResult):
+            result = totals[result.name]
+        return True, result
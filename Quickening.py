@@ -0,0 +1,146 @@
+# Quickening.py
+#
+# Adaptive, type-specialized evaluation of binop sites, in the spirit of
+# CPython 3.11's quickening. Every ('binop', op, left, right) node gets a
+# BinopSite that watches the operand types it sees. Once a site has seen the
+# same (left type, right type) pair WARMUP times in a row it is quickened:
+# later evaluations check a type guard and call a specialized operator
+# directly, skipping the generic `if op == ...` chain and its try/except.
+# When the guard fails the site deoptimizes, takes the generic path and warms
+# up again (with an exponential backoff so unstable sites settle as generic).
+# Results, including errors, are identical to emoji.Interpreter.
+
+import operator
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from emoji import Interpreter, StringBuilder
+
+WARMUP = 8
+MAX_BACKOFF = 1024
+
+_ARITHMETIC = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv}
+_COMPARISON = {'==': operator.eq, '!=': operator.ne, '<': operator.lt, '>': operator.gt}
+
+
+def _str_add(left: str, right: str):
+    if len(left) >= StringBuilder.MIN_LENGTH:
+        return StringBuilder.concat(left, right)
+    return left + right
+
+
+# (left type, right type, op) -> implementation. Only pairs whose generic
+# result can be computed without any exception handling are listed, and bool
+# is left out on purpose: guards compare exact types.
+SPECIALIZATIONS: Dict[Tuple[type, type, str], Callable[[Any, Any], Any]] = {}
+for _pair in ((int, int), (float, float), (int, float), (float, int)):
+    for _op, _fn in {**_ARITHMETIC, **_COMPARISON}.items():
+        SPECIALIZATIONS[_pair + (_op,)] = _fn
+for _op, _fn in _COMPARISON.items():
+    SPECIALIZATIONS[(str, str, _op)] = _fn
+SPECIALIZATIONS[(str, str, '+')] = _str_add
+SPECIALIZATIONS[(StringBuilder, str, '+')] = StringBuilder.concat
+
+
+class BinopSite:
+    """Adaptive state for one binop node."""
+
+    __slots__ = ('node', 'op', 'left_type', 'right_type', 'impl', 'streak', 'warmup',
+                 'hits', 'misses', 'generic', 'deopts')
+
+    def __init__(self, node: tuple):
+        self.node = node
+        self.op = node[1]
+        self.left_type: Optional[type] = None
+        self.right_type: Optional[type] = None
+        self.impl: Optional[Callable[[Any, Any], Any]] = None
+        self.streak = 0
+        self.warmup = WARMUP
+        self.hits = 0
+        self.misses = 0
+        self.generic = 0
+        self.deopts = 0
+
+    @property
+    def state(self) -> str:
+        if self.impl is None:
+            return 'adaptive'
+        return f"{self.left_type.__name__}/{self.right_type.__name__}"
+
+    def observe(self, left_type: type, right_type: type):
+        """Record an operand type pair seen on the generic path; quicken when stable."""
+        if left_type is self.left_type and right_type is self.right_type:
+            self.streak += 1
+        else:
+            self.left_type, self.right_type, self.streak = left_type, right_type, 1
+        if self.streak >= self.warmup:
+            self.impl = SPECIALIZATIONS.get((left_type, right_type, self.op))
+            if self.impl is None:
+                # Nothing to specialize for this pair; check again after a while
+                self.streak = 0
+                self.warmup = min(self.warmup * 2, MAX_BACKOFF)
+
+    def deoptimize(self):
+        self.impl = None
+        self.streak = 0
+        self.deopts += 1
+        self.warmup = min(self.warmup * 2, MAX_BACKOFF)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'op': self.op,
+            'state': self.state,
+            'specialized_hits': self.hits,
+            'guard_misses': self.misses,
+            'generic': self.generic,
+            'deopts': self.deopts,
+        }
+
+
+class QuickeningInterpreter(Interpreter):
+    """Interpreter whose binop sites specialize themselves on observed operand types.
+
+    Usage:
+        interpreter = QuickeningInterpreter()
+        interpreter.execute(ast)
+        for stats in interpreter.specialization_stats():
+            print(stats)
+    """
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.sites: Dict[int, BinopSite] = {}
+
+    def eval(self, node):
+        if node is not None and node[0] == 'binop':
+            site = self.sites.get(id(node))
+            if site is None or site.node is not node:
+                site = self.sites[id(node)] = BinopSite(node)
+            left_val = self.operand(node[2])
+            right_val = self.operand(node[3])
+            impl = site.impl
+            if impl is not None:
+                if type(left_val) is site.left_type and type(right_val) is site.right_type:
+                    site.hits += 1
+                    return impl(left_val, right_val)
+                site.misses += 1
+                site.deoptimize()
+            site.generic += 1
+            site.observe(type(left_val), type(right_val))
+            return self.apply_binop(site.op, left_val, right_val)
+        return super().eval(node)
+
+    def operand(self, node):
+        # Variables and literals are by far the most common operands; skip
+        # the full eval dispatch for them
+        kind = node[0]
+        if kind == 'var':
+            return self.get_var(node[1])
+        if kind == 'num' or kind == 'str':
+            return node[1]
+        return self.eval(node)
+
+    def specialization_stats(self) -> List[Dict[str, Any]]:
+        """Per-site counters, most-executed sites first."""
+        stats = [site.stats() for site in self.sites.values()]
+        stats.sort(key=lambda s: s['specialized_hits'] + s['generic'], reverse=True)
+        return stats
@@ -0,0 +1,319 @@
+# Replay.py
+#
+# Deterministic record and replay of EmojiScript sessions. A recording run
+# logs every nondeterministic result the program sees to a compact binary
+# trace: each 📝 line (or EOF), each 🎲 draw and each ⏱️ clock reading. A
+# replay run feeds the trace back in the same order, so the session runs
+# again without a terminal and takes exactly the same path, under any engine
+# that reads them through Interpreter.read_line, draw_random and clock
+# (Interpreter, QuickeningInterpreter, LoopOptimizingInterpreter,
+# StackInterpreter, MemoryProfiler).
+#
+# Trace format: b'EMTR', a version byte, then one event per result:
+#
+#   0x01 varint length, UTF-8 bytes    📝 line
+#   0x02                               📝 EOF
+#   0x03 zigzag varint                 🎲 draw
+#   0x04 little-endian float64         ⏱️ reading
+#
+# Replayed ⏱️ blocks print the recorded runtime; the CLI reports the replay's
+# own wall time so engines can be compared on the same session.
+#
+# Usage:
+#     python3 Replay.py record program.emoji session.trace [--seed N]
+#     python3 Replay.py replay program.emoji session.trace [--engine stack]
+
+import struct
+import sys
+from typing import BinaryIO, Tuple, Type
+
+from emoji import Interpreter
+
+MAGIC = b'EMTR'
+VERSION = 1
+
+EVENT_LINE = 1
+EVENT_EOF = 2
+EVENT_DRAW = 3
+EVENT_CLOCK = 4
+EVENT_NAMES = {EVENT_LINE: '📝 line', EVENT_EOF: '📝 EOF', EVENT_DRAW: '🎲 draw', EVENT_CLOCK: '⏱️ reading'}
+
+CLOCK = struct.Struct('<d')
+
+
+class ReplayError(RuntimeError):
+    """The program asked for something other than the trace's next event."""
+
+
+def encode_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class TraceWriter:
+    """Appends events to a binary stream.
+
+    Usage:
+        with TraceWriter(open('session.trace', 'wb')) as trace:
+            RecordingInterpreter(trace).execute(ast)
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.events = 0
+        self.stream.write(MAGIC + bytes([VERSION]))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, event: bytearray):
+        self.stream.write(event)
+        self.events += 1
+
+    def line(self, text: str):
+        data = text.encode('utf-8')
+        event = bytearray([EVENT_LINE])
+        encode_varint(event, len(data))
+        event += data
+        self.write(event)
+
+    def eof(self):
+        self.write(bytearray([EVENT_EOF]))
+
+    def draw(self, value: int):
+        event = bytearray([EVENT_DRAW])
+        encode_varint(event, value * 2 if value >= 0 else -value * 2 - 1)
+        self.write(event)
+
+    def clock(self, reading: float):
+        self.write(bytearray([EVENT_CLOCK]) + CLOCK.pack(reading))
+
+    def flush(self):
+        self.stream.flush()
+
+    def close(self):
+        self.stream.close()
+
+
+class TraceReader:
+    """Hands out the events of a recorded trace in order."""
+
+    def __init__(self, data: bytes):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not an EmojiScript trace")
+        if data[len(MAGIC)] != VERSION:
+            raise ValueError(f"Unsupported trace version {data[len(MAGIC)]}")
+        self.data = data
+        self.offset = len(MAGIC) + 1
+        self.events = 0
+
+    @classmethod
+    def open(cls, path: str) -> 'TraceReader':
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def remaining(self) -> int:
+        """Number of bytes of unread events."""
+        return len(self.data) - self.offset
+
+    def read(self, *kinds: int) -> Tuple[int, object]:
+        """Next event as (kind, value); raises ReplayError unless its kind is one of kinds."""
+        expected = EVENT_NAMES[kinds[0]]
+        if self.offset >= len(self.data):
+            raise ReplayError(f"Replay diverged at event {self.events + 1}: "
+                              f"expected {expected}, but the trace has ended.")
+        kind = self.data[self.offset]
+        if kind not in kinds:
+            found = EVENT_NAMES.get(kind, f"unknown event {kind}")
+            raise ReplayError(f"Replay diverged at event {self.events + 1}: "
+                              f"expected {expected}, but the trace has {found}.")
+        try:
+            value = self.decode(kind)
+        except (IndexError, struct.error, UnicodeDecodeError):
+            raise ReplayError(f"Trace is truncated at event {self.events + 1}.")
+        self.events += 1
+        return kind, value
+
+    def decode(self, kind: int):
+        offset = self.offset + 1
+        value = None
+        if kind == EVENT_CLOCK:
+            value = CLOCK.unpack_from(self.data, offset)[0]
+            offset += CLOCK.size
+        elif kind != EVENT_EOF:
+            number, shift = 0, 0
+            while True:
+                byte = self.data[offset]
+                offset += 1
+                number |= (byte & 0x7F) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+            if kind == EVENT_DRAW:
+                value = number >> 1 if not number & 1 else -((number + 1) >> 1)
+            else:
+                data = self.data[offset:offset + number]
+                if len(data) < number:
+                    raise IndexError("line runs past the end of the trace")
+                value = data.decode('utf-8')
+                offset += number
+        self.offset = offset
+        return value
+
+
+class RecordMixin:
+    """Engine mixin that logs every 📝, 🎲 and ⏱️ result to a TraceWriter."""
+
+    def __init__(self, trace: TraceWriter, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.trace = trace
+
+    def read_line(self, prompt: str) -> str:
+        # The session may be killed while it waits for the user
+        self.trace.flush()
+        try:
+            line = super().read_line(prompt)
+        except EOFError:
+            self.trace.eof()
+            raise
+        self.trace.line(line)
+        return line
+
+    def draw_random(self, lo, hi):
+        value = super().draw_random(lo, hi)
+        self.trace.draw(value)
+        return value
+
+    def clock(self) -> float:
+        reading = super().clock()
+        self.trace.clock(reading)
+        return reading
+
+
+class ReplayMixin:
+    """Engine mixin that answers 📝, 🎲 and ⏱️ from a TraceReader."""
+
+    def __init__(self, trace: TraceReader, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.trace = trace
+
+    def read_line(self, prompt: str) -> str:
+        if prompt:
+            sys.stdout.write(prompt)  # as input() would
+        kind, line = self.trace.read(EVENT_LINE, EVENT_EOF)
+        if kind == EVENT_EOF:
+            raise EOFError("EOF when reading a line")
+        return line
+
+    def draw_random(self, lo, hi):
+        # Still draw, so bad bounds raise exactly as they did while recording
+        super().draw_random(lo, hi)
+        return self.trace.read(EVENT_DRAW)[1]
+
+    def clock(self) -> float:
+        return self.trace.read(EVENT_CLOCK)[1]
+
+
+class RecordingInterpreter(RecordMixin, Interpreter):
+    """Interpreter that records its session.
+
+    Usage:
+        with TraceWriter(open('session.trace', 'wb')) as trace:
+            RecordingInterpreter(trace, seed=None).execute(ast)
+    """
+
+
+class ReplayInterpreter(ReplayMixin, Interpreter):
+    """Interpreter that replays a recorded session.
+
+    Usage:
+        ReplayInterpreter(TraceReader.open('session.trace')).execute(ast)
+    """
+
+
+def recording(engine: Type[Interpreter]) -> Type[Interpreter]:
+    """Subclass of engine that records its session; construct it with (trace, *engine_args)."""
+    return type(f'Recording{engine.__name__}', (RecordMixin, engine), {})
+
+
+def replaying(engine: Type[Interpreter]) -> Type[Interpreter]:
+    """Subclass of engine that replays a trace; construct it with (trace, *engine_args)."""
+    return type(f'Replay{engine.__name__}', (ReplayMixin, engine), {})
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from emoji import Lexer, Parser
+    from LoopOptimizer import LoopOptimizingInterpreter
+    from MemoryProfiler import MemoryProfiler
+    from Quickening import QuickeningInterpreter
+    from StackInterpreter import StackInterpreter
+
+    engines = {
+        'tree': Interpreter,
+        'quickening': QuickeningInterpreter,
+        'loop': LoopOptimizingInterpreter,
+        'stack': StackInterpreter,
+        'profile': MemoryProfiler,
+    }
+    arg_parser = argparse.ArgumentParser(description="Record an EmojiScript session, or replay a recorded one.")
+    arg_parser.add_argument('mode', choices=('record', 'replay'))
+    arg_parser.add_argument('program', help="EmojiScript source file")
+    arg_parser.add_argument('trace', help="trace file to write (record) or read (replay)")
+    arg_parser.add_argument('--engine', choices=engines, default='tree', help="interpreter to run the session on")
+    arg_parser.add_argument('--seed', type=int, default=None, help="seed for 🎲 while recording")
+    args = arg_parser.parse_args()
+
+    def report(error):
+        # Most interpreter errors already start with the prefix
+        message = str(error)
+        print(message if message.startswith('❌') else f"❌ Error: {message}", file=sys.stderr)
+
+    try:
+        with open(args.program, encoding='utf-8') as f:
+            code = f.read()
+        ast = Parser(Lexer(code).tokenize()).parse()
+    except (OSError, SyntaxError) as e:
+        report(e)
+        sys.exit(1)
+    engine = engines[args.engine]
+
+    status = 0
+    try:
+        if args.mode == 'record':
+            with TraceWriter(open(args.trace, 'wb')) as trace:
+                try:
+                    recording(engine)(trace, seed=args.seed).execute(ast)
+                finally:
+                    print(f"\n📼 Recorded {trace.events} events to {args.trace}", file=sys.stderr)
+        else:
+            trace = TraceReader.open(args.trace)
+            interpreter = replaying(engine)(trace)
+            start = time.perf_counter()
+            try:
+                if args.engine == 'profile':
+                    interpreter.profile(code)
+                else:
+                    interpreter.execute(ast)
+            finally:
+                elapsed = time.perf_counter() - start
+                print(f"\n📼 Replayed {trace.events} events on {args.engine} in {elapsed:.4f} seconds",
+                      file=sys.stderr)
+                if trace.remaining():
+                    print(f"⚠️  {trace.remaining()} bytes of the trace were not used", file=sys.stderr)
+            if args.engine == 'profile':
+                print(interpreter.report())
+    except EOFError:
+        # The session ended on 📝 EOF, as the recorded one did
+        print("\n⚠️ Input ended (EOF). Exiting.")
+    except Exception as e:
+        report(e)
+        status = 1
+    sys.exit(status)
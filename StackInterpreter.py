@@ -0,0 +1,244 @@
+# StackInterpreter.py
+#
+# Evaluator that never recurses on the Python stack. Nodes are evaluated by
+# a loop over an explicit work stack of small instruction tuples, with a
+# separate value stack for intermediate results, and every 🎯 call gets a
+# CallFrame (__slots__) recording the stack heights to unwind to on ⬅️.
+# Deeply nested blocks and expressions and deeply recursive functions run
+# without RecursionError, and each call level costs a CallFrame and a scope
+# dict instead of a chain of Python frames.
+#
+# Every operation goes through the same Interpreter helpers (get_var,
+# assign, apply_binop, draw_random, print_value, ...), so results and error
+# messages are identical to emoji.Interpreter.
+
+from typing import Any, List
+
+from emoji import Builtin, Interpreter, LazyBody, ReturnException, flatten
+
+# Opcodes (instruction tuples are (opcode, ...))
+EVAL = 0
+NEXT = 1          # (NEXT, statements, index): run statements[index:]
+BINOP = 2
+UNOP = 3
+AND = 4
+OR = 5
+NOT = 6
+ASSIGN = 7
+IF = 8
+WHILE_TEST = 9
+WHILE_LOOP = 10
+REPEAT_START = 11
+REPEAT_NEXT = 12
+RANGE = 13
+RANDOM = 14
+CALL = 15
+END_CALL = 16
+PRINT = 17
+RETURN = 18
+
+_DONE = object()
+
+
+class CallFrame:
+    """Bookkeeping for one active 🎯 call."""
+
+    __slots__ = ('work_depth', 'value_depth')
+
+    def __init__(self, work_depth: int, value_depth: int):
+        self.work_depth = work_depth
+        self.value_depth = value_depth
+
+
+class StackInterpreter(Interpreter):
+    """Interpreter whose eval runs on explicit work and value stacks.
+
+    Usage:
+        StackInterpreter().execute(ast)
+    """
+
+    def eval(self, node):
+        return self.run([(EVAL, node)], [])
+
+    def eval_block(self, statements):
+        return self.run([(NEXT, statements, 0)], [None])
+
+    def run(self, work: List[tuple], values: List[Any]):
+        frames: List[CallFrame] = []
+        base_scopes = len(self.scopes)
+        step = self.step
+        try:
+            while work:
+                step(work.pop(), work, values, frames)
+        except BaseException:
+            # Calls pop their scope on the way out, as call_function's finally does
+            del self.scopes[base_scopes:]
+            raise
+        return values.pop()
+
+    def step(self, instruction, work, values, frames):
+        op = instruction[0]
+        if op == EVAL:
+            self.push_eval(instruction[1], work, values)
+        elif op == NEXT:
+            _, statements, index = instruction
+            if index < len(statements):
+                values.pop()
+                work.append((NEXT, statements, index + 1))
+                work.append((EVAL, statements[index]))
+        elif op == BINOP:
+            right_val = values.pop()
+            values.append(self.apply_binop(instruction[1], values.pop(), right_val))
+        elif op == ASSIGN:
+            values.append(self.assign(instruction[1], values.pop()))
+        elif op == IF:
+            node = instruction[1]
+            if values.pop():
+                self.push_block(node[2], work, values)
+            elif node[3]:
+                self.push_block(node[3], work, values)
+            else:
+                values.append(None)
+        elif op == WHILE_TEST:
+            node = instruction[1]
+            if values.pop():
+                values.pop()
+                work.append((WHILE_LOOP, node))
+                self.push_block(node[2], work, values)
+        elif op == WHILE_LOOP:
+            node = instruction[1]
+            work.append((WHILE_TEST, node))
+            work.append((EVAL, node[1]))
+        elif op == REPEAT_START:
+            iterations = iter(range(flatten(values.pop())))
+            values.append(None)
+            work.append((REPEAT_NEXT, instruction[1], iterations))
+        elif op == REPEAT_NEXT:
+            if next(instruction[2], _DONE) is not _DONE:
+                values.pop()
+                work.append(instruction)
+                self.push_block(instruction[1][2], work, values)
+        elif op == AND:
+            if not values.pop():
+                values.append(False)
+            else:
+                work.append((EVAL, instruction[1][2]))
+        elif op == OR:
+            if values.pop():
+                values.append(True)
+            else:
+                work.append((EVAL, instruction[1][2]))
+        elif op == NOT:
+            values.append(not values.pop())
+        elif op == UNOP:
+            values.append(self.apply_unop(instruction[1], values.pop()))
+        elif op == CALL:
+            count = instruction[1]
+            args = values[len(values) - count:]
+            del values[len(values) - count:]
+            func = values.pop()
+            if type(func) is Builtin:
+                values.append(func(args))
+                return
+            if func[0] != 'function':
+                raise RuntimeError("Not a function")
+            params, body = func[1], func[2]
+            if len(args) != len(params):
+                raise RuntimeError(f"Expected {len(params)} arguments, got {len(args)}")
+            if type(body) is LazyBody:
+                body = body.parse()
+            self.scopes.append(dict(zip(params, args)))
+            frames.append(CallFrame(len(work), len(values)))
+            work.append((END_CALL,))
+            self.push_block(body, work, values)
+        elif op == END_CALL:
+            # Body finished without ⬅️
+            frames.pop()
+            self.scopes.pop()
+            values[-1] = None
+        elif op == RETURN:
+            value = values.pop()
+            if not frames:
+                raise ReturnException(value)
+            frame = frames.pop()
+            del work[frame.work_depth:]
+            del values[frame.value_depth:]
+            self.scopes.pop()
+            values.append(value)
+        elif op == PRINT:
+            self.print_value(values.pop())
+            values.append(None)
+        elif op == RANGE:
+            end = values.pop()
+            start = values.pop()
+            values.append(list(range(start, end + 1)))
+        elif op == RANDOM:
+            hi = values.pop()
+            values.append(self.draw_random(values.pop(), hi))
+
+    def push_block(self, statements, work, values):
+        values.append(None)
+        work.append((NEXT, statements, 0))
+
+    def push_eval(self, node, work, values):
+        """Schedule node: push its instruction, then its operands (last operand first)."""
+        if node is None:
+            values.append(None)
+            return
+        kind = node[0]
+        if kind == 'num' or kind == 'str' or kind == 'bool':
+            values.append(node[1])
+        elif kind == 'var':
+            values.append(self.get_var(node[1]))
+        elif kind == 'binop':
+            work.append((BINOP, node[1]))
+            work.append((EVAL, node[3]))
+            work.append((EVAL, node[2]))
+        elif kind == 'assign':
+            work.append((ASSIGN, node))
+            work.append((EVAL, node[2]))
+        elif kind == 'if':
+            work.append((IF, node))
+            work.append((EVAL, node[1]))
+        elif kind == 'while':
+            values.append(None)
+            work.append((WHILE_TEST, node))
+            work.append((EVAL, node[1]))
+        elif kind == 'repeat':
+            work.append((REPEAT_START, node))
+            work.append((EVAL, node[1]))
+        elif kind == 'and':
+            work.append((AND, node))
+            work.append((EVAL, node[1]))
+        elif kind == 'or':
+            work.append((OR, node))
+            work.append((EVAL, node[1]))
+        elif kind == 'not':
+            work.append((NOT,))
+            work.append((EVAL, node[1]))
+        elif kind == 'unop':
+            work.append((UNOP, node[1]))
+            work.append((EVAL, node[2]))
+        elif kind == 'call':
+            work.append((CALL, len(node[2])))
+            for arg in reversed(node[2]):
+                work.append((EVAL, arg))
+            work.append((EVAL, node[1]))
+        elif kind == 'print':
+            work.append((PRINT,))
+            work.append((EVAL, node[1]))
+        elif kind == 'return':
+            work.append((RETURN,))
+            work.append((EVAL, node[1]))
+        elif kind == 'range':
+            work.append((RANGE,))
+            work.append((EVAL, node[2]))
+            work.append((EVAL, node[1]))
+        elif kind == 'random':
+            work.append((RANDOM,))
+            work.append((EVAL, node[2]))
+            work.append((EVAL, node[1]))
+        else:
+            # timer, input, def and unknown kinds have no nested evaluation
+            # (input's prompt is a string literal)
+            values.append(super().eval(node))
@@ -0,0 +1,187 @@
+# Suspendable.py
+#
+# Interpreter mode that never blocks on 📝. SuspendableInterpreter.run(ast)
+# is a generator: when the program reaches 📝 it yields an InputRequest and
+# is resumed with the user's answer via send(), so any number of sessions can
+# be driven from one thread or one asyncio event loop (run_async).
+#
+# Only statements that can reach 📝 (they contain an input or a function call)
+# are evaluated as generators; everything else goes through the ordinary
+# Interpreter.eval, so straight-line code runs at normal speed.
+
+from typing import Any, Awaitable, Callable, Dict, Generator, Optional, Tuple
+
+from emoji import Builtin, Interpreter, LazyBody, ReturnException, flatten
+from ParallelRepeat import iter_nodes
+
+# Kinds that may suspend: 📝 itself, and calls whose body might reach it
+SUSPENDING_NODES = {'input', 'call'}
+
+
+class InputRequest:
+    """Yielded by SuspendableInterpreter.run when the program waits for 📝."""
+
+    __slots__ = ('prompt',)
+
+    def __init__(self, prompt: str):
+        self.prompt = prompt
+
+    def __repr__(self):
+        return f"InputRequest({self.prompt!r})"
+
+
+class SuspendableInterpreter(Interpreter):
+    """Interpreter that suspends at 📝 instead of calling input().
+
+    Usage:
+        session = SuspendableInterpreter(output=lines.append)
+        run = session.run(ast)
+        request = next(run)              # InputRequest(prompt)
+        request = run.send('7')          # resume with the answer
+        ...                              # StopIteration.value is the result
+
+    Sending None ends the input stream, like EOF on stdin (EOFError).
+    """
+
+    def __init__(self, seed=None, output: Optional[Callable[[Any], None]] = None):
+        super().__init__(seed)
+        self.output = output
+        self.suspends: Dict[int, Tuple[tuple, bool]] = {}
+
+    def emit(self, text):
+        if self.output is None:
+            super().emit(text)
+        else:
+            self.output(text)
+
+    def may_suspend(self, node) -> bool:
+        if node is None:
+            return False
+        cached = self.suspends.get(id(node))
+        if cached is None or cached[0] is not node:
+            # A 🎯 definition never runs its body (and a lazy body stays unparsed)
+            suspends = any(n[0] in SUSPENDING_NODES for n in iter_nodes(node, prune={'def'}))
+            cached = self.suspends[id(node)] = (node, suspends)
+        return cached[1]
+
+    def run(self, ast) -> Generator[InputRequest, Optional[str], Any]:
+        result = None
+        try:
+            for statement in ast:
+                result = yield from self.resume(statement)
+        finally:
+            self.flatten_globals()
+        return flatten(result)
+
+    async def run_async(self, ast, ask: Callable[[str], Awaitable[Optional[str]]]):
+        """Run on an event loop; ask(prompt) is awaited for every 📝."""
+        steps = self.run(ast)
+        answer = None
+        try:
+            while True:
+                request = steps.send(answer)
+                answer = await ask(request.prompt)
+        except StopIteration as stop:
+            return stop.value
+
+    def resume_block(self, statements):
+        result = None
+        for stmt in statements:
+            result = yield from self.resume(stmt)
+        return result
+
+    def resume(self, node):
+        """Generator counterpart of Interpreter.eval for nodes that may reach 📝."""
+        if not self.may_suspend(node):
+            return self.eval(node)
+        kind = node[0]
+        if kind == 'input':
+            answer = yield InputRequest(self.input_prompt(node[1]))
+            if answer is None:
+                raise EOFError("input ended")
+            return self.convert_input(answer)
+        elif kind == 'assign':
+            value = yield from self.resume(node[2])
+            return self.assign(node, value)
+        elif kind == 'binop':
+            left_val = yield from self.resume(node[2])
+            right_val = yield from self.resume(node[3])
+            return self.apply_binop(node[1], left_val, right_val)
+        elif kind == 'unop':
+            val = yield from self.resume(node[2])
+            return self.apply_unop(node[1], val)
+        elif kind == 'and':
+            left = yield from self.resume(node[1])
+            if not left:
+                return False
+            return (yield from self.resume(node[2]))
+        elif kind == 'or':
+            left = yield from self.resume(node[1])
+            if left:
+                return True
+            return (yield from self.resume(node[2]))
+        elif kind == 'not':
+            return not (yield from self.resume(node[1]))
+        elif kind == 'if':
+            condition = yield from self.resume(node[1])
+            if condition:
+                return (yield from self.resume_block(node[2]))
+            elif node[3]:
+                return (yield from self.resume_block(node[3]))
+            return None
+        elif kind == 'while':
+            result = None
+            while (yield from self.resume(node[1])):
+                result = yield from self.resume_block(node[2])
+            return result
+        elif kind == 'repeat':
+            count = yield from self.resume(node[1])
+            result = None
+            for _ in range(count):
+                result = yield from self.resume_block(node[2])
+            return result
+        elif kind == 'range':
+            start = yield from self.resume(node[1])
+            end = yield from self.resume(node[2])
+            return list(range(start, end + 1))
+        elif kind == 'random':
+            lo = yield from self.resume(node[1])
+            hi = yield from self.resume(node[2])
+            return self.draw_random(lo, hi)
+        elif kind == 'call':
+            func = yield from self.resume(node[1])
+            args = []
+            for arg in node[2]:
+                args.append((yield from self.resume(arg)))
+            return (yield from self.resume_call(func, args))
+        elif kind == 'print':
+            value = yield from self.resume(node[1])
+            self.print_value(value)
+            return None
+        elif kind == 'return':
+            value = yield from self.resume(node[1])
+            raise ReturnException(value)
+        # 🎯 definitions do not run their body
+        return self.eval(node)
+
+    def resume_call(self, func, args):
+        if type(func) is Builtin:
+            return func(args)
+        if func[0] != 'function':
+            raise RuntimeError("Not a function")
+
+        params, body = func[1], func[2]
+        if len(args) != len(params):
+            raise RuntimeError(f"Expected {len(params)} arguments, got {len(args)}")
+        if type(body) is LazyBody:
+            body = body.parse()
+
+        self.scopes.append(dict(zip(params, args)))
+        try:
+            yield from self.resume_block(body)
+            result = None
+        except ReturnException as e:
+            result = e.value
+        finally:
+            self.scopes.pop()
+        return result
@@ -0,0 +1,321 @@
+# Zygote.py
+#
+# Pre-forking launcher for short EmojiScript runs (Linux only). A warm server
+# process imports the interpreter once, builds an Interpreter (keyword and
+# translation tables included) and keeps a cache of compiled programs, keyed
+# by path and validated by (mtime, size). Each client connects over a Unix
+# socket and passes its stdin, stdout and stderr file descriptors; the server
+# parses the program (or reuses the cached AST, plus the 📚 modules it
+# imports), forks, and the child runs it on the client's descriptors. The
+# client gets the child's pid, forwards Ctrl-C / SIGTERM to it, and exits with
+# the child's exit status.
+#
+# The client path only imports the standard library, so a launch costs a bare
+# Python start plus a fork instead of importing and warming the interpreter.
+#
+# Usage:
+#     python3 Zygote.py serve [--socket PATH] [--preload program.emoji ...]
+#     python3 Zygote.py run program.emoji [--socket PATH] [--seed N]
+#     python3 Zygote.py exec program.emoji [--seed N]     (cold start, no server)
+
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+DEFAULT_SOCKET = os.path.join(os.environ.get('XDG_RUNTIME_DIR') or '/tmp', f'emojiscript-{os.getuid()}.sock')
+
+# Server -> client messages: the child's pid, then its exit status
+STATUS = struct.Struct('!i')
+PEERCRED = struct.Struct('3i')
+
+# The server lives long and sees many versions of many programs: past this
+# many names, the symbol table is cleared (cached ASTs keep their names)
+MAX_SYMBOLS = 1 << 16
+
+
+class ProgramCache:
+    """Compiled programs keyed by absolute path, reused while (mtime, size) is unchanged."""
+
+    def __init__(self):
+        self.programs: Dict[str, Tuple[Tuple[int, int], list]] = {}
+        self.hits = 0
+        self.compiles = 0
+
+    def load(self, path: str) -> list:
+        from emoji import SYMBOLS, Lexer, Parser
+
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self.programs.get(path)
+        if cached is not None and cached[0] == stamp:
+            self.hits += 1
+            return cached[1]
+        with open(path, encoding='utf-8') as f:
+            ast = Parser(Lexer(f.read()).tokenize()).parse()
+        self.programs[path] = (stamp, ast)
+        self.compiles += 1
+        if len(SYMBOLS) > MAX_SYMBOLS:
+            SYMBOLS.clear()
+        return ast
+
+    def warm_imports(self, ast: list, cwd: str):
+        """Compile the modules a program imports at top level into emoji.MODULES."""
+        from emoji import MODULES
+
+        for statement in ast:
+            if statement[0] == 'import':
+                try:
+                    MODULES.definitions(os.path.join(cwd, statement[1]))
+                except Exception:
+                    pass  # The run reports it
+
+
+def parse_request(message: bytes) -> Dict[str, Any]:
+    """Decode a client request, checking its shape; raises ValueError."""
+    request = json.loads(message)
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+    for key in ('program', 'cwd'):
+        if not isinstance(request.get(key), str):
+            raise ValueError(f"request needs a string '{key}'")
+    seed = request.get('seed')
+    if seed is not None and type(seed) is not int:
+        raise ValueError("'seed' must be an integer or null")
+    return request
+
+
+def run_program(program, interpreter) -> int:
+    """Run an AST (or report the exception that stopped it loading); returns the exit status."""
+    try:
+        if isinstance(program, Exception):
+            raise program
+        interpreter.execute(program)
+    except EOFError:
+        print("\n⚠️ Input ended (EOF). Exiting.")
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+class ZygoteServer:
+    """Forks a warm child per request; see the module comment.
+
+    Usage:
+        ZygoteServer('/tmp/emoji.sock').serve_forever()
+    """
+
+    def __init__(self, path: str = DEFAULT_SOCKET, preload: Sequence[str] = ()):
+        import selectors
+
+        from emoji import Interpreter
+
+        self.path = path
+        self.cache = ProgramCache()
+        # Built once; every child gets its own copy-on-write copy
+        self.interpreter = Interpreter()
+        for program in preload:
+            self.cache.warm_imports(self.cache.load(program), os.path.dirname(os.path.abspath(program)))
+        self.selector = selectors.DefaultSelector()
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        self.launches = 0
+
+    def serve_forever(self):
+        import selectors
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        # Whoever can connect can run programs as us: owner only
+        umask = os.umask(0o177)
+        try:
+            self.listener.bind(self.path)
+        finally:
+            os.umask(umask)
+        self.listener.listen(64)
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        try:
+            while True:
+                for key, _ in self.selector.select():
+                    if key.data is None:
+                        self.accept()
+                    else:
+                        self.reap(key.fileobj, *key.data)
+        finally:
+            self.close()
+
+    def close(self):
+        self.selector.close()
+        self.listener.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def accept(self):
+        import selectors
+
+        conn, _ = self.listener.accept()
+        fds: list = []
+        try:
+            _, uid, _ = PEERCRED.unpack(conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, PEERCRED.size))
+            if uid != os.getuid():
+                raise PermissionError(f"client uid {uid}")
+            conn.settimeout(5)
+            message, fds, _, _ = socket.recv_fds(conn, 65536, 3)
+            if len(fds) != 3:
+                raise ValueError("expected stdin, stdout and stderr")
+            request = parse_request(message)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"⚠️  Rejected request: {e}", file=sys.stderr)
+            for fd in fds:
+                os.close(fd)
+            conn.close()
+            return
+
+        program: Any
+        try:
+            program = self.cache.load(request['program'])
+            self.cache.warm_imports(program, request['cwd'])
+        except Exception as e:
+            # Reported by the child, like any other error in the program
+            program = e
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            pid = os.fork()
+        except OSError as e:
+            print(f"⚠️  Cannot fork: {e}", file=sys.stderr)
+            pid = -1
+        if pid == 0:
+            self.run_child(conn, fds, request, program)
+        for fd in fds:
+            os.close(fd)
+        if pid < 0:
+            conn.close()
+            return
+        self.launches += 1
+        try:
+            conn.send(STATUS.pack(pid))
+        except OSError:
+            pass  # Client went away; still reap the child
+        pidfd = os.pidfd_open(pid)
+        self.selector.register(pidfd, selectors.EVENT_READ, (pid, conn))
+
+    def reap(self, pidfd: int, pid: int, conn: socket.socket):
+        self.selector.unregister(pidfd)
+        os.close(pidfd)
+        _, status = os.waitpid(pid, 0)
+        try:
+            conn.send(STATUS.pack(os.waitstatus_to_exitcode(status)))
+        except OSError:
+            pass  # Client went away
+        conn.close()
+
+    def run_child(self, conn: socket.socket, fds: Sequence[int], request: Dict[str, Any], program):
+        from emoji import RandomSource
+
+        status = 1
+        try:
+            # Other clients' connections and the listener belong to the server
+            for key in list(self.selector.get_map().values()):
+                if key.data is not None:
+                    key.data[1].close()
+            self.selector.close()
+            self.listener.close()
+            conn.close()
+            # The server may run with SIGINT ignored (started in the background)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            for target, fd in enumerate(fds):
+                os.dup2(fd, target)
+                os.close(fd)
+            sys.stdin = open(0, encoding='utf-8', closefd=False)
+            sys.stdout = open(1, 'w', encoding='utf-8', closefd=False, buffering=1 if os.isatty(1) else -1)
+            sys.stderr = open(2, 'w', encoding='utf-8', closefd=False, buffering=1)
+            os.chdir(request['cwd'])
+            # The parent's generator state is shared by every fork; reseed
+            self.interpreter.random = RandomSource(request.get('seed'))
+            status = run_program(program, self.interpreter)
+        except KeyboardInterrupt:
+            status = 128 + signal.SIGINT
+        except Exception as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(status)
+
+
+def launch(program: str, path: str = DEFAULT_SOCKET, seed: Optional[int] = None,
+           fds: Sequence[int] = (0, 1, 2)) -> int:
+    """Run program in a child of the server at path on fds; returns its exit status."""
+    request = json.dumps({'program': os.path.abspath(program), 'cwd': os.getcwd(), 'seed': seed})
+    with socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET) as sock:
+        sock.connect(path)
+        socket.send_fds(sock, [request.encode('utf-8')], list(fds))
+        reply = sock.recv(STATUS.size)
+        if not reply:
+            raise ConnectionError("Zygote server closed the connection")
+        pid = STATUS.unpack(reply)[0]
+
+        def forward(signum, frame):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+        previous = {signum: signal.signal(signum, forward) for signum in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            reply = sock.recv(STATUS.size)
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+    if not reply:
+        raise ConnectionError("Zygote server closed the connection")
+    status = STATUS.unpack(reply)[0]
+    # Killed by a signal: report it the way a shell would
+    return 128 - status if status < 0 else status
+
+
+if __name__ == "__main__":
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Run EmojiScript programs from a pre-forked, warm server.")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help="start the server")
+    serve.add_argument('--socket', default=DEFAULT_SOCKET, help="Unix socket path")
+    serve.add_argument('--preload', nargs='*', default=[], metavar='PROGRAM', help="programs to compile up front")
+    run = commands.add_parser('run', help="run a program through the server")
+    run.add_argument('program', help="EmojiScript source file")
+    run.add_argument('--socket', default=DEFAULT_SOCKET, help="Unix socket path")
+    run.add_argument('--seed', type=int, default=None, help="seed for 🎲")
+    cold = commands.add_parser('exec', help="run a program in this process (cold start)")
+    cold.add_argument('program', help="EmojiScript source file")
+    cold.add_argument('--seed', type=int, default=None, help="seed for 🎲")
+    args = arg_parser.parse_args()
+
+    if args.command == 'serve':
+        # Exit through serve_forever's cleanup, which removes the socket
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            ZygoteServer(args.socket, args.preload).serve_forever()
+        except KeyboardInterrupt:
+            pass
+    elif args.command == 'run':
+        try:
+            sys.exit(launch(args.program, args.socket, args.seed))
+        except (ConnectionError, FileNotFoundError) as e:
+            print(f"❌ Error: Zygote server at {args.socket} is not available: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        from emoji import Interpreter
+        try:
+            program: Any = ProgramCache().load(args.program)
+        except (OSError, SyntaxError) as e:
+            program = e
+        sys.exit(run_program(program, Interpreter(seed=args.seed)))
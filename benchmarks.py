@@ -0,0 +1,659 @@
+"""
+EmojiScript benchmarks
+
+Run all benchmarks:     python3 benchmarks.py
+Run selected ones:      python3 benchmarks.py incremental
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from emoji import Lexer, Parser
+
+BENCHMARKS = {}
+
+
+def benchmark(fn):
+    BENCHMARKS[fn.__name__[len('bench_'):]] = fn
+    return fn
+
+
+def timed(fn, *args, repeat: int = 3) -> float:
+    """Best-of-repeat wall time of fn(*args) in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        began = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - began)
+    return best
+
+
+def generate_program(blocks: int) -> str:
+    """Generate a large, valid EmojiScript program made of repeated loop blocks."""
+    lines = ['📦 🔵 ➡️ 0️⃣']
+    for i in range(blocks):
+        lines.append(f'📦 v{i} ➡️ {i}')
+        lines.append('🔂 3️⃣ 👉')
+        lines.append(f'    ❓ v{i} ⬆️ 5️⃣ 👉')
+        lines.append(f'        🔵 ➡️ 🔵 ➕ v{i}    💭 accumulate')
+        lines.append('    ❔ 👉')
+        lines.append('        🔵 ➡️ 🔵 ➖ 1️⃣')
+        lines.append('    🔚')
+        lines.append('🔚')
+    lines.append('🖨️ 🔵')
+    return '\n'.join(lines) + '\n'
+
+
+def peak_memory(fn, *args) -> int:
+    """Peak traced allocation in bytes while running fn(*args)."""
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def full_parse(code: str):
+    return Parser(Lexer(code).tokenize()).parse()
+
+
+@benchmark
+def bench_incremental():
+    from IncrementalParser import IncrementalParser
+
+    rng = random.Random(0)
+    for blocks in (100, 1000, 5000):
+        code = generate_program(blocks)
+        front = IncrementalParser(code)
+        full_time = timed(full_parse, code, repeat=1)
+        for _ in range(200):
+            # Type one character into a random accumulate line, then delete it
+            pos = front.code.find('💭 accumulate', rng.randrange(len(front.code)))
+            if pos == -1:
+                continue
+            front.apply_edit(pos, pos, '1')
+            front.apply_edit(pos, pos + 1, '')
+        stats = front.latency_stats()
+        print(f"incremental  lines={code.count(chr(10)):>6}  full re-parse={full_time * 1000:9.2f} ms  "
+              f"edit p50={stats['p50'] * 1000:7.3f} ms  p99={stats['p99'] * 1000:7.3f} ms  "
+              f"speedup(p50)={full_time / stats['p50']:8.1f}x")
+
+
+@benchmark
+def bench_mmap_lexer():
+    from MmapLexer import MmapLexer
+
+    def lex_text(path):
+        with open(path, encoding='utf-8') as f:
+            return Lexer(f.read()).tokenize()
+
+    def lex_mmap(path):
+        with MmapLexer.open(path) as lexer:
+            return lexer.tokenize()
+
+    cases = [(f'blocks={n}', generate_program(n)) for n in (500, 2000, 8000)]
+    long_string = 'x' * 200_000
+    cases.append(('long strings', ''.join(f'📦 s{i} ➡️ "{long_string}"\n' for i in range(10))))
+    for label, code in cases:
+        with tempfile.NamedTemporaryFile('w', suffix='.emoji', delete=False, encoding='utf-8') as f:
+            f.write(code)
+        try:
+            size = os.path.getsize(f.name)
+            text_time, mmap_time = timed(lex_text, f.name, repeat=1), timed(lex_mmap, f.name, repeat=1)
+            text_mem, mmap_mem = peak_memory(lex_text, f.name), peak_memory(lex_mmap, f.name)
+        finally:
+            os.unlink(f.name)
+        print(f"mmap lexer  {label:>14}  {size / 1e6:6.2f} MB  "
+              f"str: {text_time * 1000:9.1f} ms {text_mem / 1e6:7.1f} MB peak  "
+              f"mmap: {mmap_time * 1000:8.1f} ms {mmap_mem / 1e6:7.1f} MB peak")
+
+
+@benchmark
+def bench_iterative_parser():
+    from IterativeParser import IterativeParser
+    from MmapLexer import MmapLexer
+
+    def parse_with(parser_cls, tokens):
+        try:
+            parser_cls(tokens).parse()
+            return 'ok'
+        except RecursionError:
+            return 'RecursionError'
+
+    cases = {
+        'typical': generate_program(2_000),
+        'long chain': '🖨️ ' + ' ➕ '.join(['1'] * 50_000),
+        'nested parens': '🖨️ ' + '(' * 5_000 + '1' + ')' * 5_000,
+        'nested 🚫': '🖨️ ' + '🚫 ' * 20_000 + '✅',
+        'nested ➖': '🖨️ ' + '➖ ' * 20_000 + '1',
+        'nested ❓': '❓ ✅ 👉\n' * 5_000 + '🖨️ 1\n' + '🔚\n' * 5_000,
+        'nested 🔁': '🔁 ❌ 👉\n' * 5_000 + '🖨️ 1\n' + '🔚\n' * 5_000,
+        'deep calls': '🖨️ ' + 'f(' * 5_000 + '1' + ')' * 5_000,
+    }
+    for label, code in cases.items():
+        tokens = MmapLexer(code.encode('utf-8')).tokenize()
+        results = []
+        for parser_cls in (Parser, IterativeParser):
+            began = time.perf_counter()
+            status = parse_with(parser_cls, tokens)
+            results.append(f"{(time.perf_counter() - began) * 1000:8.1f} ms {status:<14}")
+        print(f"iterative parser  {label:<14} recursive: {results[0]}  iterative: {results[1]}")
+
+
+@benchmark
+def bench_parallel_lexer():
+    from ParallelLexer import ParallelLexer
+
+    code = generate_program(8_000)
+    serial = timed(lambda: Lexer(code).tokenize(), repeat=1)
+    print(f"parallel lexer  {len(code.encode('utf-8')) / 1e6:.2f} MB  cores available={os.cpu_count()}")
+    print(f"parallel lexer  serial          {serial * 1000:8.1f} ms")
+    for workers in (1, 2, 4, 8, 16):
+        if workers > 2 * (os.cpu_count() or 1):
+            break
+        elapsed = timed(lambda: ParallelLexer(code, workers=workers).tokenize(), repeat=1)
+        print(f"parallel lexer  workers={workers:<3}     {elapsed * 1000:8.1f} ms  speedup={serial / elapsed:5.2f}x")
+
+
+@benchmark
+def bench_parallel_repeat():
+    from emoji import Interpreter
+    from ParallelRepeat import ParallelInterpreter
+
+    code = """
+🎯 work 📥 n 👉
+    📦 k ➡️ 0
+    📦 acc ➡️ 0
+    🔁 k ⬇️ 50 👉
+        acc ➡️ acc ➕ n ✖️ k
+        k ➡️ k ➕ 1
+    🔚
+    ⬅️ acc
+🔚
+📦 total ➡️ 0
+📦 i ➡️ 0
+🔂 4000 👉
+    i ➡️ 3
+    total ➡️ total ➕ work(i)
+🔚
+"""
+    ast = full_parse(code)
+    serial = timed(lambda: Interpreter().execute(ast), repeat=1)
+    print(f"parallel repeat  sequential      {serial * 1000:8.1f} ms  cores available={os.cpu_count()}")
+    for workers in (2, 4, 8, 16):
+        if workers > 2 * (os.cpu_count() or 1):
+            break
+        with ParallelInterpreter(workers=workers) as interpreter:
+            elapsed = timed(lambda: interpreter.execute(ast), repeat=1)
+        print(f"parallel repeat  workers={workers:<3}     {elapsed * 1000:8.1f} ms  speedup={serial / elapsed:5.2f}x")
+
+
+def retained_memory(fn, *args):
+    """(result, bytes still allocated by fn(*args) once it has returned)."""
+    tracemalloc.start()
+    try:
+        result = fn(*args)
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+@benchmark
+def bench_ast_arena():
+    from ASTArena import ArenaParser, ASTArena
+    from MmapLexer import MmapLexer
+
+    for blocks in (1_000, 10_000, 40_000):
+        tokens = MmapLexer(generate_program(blocks).encode('utf-8')).tokenize()
+        for token in tokens:
+            token.value  # decode once so both parsers see the same token state
+        ast, tuple_bytes = retained_memory(lambda: Parser(tokens).parse())
+        arena, arena_bytes = retained_memory(lambda: ArenaParser(tokens).parse_arena())
+        nodes = len(arena)
+        tuple_time = timed(lambda: Parser(tokens).parse(), repeat=1)
+        arena_time = timed(lambda: ArenaParser(tokens).parse_arena(), repeat=1)
+        data = arena.to_bytes()
+        load_time = timed(lambda: ASTArena.from_bytes(data), repeat=1)
+        print(f"ast arena  nodes={nodes:>8}  tuples: {tuple_bytes / nodes:6.1f} B/node {tuple_time * 1000:8.1f} ms parse  "
+              f"arena: {arena_bytes / nodes:6.1f} B/node {arena_time * 1000:8.1f} ms parse  "
+              f"{len(data) / nodes:5.1f} B/node serialized, {load_time * 1000:6.1f} ms load")
+        del ast, arena
+
+
+@benchmark
+def bench_random():
+    from emoji import Interpreter, RandomSource
+
+    draws = 200_000
+    source = RandomSource(seed=0)
+    shared = timed(lambda: [random.randint(1, 6) for _ in range(draws)])
+    batched = timed(lambda: [source.randint(1, 6) for _ in range(draws)])
+    print(f"random     {draws} draws  random.randint: {shared * 1000:7.1f} ms  "
+          f"RandomSource: {batched * 1000:7.1f} ms  ({shared / batched:.1f}x)")
+
+    code = '📦 🔵 ➡️ 0️⃣\n🔂 50000 👉\n    🔵 ➡️ 🔵 ➕ 🎲 1️⃣ 6️⃣\n🔚\n'
+    ast = Parser(Lexer(code).tokenize()).parse()
+    totals = []
+    for _ in range(2):
+        interpreter = Interpreter(seed=42)
+        interpreter.execute(ast)
+        totals.append(interpreter.get_var('🔵'))
+    elapsed = timed(lambda: Interpreter(seed=42).execute(ast))
+    print(f"random     50000 🎲 in a 🔂 loop: {elapsed * 1000:7.1f} ms, "
+          f"seed 42 totals {totals[0]} / {totals[1]} ({'reproducible' if totals[0] == totals[1] else 'MISMATCH'})")
+
+
+@benchmark
+def bench_string_builder():
+    from emoji import Interpreter, StringBuilder
+
+    for appends in (25_000, 50_000, 100_000):
+        code = f'📦 📜 ➡️ ""\n🔂 {appends} 👉\n    📜 ➡️ 📜 ➕ "line of output "\n🔚\n'
+        ast = Parser(Lexer(code).tokenize()).parse()
+        built = timed(lambda: str(Interpreter().execute(ast)), repeat=1)
+        min_length = StringBuilder.MIN_LENGTH
+        StringBuilder.MIN_LENGTH = float('inf')  # plain str concatenation
+        try:
+            plain = timed(lambda: Interpreter().execute(ast), repeat=1)
+        finally:
+            StringBuilder.MIN_LENGTH = min_length
+        print(f"string builder  {appends:>7} appends  str: {plain * 1000:8.1f} ms  "
+              f"builder: {built * 1000:7.1f} ms  ({built / appends * 1e6:.2f} us/append)")
+
+
+@benchmark
+def bench_quickening():
+    from emoji import Interpreter
+    from Quickening import QuickeningInterpreter
+
+    code = (
+        '📦 🔵 ➡️ 0️⃣\n📦 i ➡️ 0️⃣\n📦 f ➡️ 0.5\n'
+        '🔁 i ⬇️ 100000 👉\n'
+        '    i ➡️ i ➕ 1️⃣\n'
+        '    ❓ i ➗ 2️⃣ ⬆️ 10 👉\n'
+        '        🔵 ➡️ 🔵 ➕ i ✖️ 3️⃣ ➖ 1️⃣\n'
+        '    🔚\n'
+        '    f ➡️ f ✖️ 1.0\n'
+        '🔚\n'
+    )
+    ast = Parser(Lexer(code).tokenize()).parse()
+    generic = timed(lambda: Interpreter().execute(ast))
+    quickened = timed(lambda: QuickeningInterpreter().execute(ast))
+    interpreter = QuickeningInterpreter()
+    interpreter.execute(ast)
+    print(f"quickening  generic: {generic * 1000:7.1f} ms  quickened: {quickened * 1000:7.1f} ms  "
+          f"({generic / quickened:.2f}x)")
+    for stats in interpreter.specialization_stats():
+        print(f"    {stats['op']:>2} {stats['state']:<12} hits={stats['specialized_hits']:<7} "
+              f"misses={stats['guard_misses']} generic={stats['generic']} deopts={stats['deopts']}")
+
+
+@benchmark
+def bench_suspendable():
+    import asyncio
+    from emoji import demo_program
+    from Suspendable import SuspendableInterpreter
+
+    ast = Parser(Lexer(demo_program).tokenize()).parse()
+
+    def player():
+        guesses = iter(range(1, 11))
+
+        async def ask(prompt):
+            await asyncio.sleep(0)  # hand the loop to other sessions
+            return str(next(guesses))
+        return ask
+
+    async def play(sessions):
+        output = []
+        await asyncio.gather(*[SuspendableInterpreter(seed=i, output=output.append).run_async(ast, player())
+                               for i in range(sessions)])
+        return output.count('Correct! You guessed it.')
+
+    async def suspended_sessions(sessions):
+        # Start every session and leave it waiting at its first 📝
+        runs = [SuspendableInterpreter(seed=i, output=lambda text: None).run(ast) for i in range(sessions)]
+        for run in runs:
+            next(run)
+        return runs
+
+    for sessions in (100, 1_000, 5_000):
+        began = time.perf_counter()
+        won = asyncio.run(play(sessions))
+        elapsed = time.perf_counter() - began
+        _, held = retained_memory(lambda: asyncio.run(suspended_sessions(sessions)))
+        print(f"suspendable  {sessions:>5} concurrent games on one thread: {elapsed * 1000:8.1f} ms, "
+              f"{won} won, {held / sessions / 1024:5.1f} KiB per waiting session")
+
+
+@benchmark
+def bench_loop_optimizer():
+    from emoji import Interpreter
+    from LoopOptimizer import LoopOptimizingInterpreter
+
+    programs = {
+        'counted 🔁': (
+            '📦 🟢 ➡️ 0️⃣\n📦 🔵 ➡️ 200000\n📦 total ➡️ 0️⃣\n'
+            '🔁 🟢 ⬇️ 🔵 👉\n'
+            '    total ➡️ total ➕ 🟢\n'
+            '    🟢 ➡️ 🟢 ➕ 1️⃣\n'
+            '🔚\n'
+        ),
+        'invariant 🔁': (
+            '📦 i ➡️ 0️⃣\n📦 w ➡️ 7️⃣\n📦 h ➡️ 9️⃣\n📦 total ➡️ 0️⃣\n'
+            '🔁 i ⬇️ w ✖️ h ✖️ 2000 👉\n'
+            '    total ➡️ total ➕ ( w ✖️ h ➖ 1️⃣ ) ➗ ( h ➕ w )\n'
+            '    i ➡️ i ➕ 1️⃣\n'
+            '🔚\n'
+        ),
+        'invariant 🔂': (
+            '📦 w ➡️ 7️⃣\n📦 h ➡️ 9️⃣\n📦 total ➡️ 0️⃣\n'
+            '🔂 100000 👉\n'
+            '    total ➡️ total ➕ ( w ✖️ h ➖ 1️⃣ ) ➗ ( h ➕ w )\n'
+            '🔚\n'
+        ),
+    }
+    for name, code in programs.items():
+        ast = Parser(Lexer(code).tokenize()).parse()
+        generic = timed(lambda: Interpreter().execute(ast))
+        optimized = timed(lambda: LoopOptimizingInterpreter().execute(ast))
+        print(f"loop optimizer  {name:<13} generic: {generic * 1000:7.1f} ms  optimized: {optimized * 1000:7.1f} ms  "
+              f"({generic / optimized:.2f}x)")
+
+
+
+@benchmark
+def bench_stack_interpreter():
+    from emoji import Interpreter
+    from IterativeParser import IterativeParser
+    from StackInterpreter import StackInterpreter
+
+    def run_with(interpreter_cls, ast):
+        try:
+            interpreter_cls().execute(ast)
+            return 'ok'
+        except RecursionError:
+            return 'RecursionError'
+
+    recursion = (
+        '🎯 depth 📥 n 👉\n'
+        '    ❓ n ⬇️ 1️⃣ 👉\n'
+        '        ⬅️ 0️⃣\n'
+        '    🔚\n'
+        '    ⬅️ 1️⃣ ➕ depth(n ➖ 1️⃣)\n'
+        '🔚\n'
+        'depth({n})\n'
+    )
+    cases = {
+        'recursion 100': recursion.format(n=100),
+        'recursion 5000': recursion.format(n=5_000),
+        'nested parens': '📦 x ➡️ ' + '(' * 5_000 + '1' + ' ➕ 1)' * 5_000 + '\n',
+        'nested ❓': '❓ ✅ 👉\n' * 5_000 + '📦 x ➡️ 1\n' + '🔚\n' * 5_000,
+    }
+    for label, code in cases.items():
+        ast = IterativeParser(Lexer(code).tokenize()).parse()
+        results = []
+        for interpreter_cls in (Interpreter, StackInterpreter):
+            began = time.perf_counter()
+            status = run_with(interpreter_cls, ast)
+            results.append(f"{(time.perf_counter() - began) * 1000:8.1f} ms {status:<14}")
+        print(f"stack interpreter  {label:<15} recursive: {results[0]}  stack: {results[1]}")
+
+    # Memory held per active 🎯 call: peak while the recursion is at its deepest
+    ast = Parser(Lexer(recursion.format(n=100)).tokenize()).parse()
+    baseline = Parser(Lexer(recursion.format(n=0)).tokenize()).parse()
+    for interpreter_cls in (Interpreter, StackInterpreter):
+        per_level = (peak_memory(lambda: interpreter_cls().execute(ast)) -
+                     peak_memory(lambda: interpreter_cls().execute(baseline))) / 100
+        print(f"stack interpreter  {interpreter_cls.__name__:<18} {per_level:8.0f} bytes per call level")
+
+
+
+@benchmark
+def bench_modules():
+    from emoji import MODULES, Interpreter
+
+    library = '\n'.join(f'🎯 helper{i} 📥 x 👉\n    ⬅️ x ✖️ {i} ➕ 1️⃣\n🔚' for i in range(200)) + '\n'
+    script = '🖨️ helper7(6️⃣)\n'
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'helpers.emoji')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(library)
+
+        def pasted(scripts):
+            for _ in range(scripts):
+                Interpreter().execute(full_parse(library + script))
+
+        def imported(scripts):
+            for _ in range(scripts):
+                interpreter = Interpreter()
+                interpreter.module_dir = directory
+                interpreter.execute(full_parse('📚 "helpers.emoji"\n' + script))
+
+        for scripts in (10, 100):
+            MODULES.clear()
+            with contextlib.redirect_stdout(io.StringIO()):
+                paste_time = timed(pasted, scripts)
+                import_time = timed(imported, scripts)
+            print(f"modules  {scripts:>4} scripts using a 200-function library  pasted: {paste_time * 1000:8.1f} ms  "
+                  f"📚: {import_time * 1000:7.1f} ms  ({paste_time / import_time:.1f}x)")
+        print(f"modules  registry: {MODULES.compiles} compiles, {MODULES.hits} cache hits")
+
+
+
+@benchmark
+def bench_lane_batch():
+    from LaneBatch import LaneInterpreter, LaneBatch, numpy
+
+    code = (
+        '📦 guess ➡️ 📝 "🔢➡️"\n'
+        '📦 score ➡️ 0️⃣\n'
+        '❓ guess ⬆️ 50 👉\n'
+        '    score ➡️ guess ✖️ 2️⃣ ➖ 7️⃣\n'
+        '❔ 👉\n'
+        '    score ➡️ 100 ➗ ( guess ➕ 1️⃣ )\n'
+        '🔚\n'
+        '📦 i ➡️ 0️⃣\n'
+        '🔁 i ⬇️ guess ➗ 🔟 👉\n'
+        '    score ➡️ score ➕ i\n'
+        '    i ➡️ i ➕ 1️⃣\n'
+        '🔚\n'
+        '🖨️ score\n'
+    )
+    ast = full_parse(code)
+    rng = random.Random(42)
+    backends = ['python'] + (['numpy'] if numpy is not None else [])
+    for lanes in (1_000, 10_000, 100_000):
+        inputs = [[str(rng.randint(1, 100))] for _ in range(lanes)]
+        timings = []
+        if lanes <= 10_000:
+            timings.append(('per lane', timed(lambda: [LaneInterpreter(row).run(ast) for row in inputs], repeat=1)))
+        for backend in backends:
+            timings.append((backend, timed(lambda: LaneBatch(inputs, backend).run(ast), repeat=1)))
+        print(f"lane batch  {lanes:>7} lanes  " + '  '.join(f"{name}: {seconds * 1000:8.1f} ms" for name, seconds in timings))
+
+
+
+@benchmark
+def bench_builtins():
+    from emoji import Interpreter
+
+    helpers = {
+        'abs': (
+            '🎯 my_abs 📥 x 👉\n'
+            '    ❓ x ⬇️ 0️⃣ 👉\n'
+            '        ⬅️ ➖ x\n'
+            '    🔚\n'
+            '    ⬅️ x\n'
+            '🔚\n',
+            'my_abs', '📐',
+        ),
+        'integer sqrt': (
+            '🎯 my_isqrt 📥 n 👉\n'
+            '    📦 r ➡️ 0️⃣\n'
+            '    🔁 ( r ➕ 1️⃣ ) ✖️ ( r ➕ 1️⃣ ) ⬇️ n ➕ 1️⃣ 👉\n'
+            '        r ➡️ r ➕ 1️⃣\n'
+            '    🔚\n'
+            '    ⬅️ r\n'
+            '🔚\n',
+            'my_isqrt', '🌱',
+        ),
+    }
+    loop = (
+        '📦 total ➡️ 0️⃣\n'
+        '📦 i ➡️ ➖ 2000\n'
+        '🔁 i ⬇️ 2000 👉\n'
+        '    total ➡️ total ➕ {call}\n'
+        '    i ➡️ i ➕ 1️⃣\n'
+        '🔚\n'
+    )
+    calls = 4000
+    for label, (definition, interpreted, native) in helpers.items():
+        argument = 'i' if label == 'abs' else '( i ➕ 2000 )'
+        baseline_ast = full_parse(loop.format(call=argument))
+        baseline = timed(lambda: Interpreter().execute(baseline_ast))
+        per_call = {}
+        for name, source in (('🎯', definition + loop.format(call=f'{interpreted}({argument})')),
+                             ('builtin', loop.format(call=f'{native}({argument})'))):
+            ast = full_parse(source)
+            per_call[name] = (timed(lambda: Interpreter().execute(ast)) - baseline) / calls
+        print(f"builtins  {label:<13} per call  🎯: {per_call['🎯'] * 1e6:8.2f} µs  "
+              f"builtin: {per_call['builtin'] * 1e6:6.2f} µs  ({per_call['🎯'] / per_call['builtin']:.0f}x)")
+
+@benchmark
+def bench_replay():
+    from emoji import Interpreter
+    from Replay import RecordingInterpreter, ReplayInterpreter, TraceReader, TraceWriter
+
+    draws = 20000
+    ast = full_parse(
+        '⏱️\n'
+        '📦 total ➡️ 0️⃣\n'
+        f'🔂 {draws} 👉\n'
+        '    total ➡️ total ➕ 🎲 1️⃣ 1000\n'
+        '🔚\n'
+        '⏱️\n'
+    )
+    data = {}
+
+    def record():
+        stream = io.BytesIO()
+        trace = TraceWriter(stream)
+        RecordingInterpreter(trace, seed=1).execute(ast)
+        data['trace'] = stream.getvalue()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        plain = timed(lambda: Interpreter(seed=1).execute(ast))
+        recorded = timed(record)
+        replayed = timed(lambda: ReplayInterpreter(TraceReader(data['trace'])).execute(ast))
+    print(f"replay    {draws} 🎲  plain: {plain * 1000:7.1f} ms  record: {recorded * 1000:7.1f} ms  "
+          f"replay: {replayed * 1000:7.1f} ms  trace: {len(data['trace']) / draws:.2f} bytes/draw")
+
+
+@benchmark
+def bench_lazy_bodies():
+    from emoji import Interpreter
+
+    functions = 400
+    lines = []
+    for i in range(functions):
+        lines.append(f'🎯 helper{i} 📥 n 👉')
+        lines.append('    📦 t ➡️ 0️⃣')
+        lines.append('    🔂 n 👉')
+        lines.append(f'        ❓ t ⬆️ {i} 👉')
+        lines.append('            t ➡️ t ➖ 1️⃣')
+        lines.append('        ❔ 👉')
+        lines.append(f'            t ➡️ t ➕ 📐(n ➖ {i})')
+        lines.append('        🔚')
+        lines.append('    🔚')
+        lines.append('    ⬅️ t')
+        lines.append('🔚')
+    lines.append('🖨️ helper7(5️⃣)')
+    code = '\n'.join(lines) + '\n'
+    tokens = Lexer(code).tokenize()
+
+    def run(lazy):
+        Interpreter().execute(Parser(tokens, lazy=lazy).parse())
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        eager = timed(run, False)
+        lazy = timed(run, True)
+    eager_bytes = retained_memory(lambda: Parser(Lexer(code).tokenize()).parse())[1]
+    lazy_bytes = retained_memory(lambda: Parser(Lexer(code).tokenize(), lazy=True).parse())[1]
+    def parse_and_validate():
+        parser = Parser(tokens, lazy=True)
+        parser.parse()
+        parser.validate()
+
+    validate = timed(parse_and_validate)
+    print(f"lazy      {functions} 🎯, 1 called  parse+run eager: {eager * 1000:6.1f} ms  lazy: {lazy * 1000:6.1f} ms  "
+          f"({eager / lazy:.1f}x)")
+    print(f"lazy      retained  eager AST: {eager_bytes / 1024:7.0f} KiB  lazy (tokens + ranges): "
+          f"{lazy_bytes / 1024:7.0f} KiB  lazy parse + validate: {validate * 1000:.1f} ms")
+
+
+@benchmark
+def bench_zygote():
+    import socket
+    import subprocess
+
+    import Zygote
+
+    if not hasattr(os, 'pidfd_open') or not hasattr(socket, 'send_fds'):
+        print("zygote    skipped: needs Linux with os.pidfd_open and socket.send_fds")
+        return
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Zygote.py')
+    launches = 40
+
+    def percentiles(samples):
+        samples = sorted(samples)
+        return samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+    def wall(fn):
+        began = time.perf_counter()
+        fn()
+        return time.perf_counter() - began
+
+    with tempfile.TemporaryDirectory() as tmp:
+        program = os.path.join(tmp, 'hello.emoji')
+        with open(program, 'w', encoding='utf-8') as f:
+            f.write('📦 n ➡️ 0️⃣\n🔂 10 👉\n    n ➡️ n ➕ 🎲 1️⃣ 6️⃣\n🔚\n🖨️ n\n')
+        path = os.path.join(tmp, 'zygote.sock')
+        server = subprocess.Popen([sys.executable, script, 'serve', '--socket', path, '--preload', program])
+        try:
+            while not os.path.exists(path):
+                time.sleep(0.01)
+            quiet = dict(stdout=subprocess.DEVNULL, check=True)
+            results = {
+                'cold': [wall(lambda: subprocess.run([sys.executable, script, 'exec', program], **quiet))
+                         for _ in range(launches)],
+                'client': [wall(lambda: subprocess.run([sys.executable, script, 'run', program, '--socket', path],
+                                                       **quiet))
+                           for _ in range(launches)],
+            }
+            with open(os.devnull, 'w') as devnull:
+                fds = (0, devnull.fileno(), 2)
+                results['fork only'] = [wall(lambda: Zygote.launch(program, path, fds=fds)) for _ in range(launches)]
+        finally:
+            server.terminate()
+            server.wait()
+    for label, samples in results.items():
+        p50, p99 = percentiles(samples)
+        print(f"zygote    {label:<10} {launches} launches  p50: {p50 * 1000:6.1f} ms  p99: {p99 * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"❌ Unknown benchmark '{name}'. Available: {', '.join(BENCHMARKS)}")
+            sys.exit(1)
+        print(f"\n=== {name} ===")
+        BENCHMARKS[name]()
@@ -32,13 +32,109 @@ Examples:
   Range: 🔢 0️⃣ 🔟 (numbers from 0 to 10)
   Input: � "🔢➡️" (prompt for input)
   Random: 🎲 1️⃣ � (random number 1-10)
+  Import: 📚 "helpers.emoji" (load another file's 🎯 functions)
+  Builtins: 📐(x) 🔽(a b) 🔼(a b) 🧮(list) 📏(text) 🌱(n)
 """
 
+import hashlib
+import math
+import os
 import re
 import random
-from typing import Any, Dict, List, Optional, Tuple
+import struct
+import sys
+import threading
+import time
+import unicodedata
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+def is_grapheme_extend(ch: str) -> bool:
+    """Characters that attach to the preceding one: variation selectors,
+    skin tones, keycaps, tag characters and combining marks."""
+    cp = ord(ch)
+    return (0xFE00 <= cp <= 0xFE0F or 0x1F3FB <= cp <= 0x1F3FF or 0xE0020 <= cp <= 0xE007F
+            or cp == 0x20E3 or cp == 0x200D or unicodedata.category(ch) in ('Mn', 'Me'))
+
+
+def is_regional_indicator(ch: str) -> bool:
+    return 0x1F1E6 <= ord(ch) <= 0x1F1FF
+
+
+def grapheme_end(text: str, pos: int) -> int:
+    """End of the emoji grapheme cluster starting at pos.
+
+    Covers modifier sequences (👍🏽), variation selectors (⭐️), ZWJ
+    sequences (👩‍💻) and flags (🇳🇱). A zero width joiner only joins non-ASCII
+    characters, so clusters never swallow whitespace, quotes or parentheses.
+    """
+    size = len(text)
+    first = text[pos]
+    pos += 1
+    if is_regional_indicator(first) and pos < size and is_regional_indicator(text[pos]):
+        return pos + 1
+    while pos < size:
+        ch = text[pos]
+        if ch == '\u200d' and pos + 1 < size and ord(text[pos + 1]) > 127:
+            pos += 2
+        elif is_grapheme_extend(ch):
+            pos += 1
+        else:
+            break
+    return pos
+
+
+class SymbolTable:
+    """Process-wide table of identifier names.
+
+    Every distinct name is stored once, as an interned string, and gets a
+    small integer id. Tokens and AST nodes carry the interned string, so
+    scope lookups compare names by identity; the ids are available for
+    code that wants to index arrays by symbol.
+
+    intern() may be called from several threads (lazy 🎯 bodies parse on
+    first call). clear() bounds the table in long-lived processes: names
+    still in use stay identical, because sys.intern keeps returning the
+    live object, but ids handed out before are no longer valid.
+    """
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.lock = threading.Lock()
+
+    def intern(self, name: str) -> str:
+        symbol = self.ids.get(name)
+        if symbol is None:
+            with self.lock:
+                symbol = self.ids.get(name)
+                if symbol is None:
+                    name = sys.intern(name)
+                    self.names.append(name)
+                    self.ids[name] = len(self.names) - 1
+                    return name
+        return self.names[symbol]
+
+    def clear(self):
+        with self.lock:
+            self.ids = {}
+            self.names = []
+
+    def id_of(self, name: str) -> int:
+        return self.ids[self.intern(name)]
+
+    def name_of(self, symbol: int) -> str:
+        return self.names[symbol]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+SYMBOLS = SymbolTable()
+
 
 class Token:
+    __slots__ = ('type', 'value', 'line')
+
     def __init__(self, type: str, value: Any, line: int = 0):
         self.type = type
         self.value = value
@@ -85,6 +181,7 @@ class Lexer:
             '💭': 'COMMENT',    # Comment
             '📝': 'INPUT',       # Input from user (prompt)
             '🎲': 'RANDOM',      # Random number generator
+            '📚': 'IMPORT',      # Import another file's functions
             '(': 'LPAREN',
             ')': 'RPAREN',
             '⏱️': 'timer',       # Timer
@@ -121,6 +218,10 @@ class Lexer:
             matched = False
             for key in sorted(self.emoji_keywords.keys(), key=len, reverse=True):
                 if self.code.startswith(key, self.pos):
+                    end = self.pos + len(key)
+                    if ord(key[0]) > 127 and end < len(self.code) and is_grapheme_extend(self.code[end]):
+                        # Only the start of a longer cluster: 👨‍👩‍👧‍👦 is an identifier, not 👨‍👩‍👧
+                        continue
                     token_type = self.emoji_keywords[key]
                     self.tokens.append(Token(token_type, key, self.line))
                     self.pos += len(key)
@@ -155,10 +256,12 @@ class Lexer:
                 self.tokens.append(Token('NUM', value, self.line))
                 continue
 
-            # If the character is a non-ASCII emoji and not a keyword, treat it as an identifier (single emoji id)
-            if ord(char) > 127:
-                self.tokens.append(Token('ID', char, self.line))
-                self.pos += 1
+            # A non-ASCII emoji that is not a keyword is an identifier: one whole grapheme cluster.
+            # So are the #️⃣ and *️⃣ keycaps; the digit keycaps are numbers.
+            if ord(char) > 127 or (char in '#*' and self.code[self.pos + 1:self.pos + 2] in ('\ufe0f', '\u20e3')):
+                end = grapheme_end(self.code, self.pos)
+                self.tokens.append(Token('ID', SYMBOLS.intern(self.code[self.pos:end]), self.line))
+                self.pos = end
                 continue
             
             # Numbers
@@ -225,13 +328,18 @@ class Lexer:
         start = self.pos
         while self.pos < len(self.code) and (self.code[self.pos].isalnum() or self.code[self.pos] == '_'):
             self.pos += 1
-        name = self.code[start:self.pos]
+        name = SYMBOLS.intern(self.code[start:self.pos])
         return Token('ID', name, self.line)
 
 class Parser:
-    def __init__(self, tokens: List[Token]):
+    def __init__(self, tokens: List[Token], lazy: bool = False):
         self.tokens = tokens
         self.pos = 0
+        # Lazy mode: 🎯 bodies stay token ranges (LazyBody) until first called
+        self.lazy = lazy
+        self.lazy_bodies: List['LazyBody'] = []
+        # Lazy bodies parse with this parser's cursor, possibly from several threads
+        self.lock = threading.Lock()
     
     def parse(self) -> List[Any]:
         statements = []
@@ -260,6 +368,8 @@ class Parser:
             return self.function_def()
         elif self.match('RETURN'):
             return self.return_statement()
+        elif self.match('IMPORT'):
+            return self.import_statement()
         else:
             return self.expression()
     
@@ -361,18 +471,69 @@ class Parser:
         
         self.consume('THEN')
         
-        body = []
-        while not self.match('END'):
-            body.append(self.statement())
+        if self.lazy:
+            body = self.skip_body()
+        else:
+            body = []
+            while not self.match('END'):
+                body.append(self.statement())
         
         self.consume('END')
         return ('def', name, params, body)
+
+    def skip_body(self) -> 'LazyBody':
+        """Skip to the 🔚 closing the block just opened, by 👉/🔚 nesting."""
+        tokens = self.tokens
+        start = self.pos
+        depth = 1
+        while self.pos < len(tokens):
+            token_type = tokens[self.pos].type
+            if token_type == 'END':
+                depth -= 1
+                if depth == 0:
+                    break
+            elif token_type == 'THEN' and tokens[self.pos - 1].type != 'ELSE':
+                # ❔ 👉 continues its ❓ block instead of opening one
+                depth += 1
+            elif token_type == 'EOF':
+                break
+            self.pos += 1
+        body = LazyBody(self, start, self.pos)
+        self.lazy_bodies.append(body)
+        return body
+
+    def parse_range(self, start: int, end: int) -> List[Any]:
+        """Parse the statements in tokens[start:end]."""
+        saved = self.pos
+        self.pos = start
+        try:
+            statements = []
+            while self.pos < end:
+                statements.append(self.statement())
+            if self.pos != end:
+                raise SyntaxError(f"❌ Error at line {self.tokens[end].line}: 🎯 body does not end at its 🔚.")
+        finally:
+            self.pos = saved
+        return statements
+
+    def validate(self):
+        """Parse every lazy 🎯 body now, nested ones included, so syntax errors surface up front."""
+        index = 0
+        while index < len(self.lazy_bodies):
+            # Parsing a body may append the bodies nested in it
+            self.lazy_bodies[index].parse()
+            index += 1
     
     def return_statement(self):
         self.consume('RETURN')
         value = self.expression()
         return ('return', value)
     
+    def import_statement(self):
+        self.consume('IMPORT')
+        path = self.consume('STR').value
+        return ('import', path)
+
     def expression(self):
         return self.logic_or()
     
@@ -532,15 +693,325 @@ class Parser:
         self.advance()
         return token
 
+class LazyBody:
+    """Statements of a 🎯 body, parsed from its token range on first use.
+
+    The parsed list is cached here, on the function value, so the body is
+    parsed at most once. Iterating or indexing a LazyBody parses it, so AST
+    walkers see the same statements an eager parse would have produced.
+    """
+
+    __slots__ = ('parser', 'start', 'end', 'statements')
+
+    def __init__(self, parser: Parser, start: int, end: int):
+        self.parser = parser
+        self.start = start
+        self.end = end
+        self.statements: Optional[List[Any]] = None
+
+    def parse(self) -> List[Any]:
+        statements = self.statements
+        if statements is None:
+            parser = self.parser
+            if parser is None:
+                # Another thread finished parsing since the check above
+                return self.statements
+            with parser.lock:
+                statements = self.statements
+                if statements is None:
+                    statements = self.statements = parser.parse_range(self.start, self.end)
+                    # Once every body is parsed, the tokens can be freed with the parser
+                    self.parser = None
+        return statements
+
+    def __getstate__(self):
+        # Pickle (e.g. for ParallelRepeat workers) the parsed body, not the parser and its lock
+        return self.start, self.end, self.parse()
+
+    def __setstate__(self, state):
+        self.start, self.end, self.statements = state
+        self.parser = None
+
+    def __iter__(self):
+        return iter(self.parse())
+
+    def __len__(self):
+        return len(self.parse())
+
+    def __getitem__(self, index):
+        return self.parse()[index]
+
+    def __eq__(self, other):
+        return self.parse() == other
+
+    def __repr__(self):
+        if self.statements is None:
+            return f"LazyBody(tokens {self.start}:{self.end})"
+        return repr(self.statements)
+
+
 class ReturnException(Exception):
     def __init__(self, value):
         self.value = value
 
+class StringBuilder:
+    """String value produced by repeated ➕ appends.
+
+    Holds the pieces in a list and joins them only when the text is needed
+    (printing, comparing, str()). Appending to the newest builder of a list
+    extends that list in place, so a loop like `📜 ➡️ 📜 ➕ "…"` is linear
+    overall. Older builders keep their own `count`, so they still see only
+    their prefix, and appending to one of them copies the list first.
+    """
+
+    __slots__ = ('parts', 'count', 'length', 'flat')
+
+    # Shorter strings are concatenated directly
+    MIN_LENGTH = 256
+
+    def __init__(self, parts: List[str], length: int):
+        self.parts = parts
+        self.count = len(parts)
+        self.length = length
+        self.flat: Optional[str] = None
+
+    @classmethod
+    def concat(cls, left, right):
+        if type(right) is StringBuilder:
+            right = str(right)
+        elif type(right) is not str:
+            return str(left) + right  # raises the usual TypeError
+        if type(left) is str:
+            return cls([left, right], len(left) + len(right))
+        parts = left.parts
+        if left.count != len(parts):
+            parts = parts[:left.count]
+        parts.append(right)
+        return cls(parts, left.length + len(right))
+
+    def __str__(self) -> str:
+        if self.flat is None:
+            parts = self.parts
+            self.flat = ''.join(parts if self.count == len(parts) else parts[:self.count])
+        return self.flat
+
+    def __add__(self, other):
+        return StringBuilder.concat(self, other)
+
+    def __radd__(self, other):
+        return other + str(self)
+
+    def __eq__(self, other):
+        return str(self) == (str(other) if type(other) is StringBuilder else other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self):
+        return repr(str(self))
+
+
+def flatten(value):
+    """Turn a StringBuilder into a plain str; other values pass through."""
+    return str(value) if type(value) is StringBuilder else value
+
+
+class RandomSource:
+    """Per-interpreter random number generator for 🎲.
+
+    Draws 64-bit words from a seeded random.Random in batches (one
+    getrandbits call per batch of up to BATCH words) and maps them onto a range with
+    rejection sampling, so every value in the range is equally likely.
+    The same seed always yields the same sequence.
+    """
+
+    BATCH = 1024
+    WORD_BITS = 64
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.words = iter(())
+        # Batches start small and double up to BATCH, so interpreters that
+        # draw only a few numbers do not hold a full buffer
+        self.batch = 16
+        # span -> rejection threshold, so the common case is one dict lookup
+        self.limits: Dict[int, int] = {}
+
+    def refill(self):
+        batch = self.batch
+        raw = self.rng.getrandbits(self.WORD_BITS * batch).to_bytes(8 * batch, 'little')
+        self.words = iter(struct.unpack(f'<{batch}Q', raw))
+        self.batch = min(batch * 2, self.BATCH)
+
+    def randint(self, lo: int, hi: int) -> int:
+        span = hi - lo + 1
+        limit = self.limits.get(span)
+        if limit is None:
+            if span <= 0:
+                raise ValueError(f"empty range for randint ({lo}, {hi})")
+            if span > 1 << self.WORD_BITS:
+                return lo + self.rng.randrange(span)
+            if len(self.limits) >= 256:
+                self.limits.clear()
+            # Reject the top partial bucket so `word % span` is unbiased
+            limit = self.limits[span] = (1 << self.WORD_BITS) - (1 << self.WORD_BITS) % span
+        while True:
+            for word in self.words:
+                if word < limit:
+                    return lo + word % span
+            self.refill()
+
+
+class Builtin:
+    """A native Python function callable from EmojiScript.
+
+    pure means the function has no side effects and its result depends only
+    on its arguments, so optimizers may treat calls like operators.
+    """
+
+    __slots__ = ('name', 'func', 'arity', 'pure')
+
+    def __init__(self, name: str, func: Callable[..., Any], arity: int, pure: bool = True):
+        self.name = name
+        self.func = func
+        self.arity = arity
+        self.pure = pure
+
+    def __call__(self, args: List[Any]):
+        if len(args) != self.arity:
+            raise RuntimeError(f"Expected {self.arity} arguments, got {len(args)}")
+        try:
+            return self.func(*[flatten(arg) for arg in args])
+        except (TypeError, ValueError, OverflowError) as e:
+            raise RuntimeError(f"❌ Error: {self.name}: {e}") from e
+
+    def __repr__(self):
+        return f"<builtin {self.name}>"
+
+
+# Process-wide builtins; every new Interpreter starts with a copy
+BUILTINS: Dict[str, Builtin] = {}
+
+
+def register_builtin(name: str, func: Callable[..., Any], arity: int, pure: bool = True) -> Builtin:
+    """Make func callable as name(...) from every Interpreter created afterwards."""
+    builtin = BUILTINS[SYMBOLS.intern(name)] = Builtin(name, func, arity, pure)
+    return builtin
+
+
+register_builtin('📐', abs, 1)
+register_builtin('🔽', min, 2)
+register_builtin('🔼', max, 2)
+register_builtin('🧮', sum, 1)
+register_builtin('📏', len, 1)
+register_builtin('🌱', math.isqrt, 1)
+
+
+class Module:
+    """A compiled .emoji module: its 🎯 functions and the modules it imports."""
+
+    __slots__ = ('path', 'stamp', 'digest', 'functions', 'imports')
+
+    def __init__(self, path: str, stamp: Tuple[int, int], digest: str,
+                 functions: Dict[str, tuple], imports: List[str]):
+        self.path = path
+        self.stamp = stamp
+        self.digest = digest
+        self.functions = functions
+        self.imports = imports
+
+
+class ModuleRegistry:
+    """Process-wide cache of compiled modules, keyed by absolute path.
+
+    A cached module is reused while the file's (mtime, size) is unchanged.
+    When the stamp changes the file is read again, but only re-parsed if its
+    content hash differs. Function values are immutable, so every
+    Interpreter that imports a module shares the same compiled bodies.
+    With lazy=True, function bodies are only parsed when first called.
+    """
+
+    def __init__(self, lazy: bool = False):
+        self.modules: Dict[str, Module] = {}
+        self.lazy = lazy
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.compiles = 0
+
+    def load(self, path: str) -> Module:
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            module = self.modules.get(path)
+            if module is not None and module.stamp == stamp:
+                self.hits += 1
+                return module
+            with open(path, 'rb') as f:
+                source = f.read()
+            digest = hashlib.sha256(source).hexdigest()
+            if module is not None and module.digest == digest:
+                # Touched but not changed
+                module.stamp = stamp
+                self.hits += 1
+                return module
+            module = self.modules[path] = self.compile(path, stamp, digest, source.decode('utf-8'))
+            self.compiles += 1
+            return module
+
+    def compile(self, path: str, stamp: Tuple[int, int], digest: str, code: str) -> Module:
+        functions: Dict[str, tuple] = {}
+        imports: List[str] = []
+        directory = os.path.dirname(path)
+        for statement in Parser(Lexer(code).tokenize(), lazy=self.lazy).parse():
+            if statement[0] == 'def':
+                functions[statement[1]] = ('function', statement[2], statement[3])
+            elif statement[0] == 'import':
+                imports.append(os.path.join(directory, statement[1]))
+            else:
+                raise SyntaxError(f"❌ Error in module {path}: only 🎯 definitions and 📚 imports "
+                                  f"are allowed at the top level, got '{statement[0]}'.")
+        return Module(path, stamp, digest, functions, imports)
+
+    def definitions(self, path: str) -> Dict[str, tuple]:
+        """All functions defined by path and, transitively, the modules it imports."""
+        functions: Dict[str, tuple] = {}
+        self.collect(os.path.abspath(path), functions, set())
+        return functions
+
+    def collect(self, path: str, functions: Dict[str, tuple], seen: set):
+        if path in seen:
+            return  # Import cycles are fine: each module is merged once
+        seen.add(path)
+        module = self.load(path)
+        for dependency in module.imports:
+            self.collect(os.path.abspath(dependency), functions, seen)
+        # A module's own definitions override the ones it imports
+        functions.update(module.functions)
+
+    def clear(self):
+        with self.lock:
+            self.modules.clear()
+
+
+MODULES = ModuleRegistry()
+
+
 class Interpreter:
-    def __init__(self):
+    # Names that cannot be assignment targets
+    RESERVED_NAMES = ['if', 'else', 'while', 'true', 'false', 'print', 'return', 'end']
+
+    def __init__(self, seed=None):
         self.globals = {}
         self.scopes = [self.globals]
+        self.random = RandomSource(seed)
+        self.builtins = dict(BUILTINS)
         self.start_time = None
+        # Relative 📚 paths are resolved against this directory ('' = cwd)
+        self.module_dir = ''
         self.strict_mode = True  # Enable strict variable checking
         # Mapping from emoji-only program strings to English output
         self.output_translations = {
@@ -573,24 +1044,33 @@ class Interpreter:
     
     def execute(self, ast: List[Any]):
         result = None
-        for statement in ast:
-            result = self.eval(statement)
-        return result
+        try:
+            for statement in ast:
+                result = self.eval(statement)
+        finally:
+            self.flatten_globals()
+        return flatten(result)
+
+    def flatten_globals(self):
+        """Replace StringBuilder values in globals with plain strs, for the host."""
+        variables = self.globals
+        for name, value in variables.items():
+            if type(value) is StringBuilder:
+                variables[name] = str(value)
     
     def eval(self, node):
         if node is None:
             return None
         
         if node[0] == 'timer':
-            import time
             if not self.start_time:
-                self.start_time = time.time()
+                self.start_time = self.clock()
                 return {"type": "timer", "value": "Timer started"}
             else:
-                end_time = time.time()
+                end_time = self.clock()
                 runtime = end_time - self.start_time
                 self.start_time = None
-                print(f"\n⏱️ Runtime: {runtime:.4f} seconds")
+                self.emit(f"\n⏱️ Runtime: {runtime:.4f} seconds")
                 return {"type": "timer", "value": runtime}
         elif node[0] == 'num':
             return node[1]
@@ -601,26 +1081,7 @@ class Interpreter:
         elif node[0] == 'var':
             return self.get_var(node[1])
         elif node[0] == 'assign':
-            var_name = node[1]
-            value = self.eval(node[2])
-            
-            # Validate variable name is not a reserved keyword or invalid
-            if not isinstance(var_name, str):
-                raise RuntimeError(f"❌ Error: Cannot assign to {var_name}. Assignment target must be a variable name.")
-            
-            # Check if trying to assign to a keyword-like name
-            reserved = ['if', 'else', 'while', 'true', 'false', 'print', 'return', 'end']
-            if var_name.lower() in reserved:
-                raise RuntimeError(f"❌ Error: Cannot assign to reserved keyword '{var_name}'.")
-            
-            # For STORE (📦), check if variable already exists in current scope
-            if len(node) > 3 and node[3] == 'new_var':
-                # This is a STORE operation, check for redeclaration
-                if self.strict_mode and var_name in self.scopes[-1]:
-                    raise RuntimeError(f"❌ Error: Variable '{var_name}' is already declared in this scope. Use ➡️ (without 📦) to reassign.")
-            
-            self.set_var(node[1], value)
-            return value
+            return self.assign(node, self.eval(node[2]))
         elif node[0] == 'binop':
             return self.eval_binop(node[1], node[2], node[3])
         elif node[0] == 'unop':
@@ -649,7 +1110,7 @@ class Interpreter:
                 result = self.eval_block(node[2])
             return result
         elif node[0] == 'repeat':
-            count = self.eval(node[1])
+            count = flatten(self.eval(node[1]))
             result = None
             for _ in range(count):
                 result = self.eval_block(node[2])
@@ -660,51 +1121,21 @@ class Interpreter:
             return list(range(start, end + 1))
         elif node[0] == 'input':
             # ('input', prompt?) where prompt is ('str', text) or None
-            prompt_node = node[1]
-            prompt = ''
-            if prompt_node:
-                prompt = self.eval(prompt_node)
-                # If prompt is a string, translate emoji prompt to English for display
-                if isinstance(prompt, str):
-                    prompt = self.output_translations.get(prompt, prompt)
-            # Use Python input() to get a line, try to convert to int if possible
-            raw = input(prompt if prompt is not None else '')
-            raw = raw.strip()
-            # Return number if numeric, else string
-            if raw.isdigit() or (raw.startswith('-') and raw[1:].isdigit()):
-                try:
-                    return int(raw)
-                except Exception:
-                    pass
-            try:
-                return float(raw)
-            except Exception:
-                return raw
+            return self.convert_input(self.read_line(self.input_prompt(node[1])))
         elif node[0] == 'random':
-            lo = self.eval(node[1])
-            hi = self.eval(node[2])
-            # Ensure ints
-            try:
-                lo_i = int(lo)
-                hi_i = int(hi)
-            except Exception:
-                raise RuntimeError("RANDOM bounds must be numeric")
-            return random.randint(lo_i, hi_i)
+            return self.draw_random(self.eval(node[1]), self.eval(node[2]))
         elif node[0] == 'def':
             self.globals[node[1]] = ('function', node[2], node[3])
             return None
+        elif node[0] == 'import':
+            self.import_module(node[1])
+            return None
         elif node[0] == 'call':
             func = self.eval(node[1])
             args = [self.eval(arg) for arg in node[2]]
             return self.call_function(func, args)
         elif node[0] == 'print':
-            value = self.eval(node[1])
-            # If the program prints a string, translate embedded emoji tokens to English
-            if isinstance(value, str):
-                out = self.translate_output(value)
-                print(out)
-            else:
-                print(value)
+            self.print_value(self.eval(node[1]))
             return None
         elif node[0] == 'return':
             value = self.eval(node[1])
@@ -712,6 +1143,84 @@ class Interpreter:
         else:
             return None
     
+    def assign(self, node, value):
+        var_name = node[1]
+        
+        # Validate variable name is not a reserved keyword or invalid
+        if not isinstance(var_name, str):
+            raise RuntimeError(f"❌ Error: Cannot assign to {var_name}. Assignment target must be a variable name.")
+        
+        # Check if trying to assign to a keyword-like name
+        if var_name.lower() in self.RESERVED_NAMES:
+            raise RuntimeError(f"❌ Error: Cannot assign to reserved keyword '{var_name}'.")
+        
+        # For STORE (📦), check if variable already exists in current scope
+        if len(node) > 3 and node[3] == 'new_var':
+            # This is a STORE operation, check for redeclaration
+            if self.strict_mode and var_name in self.scopes[-1]:
+                raise RuntimeError(f"❌ Error: Variable '{var_name}' is already declared in this scope. Use ➡️ (without 📦) to reassign.")
+        
+        self.set_var(node[1], value)
+        return value
+
+    def import_module(self, path):
+        path = os.path.join(self.module_dir, path)
+        try:
+            functions = MODULES.definitions(path)
+        except OSError as e:
+            raise RuntimeError(f"❌ Error: Cannot import '{path}': {e.strerror or e}.")
+        self.globals.update(functions)
+
+    def input_prompt(self, prompt_node) -> str:
+        prompt = ''
+        if prompt_node:
+            prompt = flatten(self.eval(prompt_node))
+            # If prompt is a string, translate emoji prompt to English for display
+            if isinstance(prompt, str):
+                prompt = self.output_translations.get(prompt, prompt)
+        return prompt if prompt is not None else ''
+
+    def read_line(self, prompt: str) -> str:
+        return input(prompt)
+
+    def clock(self) -> float:
+        return time.time()
+
+    def convert_input(self, raw: str):
+        raw = raw.strip()
+        # Return number if numeric, else string
+        if raw.isdigit() or (raw.startswith('-') and raw[1:].isdigit()):
+            try:
+                return int(raw)
+            except Exception:
+                pass
+        try:
+            return float(raw)
+        except Exception:
+            return raw
+
+    def draw_random(self, lo, hi):
+        lo = flatten(lo)
+        hi = flatten(hi)
+        # Ensure ints
+        try:
+            lo_i = int(lo)
+            hi_i = int(hi)
+        except Exception:
+            raise RuntimeError("RANDOM bounds must be numeric")
+        return self.random.randint(lo_i, hi_i)
+
+    def print_value(self, value):
+        value = flatten(value)
+        # If the program prints a string, translate embedded emoji tokens to English
+        if isinstance(value, str):
+            self.emit(self.translate_output(value))
+        else:
+            self.emit(value)
+
+    def emit(self, text):
+        print(text)
+
     def eval_block(self, statements):
         result = None
         for stmt in statements:
@@ -721,9 +1230,17 @@ class Interpreter:
     def eval_binop(self, op, left, right):
         left_val = self.eval(left)
         right_val = self.eval(right)
-        
-        if op == '+': return left_val + right_val
-        elif op == '-': return left_val - right_val
+        return self.apply_binop(op, left_val, right_val)
+
+    def apply_binop(self, op, left_val, right_val):
+        if op == '+':
+            if type(left_val) is StringBuilder or (
+                    type(left_val) is str and type(right_val) is str and len(left_val) >= StringBuilder.MIN_LENGTH):
+                return StringBuilder.concat(left_val, right_val)
+            return left_val + right_val
+        left_val = flatten(left_val)
+        right_val = flatten(right_val)
+        if op == '-': return left_val - right_val
         elif op == '*': return left_val * right_val
         elif op == '/': return left_val / right_val
         elif op == '==':
@@ -752,7 +1269,10 @@ class Interpreter:
             raise RuntimeError(f"Unknown operator: {op}")
     
     def eval_unop(self, op, expr):
-        val = self.eval(expr)
+        return self.apply_unop(op, self.eval(expr))
+
+    def apply_unop(self, op, val):
+        val = flatten(val)
         if op == '-': return -val
         else:
             raise RuntimeError(f"Unknown operator: {op}")
@@ -761,6 +1281,10 @@ class Interpreter:
         for scope in reversed(self.scopes):
             if name in scope:
                 return scope[name]
+        # Variables and 🎯 functions shadow builtins of the same name
+        builtin = self.builtins.get(name)
+        if builtin is not None:
+            return builtin
         raise NameError(f"❌ Error: Variable '{name}' is not defined. Did you forget to declare it with 📦?")
     
     def set_var(self, name, value):
@@ -778,13 +1302,23 @@ class Interpreter:
                 return
         self.scopes[-1][name] = value
     
+    def register_builtin(self, name: str, func: Callable[..., Any], arity: int, pure: bool = True) -> Builtin:
+        """Make func callable as name(...) from this interpreter only."""
+        builtin = self.builtins[SYMBOLS.intern(name)] = Builtin(name, func, arity, pure)
+        return builtin
+
     def call_function(self, func, args):
+        if type(func) is Builtin:
+            # Native code: no scope to push
+            return func(args)
         if func[0] != 'function':
             raise RuntimeError("Not a function")
         
         params, body = func[1], func[2]
         if len(args) != len(params):
             raise RuntimeError(f"Expected {len(params)} arguments, got {len(args)}")
+        if type(body) is LazyBody:
+            body = body.parse()
         
         new_scope = dict(zip(params, args))
         self.scopes.append(new_scope)
@@ -888,6 +1422,11 @@ demo_program = """
 
 
 if __name__ == "__main__":
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Run the EmojiScript demo program.")
+    arg_parser.add_argument('--seed', type=int, default=None, help="seed for 🎲 so runs are reproducible")
+    args = arg_parser.parse_args()
+
     print("🎉 EmojiScript Interpreter 🎉")
     print("=" * 60)
     print("A programming language using ONLY EMOJIS!\n")
@@ -905,7 +1444,7 @@ if __name__ == "__main__":
         parser = Parser(tokens)
         ast = parser.parse()
         
-        interpreter = Interpreter()
+        interpreter = Interpreter(seed=args.seed)
         result = interpreter.execute(ast)
         
         print("\n" + "=" * 60)
@@ -0,0 +1,144 @@
+import contextlib
+import io
+import os
+import re
+import sys
+import tempfile
+
+from emoji import Lexer, Parser, Interpreter, demo_program
+from ASTArena import ArenaParser, ASTArena, KINDS
+from benchmarks import generate_program
+
+print("=" * 60)
+print("Testing AST Arena")
+print("=" * 60)
+
+
+def parse(code):
+    return Parser(Lexer(code).tokenize()).parse()
+
+
+def run(ast, stdin=''):
+    out = io.StringIO()
+    saved = sys.stdin
+    sys.stdin = io.StringIO(stdin)
+    try:
+        with contextlib.redirect_stdout(out):
+            try:
+                Interpreter(seed=3).execute(ast)
+            except EOFError:
+                print("EOF")
+            except Exception as e:
+                print(f"{type(e).__name__}: {e}")
+    finally:
+        sys.stdin = saved
+    # ⏱️ timings differ from run to run
+    return re.sub(r'Runtime: [0-9.]+ seconds', 'Runtime: … seconds', out.getvalue())
+
+
+library = tempfile.NamedTemporaryFile('w', suffix='.emoji', encoding='utf-8', delete=False)
+library.write("🎯 twice 📥 n 👉\n    ⬅️ n ✖️ 2️⃣\n🔚\n")
+library.close()
+
+every_kind = f"""
+📚 "{library.name}"
+⏱️
+📦 n ➡️ 📝 "number? "
+📦 name ➡️ 📝
+📦 pi ➡️ 3.25
+📦 big ➡️ 123456789012345678901234567890
+📦 flag ➡️ 🚫 ❌ 👨‍👩‍👧 (✅ 👩‍👧 ❌)
+🎯 fact 📥 k 👉
+    ❓ k ⬇️ 2️⃣ 👉
+        ⬅️ 1️⃣
+    ❔ 👉
+        ⬅️ k ✖️ fact(k ➖ 1️⃣)
+    🔚
+🔚
+🎯 hello 👉
+    🖨️ "hi, 👋 " ➕ name
+🔚
+hello()
+🖨️ fact(n) ❌🟰 ➖ 1️⃣
+🔁 n ⬆️ 0️⃣ 👉
+    n ➡️ n ➖ 1️⃣
+    ❓ flag 👉
+        🖨️ n
+    🔚
+🔚
+🔂 3️⃣ 👉
+    🖨️ 🎲 1️⃣ 🔟
+🔚
+🖨️ 🔢 1️⃣ 5️⃣
+🖨️ twice(pi) ➕ big
+⏱️
+"""
+
+samples = {
+    "demo program": (demo_program, "".join(f"{n}\n" for n in range(1, 101))),
+    "benchmark program": (generate_program(20), ""),
+    "every node kind": (every_kind, "5\nworld\n"),
+    "empty program": ("", ""),
+}
+
+try:
+    # Test 1: Tuples -> arena -> tuples is lossless
+    print("\n1. Test tuple round-trip:")
+    used = set()
+    for name, (code, stdin) in samples.items():
+        ast = parse(code)
+        arena = ASTArena.from_tuples(ast)
+        used.update(arena.kind(node) for node in range(len(arena)))
+        if arena.to_tuples() == ast:
+            print(f"✅ {name}: {len(arena)} nodes")
+        else:
+            print(f"❌ {name}: to_tuples() differs from the parsed AST")
+    missing = [kind for kind in KINDS if kind not in used]
+    print(f"✅ Samples cover all {len(KINDS)} node kinds" if not missing else f"❌ Kinds not covered: {missing}")
+
+    # Test 2: to_bytes/from_bytes keeps every array, literal and line
+    print("\n2. Test binary round-trip:")
+    for name, (code, stdin) in samples.items():
+        parser = ArenaParser(Lexer(code).tokenize())
+        arena = parser.parse_arena()
+        loaded = ASTArena.from_bytes(arena.to_bytes())
+        same_arrays = all(getattr(loaded, field) == getattr(arena, field)
+                          for field in ('kinds', 'firsts', 'counts', 'literals', 'lines'))
+        same_literals = [(type(v), v) for v in loaded.literal_table] == [(type(v), v) for v in arena.literal_table]
+        if same_arrays and same_literals and loaded.to_tuples() == parse(code):
+            print(f"✅ {name}: {len(arena.to_bytes())} bytes, lines {sorted(set(loaded.lines))[:5]} ...")
+        else:
+            print(f"❌ {name}: arrays {same_arrays}, literals {same_literals}")
+
+    # Test 3: A round-tripped AST runs exactly like the parsed one
+    print("\n3. Test execution after round-trips:")
+    for name, (code, stdin) in samples.items():
+        expected = run(parse(code), stdin)
+        via_tuples = run(ASTArena.from_tuples(parse(code)).to_tuples(), stdin)
+        via_bytes = run(ASTArena.from_bytes(ASTArena.from_tuples(parse(code)).to_bytes()).to_tuples(), stdin)
+        if via_tuples == expected and via_bytes == expected:
+            print(f"✅ {name}: {expected.split()[-3:]}")
+        else:
+            print(f"❌ {name}: {via_bytes!r}, parsed AST printed {expected!r}")
+
+    # Test 4: Lazily parsed 🎯 bodies convert like eager ones
+    print("\n4. Test lazy bodies:")
+    lazy = Parser(Lexer(every_kind).tokenize(), lazy=True).parse()
+    arena = ASTArena.from_tuples(lazy)
+    print("✅ Same arena as the eager AST" if arena.to_tuples() == parse(every_kind) else "❌ Lazy AST differs")
+
+    # Test 5: Bad input is rejected
+    print("\n5. Test corrupt data:")
+    data = ASTArena.from_tuples(parse(demo_program)).to_bytes()
+    for label, bad in (("bad magic", b'XXXX' + data[4:]), ("bad version", data[:4] + b'\x09\x00' + data[6:])):
+        try:
+            ASTArena.from_bytes(bad)
+            print(f"❌ {label}: should have raised an error!")
+        except ValueError as e:
+            print(f"✅ {label}: {e}")
+finally:
+    os.unlink(library.name)
+
+print("\n" + "=" * 60)
+print("AST Arena Tests Complete")
+print("=" * 60)
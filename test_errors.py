@@ -71,6 +71,22 @@ try:
 except Exception as e:
     print(f"❌ Unexpected error: {e}")
 
+# Test 5: Bad arguments to a builtin are reported as EmojiScript errors
+print("\n5. Test invalid builtin arguments:")
+for test5 in ("🖨️ 🌱(2.5)", "🖨️ 🌱(➖1️⃣)", "🖨️ 🧮(3️⃣)"):
+    try:
+        lexer = Lexer(test5)
+        tokens = lexer.tokenize()
+        parser = Parser(tokens)
+        ast = parser.parse()
+        interpreter = Interpreter()
+        interpreter.execute(ast)
+        print("❌ Should have raised an error!")
+    except RuntimeError as e:
+        print(f"✅ Caught error: {e}")
+    except Exception as e:
+        print(f"❌ Unwrapped {type(e).__name__}: {e}")
+
 print("\n" + "=" * 60)
 print("Error Handling Tests Complete")
 print("=" * 60)
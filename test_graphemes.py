@@ -0,0 +1,103 @@
+import sys
+import threading
+
+from emoji import SYMBOLS, Lexer, Parser, Interpreter
+from MmapLexer import MmapLexer
+from ParallelLexer import ParallelLexer
+
+print("=" * 60)
+print("Testing Grapheme Identifiers and Symbols")
+print("=" * 60)
+
+
+def lex(code):
+    return [(t.type, t.value) for t in Lexer(code).tokenize()[:-1]]
+
+
+# Test 1: Identifiers are whole grapheme clusters
+print("\n1. Test grapheme clusters:")
+cases = {
+    "ZWJ sequence": ("👩‍💻", [('ID', '👩‍💻')]),
+    "ZWJ sequence starting with a keyword": ("👨‍👩‍👧‍👦", [('ID', '👨‍👩‍👧‍👦')]),
+    "ZWJ before ASCII": ("👩‍\"x\"", [('ID', '👩‍'), ('STR', 'x')]),
+    "skin tones": ("👍🏽 👍🏿 👍", [('ID', '👍🏽'), ('ID', '👍🏿'), ('ID', '👍')]),
+    "variation selector": ("⭐️ ⭐", [('ID', '⭐️'), ('ID', '⭐')]),
+    "emoji with VS and ZWJ": ("🏳️‍🌈", [('ID', '🏳️‍🌈')]),
+    "flags": ("🇳🇱🇧🇪", [('ID', '🇳🇱'), ('ID', '🇧🇪')]),
+    "keycaps": ("#️⃣ *️⃣ 1️⃣2️⃣", [('ID', '#️⃣'), ('ID', '*️⃣'), ('NUM', 12)]),
+    "keywords": ("👨‍👩‍👧 👩‍👧 ❌🟰 ⬆️", [('AND', '👨‍👩‍👧'), ('OR', '👩‍👧'), ('NEQ', '❌🟰'), ('GT', '⬆️')]),
+}
+for name, (code, expected) in cases.items():
+    actual = lex(code)
+    if actual != expected:
+        print(f"❌ {name}: {actual}")
+    elif [(t.type, t.value) for t in MmapLexer(code.encode('utf-8')).tokenize()[:-1]] != expected:
+        print(f"❌ {name}: MmapLexer differs from Lexer")
+    else:
+        print(f"✅ {name}: {[value for _, value in actual]}")
+
+# Test 2: Cluster names work as variables
+print("\n2. Test cluster variables:")
+code = "📦 👩‍💻 ➡️ 1️⃣\n📦 👩 ➡️ 2️⃣\n📦 👍🏽 ➡️ 3️⃣\n📦 #️⃣ ➡️ 4️⃣\n🖨️ 👩‍💻 ➕ 👩 ➕ 👍🏽 ➕ #️⃣\n"
+output = []
+interpreter = Interpreter()
+interpreter.emit = output.append
+try:
+    interpreter.execute(Parser(Lexer(code).tokenize()).parse())
+    print(f"{'✅' if output == [10] else '❌'} Printed {output}")
+except Exception as e:
+    print(f"❌ Unexpected error: {e}")
+
+# Test 3: Every lexer returns the interned name
+print("\n3. Test interning:")
+first = Lexer("🦄‍🔥")
+second = MmapLexer("🦄‍🔥".encode('utf-8'))
+names = [first.tokenize()[0].value, second.tokenize()[0].value, SYMBOLS.intern("🦄" + "‍🔥")]
+print("✅ Lexer, MmapLexer and intern() agree" if all(n is names[0] for n in names) else "❌ Names are not identical")
+big = "".join(f"📦 v{i} ➡️ 🐉\n" for i in range(8000))
+serial = [t.value for t in Lexer(big).tokenize() if t.type == 'ID']
+parallel = [t.value for t in ParallelLexer(big, workers=2).tokenize() if t.type == 'ID']
+if parallel == serial and all(a is b for a, b in zip(parallel, serial)):
+    print(f"✅ ParallelLexer returned {len(parallel)} interned names")
+else:
+    print("❌ ParallelLexer names are not interned")
+
+# Test 4: clear() drops ids but keeps live names identical
+print("\n4. Test clear():")
+kept = names[0]
+SYMBOLS.clear()
+if len(SYMBOLS) == 0 and SYMBOLS.intern("🦄" + "‍🔥") is kept and SYMBOLS.id_of(kept) == 0:
+    print("✅ Live names still intern to the same object")
+else:
+    print("❌ clear() broke interning")
+
+# Test 5: Threads interning the same new names agree on one id each
+print("\n5. Test concurrent interning:")
+new_names = [f"thread-{i}" for i in range(5000)]
+results = []
+
+
+def worker():
+    results.append([SYMBOLS.intern("".join(name)) for name in new_names])
+
+
+interval = sys.getswitchinterval()
+sys.setswitchinterval(1e-6)
+try:
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+finally:
+    sys.setswitchinterval(interval)
+consistent = all(SYMBOLS.name_of(SYMBOLS.ids[name]) is name for name in SYMBOLS.names)
+if consistent and len(SYMBOLS.ids) == len(SYMBOLS.names) and all(
+        all(a is b for a, b in zip(result, results[0])) for result in results):
+    print(f"✅ {len(SYMBOLS)} names, one id each")
+else:
+    print("❌ Threads got different names or ids")
+
+print("\n" + "=" * 60)
+print("Grapheme Identifier Tests Complete")
+print("=" * 60)
@@ -0,0 +1,62 @@
+from emoji import Lexer, Parser, demo_program
+from IncrementalParser import IncrementalParser
+
+print("=" * 60)
+print("Testing Incremental Parsing")
+print("=" * 60)
+
+
+def full_parse(code):
+    return Parser(Lexer(code).tokenize()).parse()
+
+
+def check(name, front, start, end, text):
+    expected_code = front.code[:start] + text + front.code[end:]
+    try:
+        ast = front.apply_edit(start, end, text)
+    except SyntaxError as e:
+        ast = e
+    try:
+        expected = full_parse(expected_code)
+    except SyntaxError as e:
+        expected = e
+    if isinstance(ast, SyntaxError) and isinstance(expected, SyntaxError):
+        print(f"✅ {name}: both raised SyntaxError ({front.last_edit['level']})")
+    elif ast == expected:
+        print(f"✅ {name}: matches full re-parse ({front.last_edit['level']})")
+    else:
+        print(f"❌ {name}: AST differs from full re-parse")
+
+
+front = IncrementalParser(demo_program)
+
+# Test 1: Edit a statement deep inside the game loop
+print("\n1. Test edit inside a nested block:")
+pos = front.code.index('🖨️ "📈❌"')
+check("nested edit", front, pos, pos + len('🖨️ "📈❌"'), '🖨️ 🔒')
+
+# Test 2: Insert a new statement line
+print("\n2. Test inserting a line:")
+pos = front.code.index('📦 🟣')
+check("insert line", front, pos, pos, '📦 🔴 ➡️ 5️⃣\n')
+
+# Test 3: Break the block structure, then repair it
+print("\n3. Test removing and restoring a 🔚:")
+pos = front.code.index('🔚  💭 End of while loop')
+check("remove 🔚", front, pos, pos + len('🔚'), '')
+check("restore 🔚", front, pos, pos, '🔚')
+
+# Test 4: Token line numbers after a multi-line insert
+print("\n4. Test line numbers after inserting lines:")
+front.apply_edit(0, 0, '\n\n\n')
+expected_lines = [t.line for t in Lexer(front.code).tokenize()]
+if [t.line for t in front.tokens] == expected_lines:
+    print("✅ Token lines match a full re-lex")
+else:
+    print("❌ Token lines differ from a full re-lex")
+
+print(f"\nLatency: {front.latency_stats()}")
+
+print("\n" + "=" * 60)
+print("Incremental Parsing Tests Complete")
+print("=" * 60)
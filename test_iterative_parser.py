@@ -0,0 +1,54 @@
+from emoji import Lexer, Parser, demo_program
+from IterativeParser import IterativeParser
+
+print("=" * 60)
+print("Testing Iterative Parser")
+print("=" * 60)
+
+
+def parse_both(code):
+    results = []
+    for parser_cls in (Parser, IterativeParser):
+        try:
+            results.append(parser_cls(Lexer(code).tokenize()).parse())
+        except SyntaxError as e:
+            results.append(f"SyntaxError: {e}")
+    return results
+
+
+# Test 1: Same AST as the recursive parser
+print("\n1. Test identical ASTs:")
+programs = {
+    "demo program": demo_program,
+    "precedence": "🖨️ 🚫 1️⃣ ➕ 2️⃣ ✖️ ➖ 3️⃣ 🟰 4️⃣ 🤝 ✅ 👩‍👧 ❌",
+    "calls and builtins": "📦 x ➡️ f(🔢 1️⃣ 5️⃣ 🎲 1️⃣ 🔟)(📝 \"🔢➡️\")",
+    "function def": "🎯 add 📥 a b 👉\n    ⬅️ a ➕ b\n🔚\n🖨️ add(1️⃣ 2️⃣)",
+}
+for name, code in programs.items():
+    recursive, iterative = parse_both(code)
+    if recursive == iterative:
+        print(f"✅ {name}: identical")
+    else:
+        print(f"❌ {name}: ASTs differ")
+
+# Test 2: Same error messages
+print("\n2. Test identical syntax errors:")
+for code in ["🖨️ 1️⃣ ➕", "🖨️ (1️⃣ 🟰 2️⃣ 🟰 3️⃣)", "❓ ✅ 👉 🖨️ 1️⃣", "🖨️ 1️⃣ ➕ 🚫 ✅"]:
+    recursive, iterative = parse_both(code)
+    if recursive == iterative:
+        print(f"✅ Same result: {iterative}")
+    else:
+        print(f"❌ Different results: {recursive} vs {iterative}")
+
+# Test 3: Deep nesting does not hit the recursion limit
+print("\n3. Test deep nesting:")
+deep = "🖨️ " + "(" * 3000 + "1" + ")" * 3000 + "\n" + "❓ ✅ 👉\n" * 3000 + "🔚\n" * 3000
+try:
+    IterativeParser(Lexer(deep).tokenize()).parse()
+    print("✅ Parsed 3000 nested parentheses and blocks")
+except RecursionError:
+    print("❌ Hit RecursionError")
+
+print("\n" + "=" * 60)
+print("Iterative Parser Tests Complete")
+print("=" * 60)
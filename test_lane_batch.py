@@ -0,0 +1,46 @@
+from emoji import Lexer, Parser
+from LaneBatch import LaneBatch, LaneInterpreter, numpy
+
+print("=" * 60)
+print("Testing Lane Batches")
+print("=" * 60)
+
+
+def outcome(result):
+    return result.output, type(result.error).__name__ if result.error else None
+
+
+def check(name, code, inputs):
+    """Compare every backend against running each lane on its own."""
+    ast = Parser(Lexer(code).tokenize()).parse()
+    expected = [outcome(LaneInterpreter(row).run(ast)) for row in inputs]
+    backends = ('python', 'numpy') if numpy is not None else ('python',)
+    for backend in backends:
+        batch = LaneBatch(inputs, backend)
+        actual = [outcome(result) for result in batch.run(ast)]
+        if actual != expected:
+            print(f"❌ {name} ({backend}): {actual}, per-lane runs gave {expected}")
+        elif not batch.vectorized:
+            print(f"❌ {name} ({backend}): fell back to per-lane execution")
+        else:
+            print(f"✅ {name} ({backend}): {[output for output, _ in actual]}")
+
+
+# Test 1: Lanes of one program agree with separate runs
+print("\n1. Test arithmetic lanes:")
+check("sum and product", "📦 a ➡️ 📝\n📦 b ➡️ 📝\n🖨️ a ➕ b\n🖨️ a ✖️ b",
+      [['1', '2'], ['2.5', '4'], ['-3', '0.5']])
+
+# Test 2: An int 0 stored in a float column stays 0 when negated or multiplied
+print("\n2. Test signed zeros in mixed lanes:")
+check("negated int 0", "📦 a ➡️ 📝\n🖨️ (➖ a) ➗ 1️⃣", [['0'], ['2.5']])
+check("int 0 times negative", "📦 a ➡️ 📝\n🖨️ (a ✖️ (➖ 2️⃣)) ➗ 1️⃣", [['0'], ['2.5']])
+check("negated float 0.0", "📦 a ➡️ 📝\n🖨️ (➖ a) ➗ 1️⃣", [['0.0'], ['2']])
+
+# Test 3: A lane that fails is retired and rerun on its own
+print("\n3. Test retired lanes:")
+check("division by zero", "📦 a ➡️ 📝\n🖨️ 6️⃣ ➗ a", [['2'], ['0'], ['1.5']])
+
+print("\n" + "=" * 60)
+print("Lane Batch Tests Complete")
+print("=" * 60)
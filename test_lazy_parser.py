@@ -0,0 +1,155 @@
+import contextlib
+import io
+import sys
+import threading
+
+from emoji import Lexer, Parser, Interpreter, LazyBody
+from LoopOptimizer import LoopOptimizingInterpreter
+from ParallelRepeat import ParallelInterpreter
+from StackInterpreter import StackInterpreter
+from Suspendable import SuspendableInterpreter
+
+print("=" * 60)
+print("Testing Lazy 🎯 Bodies")
+print("=" * 60)
+
+
+def parse(code, lazy):
+    return Parser(Lexer(code).tokenize(), lazy=lazy).parse()
+
+
+def run(interpreter, ast):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        try:
+            interpreter.execute(ast)
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}")
+    return out.getvalue()
+
+
+def run_suspendable(ast):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        try:
+            for _ in SuspendableInterpreter().run(ast):
+                pass
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}")
+    return out.getvalue()
+
+
+program = """
+🎯 fact 📥 n 👉
+    ❓ n ⬇️ 2️⃣ 👉
+        ⬅️ 1️⃣
+    ❔ 👉
+        ⬅️ n ✖️ fact(n ➖ 1️⃣)
+    🔚
+🔚
+🎯 outer 👉
+    🎯 inner 📥 x 👉
+        ⬅️ x ➕ 1️⃣
+    🔚
+    ⬅️ inner(4️⃣)
+🔚
+🖨️ fact(5️⃣)
+🖨️ outer()
+"""
+
+# Test 1: Lazy and eager parsing give the same AST and output
+print("\n1. Test lazy parse matches eager parse:")
+eager = parse(program, False)
+if parse(program, True) == eager:
+    print("✅ ASTs match")
+else:
+    print("❌ ASTs differ")
+expected = run(Interpreter(), eager)
+for name, engine in (("Interpreter", Interpreter), ("StackInterpreter", StackInterpreter),
+                     ("LoopOptimizingInterpreter", LoopOptimizingInterpreter)):
+    actual = run(engine(), parse(program, True))
+    print(f"{'✅' if actual == expected else '❌'} {name}: {actual.split()}")
+actual = run_suspendable(parse(program, True))
+print(f"{'✅' if actual == expected else '❌'} SuspendableInterpreter: {actual.split()}")
+
+# Test 2: A broken body that is never called does not stop the program
+print("\n2. Test uncalled broken function:")
+broken = "🎯 f 👉\n    🖨️ (\n🔚\n❓ ✅ 👉\n    🎯 g 👉\n        🖨️ (\n    🔚\n🔚\n🖨️ 1️⃣\n"
+for name, execute in (("Interpreter", lambda ast: run(Interpreter(), ast)),
+                      ("StackInterpreter", lambda ast: run(StackInterpreter(), ast)),
+                      ("LoopOptimizingInterpreter", lambda ast: run(LoopOptimizingInterpreter(), ast)),
+                      ("SuspendableInterpreter", run_suspendable)):
+    ast = parse(broken, True)
+    output = execute(ast)
+    if output == "1\n" and isinstance(ast[0][3], LazyBody) and ast[0][3].statements is None:
+        print(f"✅ {name}: ran without parsing f")
+    else:
+        print(f"❌ {name}: {output!r}")
+
+# Test 3: validate() reports the syntax error up front
+print("\n3. Test validate():")
+parser = Parser(Lexer(broken).tokenize(), lazy=True)
+parser.parse()
+try:
+    parser.validate()
+    print("❌ Should have raised an error!")
+except SyntaxError as e:
+    print(f"✅ Caught error: {e}")
+
+# Test 4: Threads calling the same function for the first time share one parse
+print("\n4. Test concurrent first calls:")
+library = "".join(f"🎯 f{i} 📥 n 👉\n    📦 t ➡️ n\n    🔂 2️⃣ 👉\n        t ➡️ t ➕ {i}\n    🔚\n    ⬅️ t\n🔚\n"
+                  for i in range(200))
+calls = "".join(f"🖨️ f{i}({i})\n" for i in range(200))
+expected = run(Interpreter(), parse(library + calls, False))
+failures = []
+
+
+def worker(ast):
+    interpreter = Interpreter()
+    interpreter.execute(ast[:200])
+    output = []
+    interpreter.emit = output.append
+    try:
+        interpreter.execute(ast[200:])
+    except Exception as e:
+        output.append(f"{type(e).__name__}: {e}")
+    if "".join(f"{line}\n" for line in output) != expected:
+        failures.append(output)
+
+
+interval = sys.getswitchinterval()
+sys.setswitchinterval(1e-6)
+try:
+    for _ in range(5):
+        ast = parse(library + calls, True)
+        threads = [threading.Thread(target=worker, args=(ast,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+finally:
+    sys.setswitchinterval(interval)
+if failures:
+    print(f"❌ {len(failures)} threads saw a corrupted parse")
+else:
+    print("✅ All threads got the same output")
+
+# Test 5: Lazy bodies in the scopes can be sent to ParallelInterpreter workers
+print("\n5. Test ParallelInterpreter:")
+loop = "📦 t ➡️ 0️⃣\n🔂 1000 👉\n    t ➡️ t ➕ f(3️⃣)\n🔚\n🖨️ t\n"
+cases = {
+    "uncalled function": "🎯 g 👉\n    ⬅️ 1️⃣\n🔚\n🎯 f 📥 x 👉\n    ⬅️ x ✖️ 2️⃣\n🔚\n" + loop,
+    "uncalled broken function": "🎯 g 👉\n    🖨️ (\n🔚\n🎯 f 📥 x 👉\n    ⬅️ x ✖️ 2️⃣\n🔚\n" + loop,
+}
+for name, code in cases.items():
+    with ParallelInterpreter(workers=2, min_iterations=10) as interpreter:
+        output = run(interpreter, parse(code, True))
+    if output == "6000\n":
+        print(f"✅ {name}: {interpreter.parallel_stats}")
+    else:
+        print(f"❌ {name}: {output!r}")
+
+print("\n" + "=" * 60)
+print("Lazy 🎯 Body Tests Complete")
+print("=" * 60)
@@ -0,0 +1,97 @@
+import contextlib
+import io
+import re
+import sys
+
+from emoji import Lexer, Parser, Interpreter, demo_program
+from LoopOptimizer import LoopOptimizingInterpreter
+from benchmarks import generate_program
+
+print("=" * 60)
+print("Testing Loop Optimizer")
+print("=" * 60)
+
+
+def run(interpreter, code, stdin=''):
+    out = io.StringIO()
+    saved = sys.stdin
+    sys.stdin = io.StringIO(stdin)
+    try:
+        with contextlib.redirect_stdout(out):
+            try:
+                interpreter.execute(Parser(Lexer(code).tokenize()).parse())
+            except EOFError:
+                print("EOF")
+            except Exception as e:
+                print(f"{type(e).__name__}: {e}")
+    finally:
+        sys.stdin = saved
+    # ⏱️ timings differ from run to run
+    return re.sub(r'Runtime: [0-9.]+ seconds', 'Runtime: … seconds', out.getvalue())
+
+
+def check(name, code, stdin='', rewritten=None):
+    """Compare LoopOptimizingInterpreter with Interpreter; rewritten is the stat that must be non-zero."""
+    expected = run(Interpreter(seed=1), code, stdin)
+    interpreter = LoopOptimizingInterpreter(seed=1)
+    actual = run(interpreter, code, stdin)
+    stats = interpreter.optimizer.stats
+    if actual != expected:
+        print(f"❌ {name}: {actual!r}, Interpreter printed {expected!r}")
+    elif rewritten is not None and not stats[rewritten]:
+        print(f"❌ {name}: expected a {rewritten} rewrite, got {stats}")
+    else:
+        print(f"✅ {name}: {actual.split()[-3:]} {stats}")
+
+
+# Test 1: Sample programs
+print("\n1. Test sample programs:")
+check("demo program", demo_program, "0\n11\nabc\n1\n2\n3\n4\n5\n6\n7\n8\n9\n10\n")
+check("generated blocks", generate_program(50), rewritten='repeat')
+check("counted 🔁", "📦 🟢 ➡️ 0️⃣\n📦 total ➡️ 0️⃣\n🔁 🟢 ⬇️ 1000 👉\n    total ➡️ total ➕ 🟢\n"
+      "    🟢 ➡️ 🟢 ➕ 1️⃣\n🔚\n🖨️ total\n🖨️ 🟢\n", rewritten='counted')
+check("invariant 🔂", "📦 w ➡️ 7️⃣\n📦 h ➡️ 9️⃣\n📦 total ➡️ 0️⃣\n🔂 100 👉\n"
+      "    total ➡️ total ➕ ( w ✖️ h ➖ 1️⃣ ) ➗ ( h ➕ w )\n🔚\n🖨️ total\n", rewritten='hoisted')
+
+# Test 2: Counted loop edge cases
+print("\n2. Test counted 🔁 edge cases:")
+check("step past the bound", "📦 i ➡️ 0️⃣\n🔁 i ⬇️ 10 👉\n    🖨️ i\n    i ➡️ i ➕ 3️⃣\n🔚\n🖨️ i\n",
+      rewritten='counted')
+check("counting down", "📦 i ➡️ 10\n🔁 i ⬆️ 2.5 👉\n    🖨️ i\n    i ➡️ i ➖ 2️⃣\n🔚\n🖨️ i\n", rewritten='counted')
+check("never entered", "📦 i ➡️ 5️⃣\n🔁 i ⬇️ 5️⃣ 👉\n    🖨️ i\n    i ➡️ i ➕ 1️⃣\n🔚\n🖨️ i\n")
+check("float start", "📦 i ➡️ 0.5\n🔁 i ⬇️ 3️⃣ 👉\n    🖨️ i\n    i ➡️ i ➕ 1️⃣\n🔚\n🖨️ i\n")
+check("string bound", "📦 i ➡️ 0️⃣\n🔁 i ⬇️ \"a\" 👉\n    i ➡️ i ➕ 1️⃣\n🔚\n")
+check("return from counted loop", "🎯 find 📥 n 👉\n    📦 i ➡️ 0️⃣\n    🔁 i ⬇️ 100 👉\n"
+      "        ❓ i ✖️ i ⬆️ n 👉\n            ⬅️ i\n        🔚\n        i ➡️ i ➕ 1️⃣\n    🔚\n    ⬅️ ➖ 1️⃣\n🔚\n"
+      "🖨️ find(50)\n🖨️ find(100000)\n")
+
+# Test 3: Variables the loop body assigns are not hoisted
+print("\n3. Test loop-variant assignments:")
+check("bound assigned in body", "📦 i ➡️ 0️⃣\n📦 n ➡️ 10\n🔁 i ⬇️ n 👉\n    n ➡️ n ➖ 1️⃣\n"
+      "    i ➡️ i ➕ 1️⃣\n🔚\n🖨️ i\n🖨️ n\n")
+check("induction variable assigned twice", "📦 i ➡️ 0️⃣\n🔁 i ⬇️ 10 👉\n    ❓ i 🟰 3️⃣ 👉\n        i ➡️ 7️⃣\n    🔚\n"
+      "    🖨️ i\n    i ➡️ i ➕ 1️⃣\n🔚\n")
+check("operand assigned after use", "📦 w ➡️ 1️⃣\n📦 t ➡️ 0️⃣\n🔂 5️⃣ 👉\n    t ➡️ t ➕ w ✖️ 2️⃣\n"
+      "    w ➡️ w ➕ 1️⃣\n🔚\n🖨️ t\n")
+check("operand assigned in a nested loop", "📦 w ➡️ 1️⃣\n📦 t ➡️ 0️⃣\n🔂 3️⃣ 👉\n    t ➡️ t ➕ w ✖️ 2️⃣\n"
+      "    🔂 2️⃣ 👉\n        w ➡️ w ➕ 1️⃣\n    🔚\n🔚\n🖨️ t\n")
+check("invariant that raises", "📦 z ➡️ 0️⃣\n🔂 0️⃣ 👉\n    🖨️ 1️⃣ ➗ z\n🔚\n🔂 3️⃣ 👉\n    🖨️ \"before\"\n"
+      "    🖨️ 1️⃣ ➗ z\n🔚\n")
+
+# Test 4: 🎯 calls can change the caller's variables, so their loops are left alone
+print("\n4. Test 🎯 calls inside loops:")
+check("call assigns an operand", "📦 w ➡️ 1️⃣\n🎯 bump 👉\n    w ➡️ w ➕ 1️⃣\n🔚\n📦 t ➡️ 0️⃣\n"
+      "🔂 4️⃣ 👉\n    t ➡️ t ➕ w ✖️ 2️⃣\n    bump()\n🔚\n🖨️ t\n", rewritten='skipped')
+check("call in the condition", "📦 i ➡️ 0️⃣\n🎯 limit 👉\n    i ➡️ i ➕ 1️⃣\n    ⬅️ 10\n🔚\n"
+      "🔁 i ⬇️ limit() 👉\n    🖨️ i\n    i ➡️ i ➕ 1️⃣\n🔚\n", rewritten='skipped')
+check("🎯 defined in the body", "📦 t ➡️ 0️⃣\n🔂 3️⃣ 👉\n    🎯 f 👉\n        ⬅️ t\n    🔚\n"
+      "    t ➡️ f() ➕ 1️⃣\n🔚\n🖨️ t\n", rewritten='skipped')
+check("pure builtin", "📦 w ➡️ ➖ 7️⃣\n📦 t ➡️ 0️⃣\n🔂 5️⃣ 👉\n    t ➡️ t ➕ 📐(w)\n🔚\n🖨️ t\n", rewritten='hoisted')
+check("shadowed builtin", "🎯 📐 📥 x 👉\n    ⬅️ x ➕ 1️⃣\n🔚\n📦 t ➡️ 0️⃣\n🔂 5️⃣ 👉\n"
+      "    t ➡️ t ➕ 📐(2️⃣)\n🔚\n🖨️ t\n", rewritten='skipped')
+check("loop inside a 🎯", "🎯 sum 📥 n 👉\n    📦 t ➡️ 0️⃣\n    📦 i ➡️ 0️⃣\n    🔁 i ⬇️ n 👉\n"
+      "        t ➡️ t ➕ i\n        i ➡️ i ➕ 1️⃣\n    🔚\n    ⬅️ t\n🔚\n🖨️ sum(10)\n🖨️ sum(0️⃣)\n", rewritten='counted')
+
+print("\n" + "=" * 60)
+print("Loop Optimizer Tests Complete")
+print("=" * 60)
@@ -0,0 +1,47 @@
+import contextlib
+import io
+
+from MemoryProfiler import MemoryProfiler
+
+print("=" * 60)
+print("Testing Memory Profiler")
+print("=" * 60)
+
+
+def profile(code):
+    profiler = MemoryProfiler()
+    with contextlib.redirect_stdout(io.StringIO()):
+        profiler.profile(code)
+    return profiler
+
+
+# Test 1: A statement that allocates nothing reports no net memory
+print("\n1. Test non-allocating line:")
+profiler = profile("📦 a ➡️ 0️⃣\n🔂 10000 👉\n    a ➡️ 1️⃣\n🔚\n")
+usage = profiler.lines[3]
+if usage.hits == 10000 and abs(usage.net) <= 64:
+    print(f"✅ a ➡️ 1️⃣ ran {usage.hits} times, net {usage.net} B")
+else:
+    print(f"❌ a ➡️ 1️⃣ ran {usage.hits} times, net {usage.net} B (expected ~0 B)")
+
+# Test 2: Memory a line keeps alive is attributed to it
+print("\n2. Test allocating line:")
+profiler = profile("📦 s ➡️ 🔢 1️⃣ 1000\n")
+usage = profiler.lines[1]
+if usage.net >= 1000 * 8:
+    print(f"✅ 🔢 1️⃣ 1000 retains {usage.net} B")
+else:
+    print(f"❌ 🔢 1️⃣ 1000 retains only {usage.net} B")
+
+# Test 3: Every ⏱️ keeps its own line, although the parser shares one ('timer',) node
+print("\n3. Test ⏱️ lines:")
+profiler = profile("⏱️\n📦 a ➡️ 1️⃣\n⏱️\n")
+hits = {line: profiler.lines[line].hits if line in profiler.lines else 0 for line in (1, 3)}
+if hits == {1: 1, 3: 1}:
+    print("✅ Both ⏱️ lines counted once")
+else:
+    print(f"❌ ⏱️ hits by line: {hits}")
+
+print("\n" + "=" * 60)
+print("Memory Profiler Tests Complete")
+print("=" * 60)
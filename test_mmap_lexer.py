@@ -0,0 +1,84 @@
+import os
+import tempfile
+
+from emoji import Lexer, Parser, demo_program
+from MmapLexer import MmapLexer
+from benchmarks import generate_program
+
+print("=" * 60)
+print("Testing MmapLexer")
+print("=" * 60)
+
+
+def stream(tokens):
+    return [(t.type, t.value, t.line) for t in tokens]
+
+
+samples = {
+    "demo program": demo_program,
+    "benchmark program": generate_program(20),
+    "strings and comments": "💭 a comment ➕ 1️⃣\n📦 s ➡️ \"two\\\"words\" ➕ 'it\\'s'\n🖨️ s 💭 trailing\n",
+    "numbers": "🖨️ 1️⃣0️⃣0️⃣ ➕ 🔟 ➕ 42 ➕ 3.25 ➕ ٣\n",
+    "identifiers": "📦 snake_case ➡️ 1️⃣\n📦 naïve2 ➡️ 2️⃣\n📦 👩‍💻 ➡️ snake_case ➕ naïve2\n",
+    "no trailing newline": "🖨️ \"end\"",
+    "unterminated string": "🖨️ \"open\n🖨️ 1️⃣\n",
+    "empty": "",
+}
+
+# Test 1: The token stream matches emoji.Lexer
+print("\n1. Test token streams:")
+for name, code in samples.items():
+    expected = stream(Lexer(code).tokenize())
+    actual = stream(MmapLexer(code.encode('utf-8')).tokenize())
+    if actual == expected:
+        print(f"✅ {name}: {len(actual)} tokens")
+    else:
+        mismatch = next((i for i, (a, b) in enumerate(zip(actual, expected)) if a != b), min(len(actual), len(expected)))
+        print(f"❌ {name}: token {mismatch} is {actual[mismatch:mismatch + 1]}, Lexer gave {expected[mismatch:mismatch + 1]}")
+
+# Test 2: Reading through an mmapped file
+print("\n2. Test MmapLexer.open:")
+for name in ("demo program", "empty"):
+    with tempfile.NamedTemporaryFile('w', suffix='.emoji', encoding='utf-8', delete=False) as f:
+        f.write(samples[name])
+    try:
+        with MmapLexer.open(f.name) as lexer:
+            actual = stream(lexer.tokenize())
+            ast = Parser(lexer.tokens).parse()
+        expected = Lexer(samples[name]).tokenize()
+        if actual == stream(expected) and ast == Parser(expected).parse():
+            print(f"✅ {name}: same tokens and AST from the file")
+        else:
+            print(f"❌ {name}: file tokens differ from Lexer")
+    finally:
+        os.unlink(f.name)
+
+# Test 3: A malformed number fails when its value is read, not in tokenize()
+print("\n3. Test lazy number errors:")
+code = "📦 x ➡️ 1.2.3\n"
+try:
+    Lexer(code).tokenize()
+    print("❌ Lexer should have raised an error!")
+except ValueError as e:
+    print(f"✅ Lexer raises in tokenize(): {e}")
+try:
+    tokens = MmapLexer(code.encode('utf-8')).tokenize()
+    print(f"✅ MmapLexer.tokenize() succeeds: {[t.type for t in tokens]}")
+except ValueError as e:
+    tokens = None
+    print(f"❌ MmapLexer.tokenize() raised: {e}")
+if tokens:
+    try:
+        tokens[3].value
+        print("❌ Reading the value should have raised an error!")
+    except ValueError as e:
+        print(f"✅ Reading the value raises: {e}")
+    try:
+        Parser(tokens).parse()
+        print("❌ Parsing should have raised an error!")
+    except ValueError as e:
+        print(f"✅ Parser raises: {e}")
+
+print("\n" + "=" * 60)
+print("MmapLexer Tests Complete")
+print("=" * 60)
@@ -0,0 +1,91 @@
+from emoji import Lexer, Parser
+from ParallelLexer import MIN_PARALLEL_SIZE, ParallelLexer, split_chunks
+
+print("=" * 60)
+print("Testing Parallel Lexer")
+print("=" * 60)
+
+
+def stream(tokens):
+    return [(t.type, t.value, t.line) for t in tokens]
+
+
+def string_spans(code):
+    """(start, end) of every string literal, scanning the way the Lexer does."""
+    spans = []
+    pos = 0
+    while pos < len(code):
+        if code.startswith("💭", pos):
+            pos = code.find("\n", pos)
+            if pos < 0:
+                break
+        elif code[pos] in "\"'":
+            start, quote = pos, code[pos]
+            pos += 1
+            while pos < len(code) and code[pos] != quote:
+                pos += 2 if code[pos] == "\\" else 1
+            spans.append((start, pos + 1))
+        pos += 1
+    return spans
+
+
+def block(i):
+    """A few lines with multi-line strings and comments that look like strings."""
+    lines = "\n".join(f"line {j} of {i} 💭 not a comment 'nor a quote" for j in range(i % 7 + 2))
+    return (f"📦 s{i} ➡️ \"{lines}\n\\\"still inside\\\"\n\"\n"
+            f"💭 comment {i} with \"a quote and 'another\n"
+            f"📦 t{i} ➡️ 'single\n\\'quoted\\'\n{i}' ➕ \"back\\\nslash\"\n"
+            f"🖨️ s{i} ➕ t{i} 💭 trailing \"\n")
+
+
+programs = {}
+code = ""
+i = 0
+while len(code) < 3 * MIN_PARALLEL_SIZE:
+    code += block(i)
+    i += 1
+programs["strings and comments"] = code
+programs["unterminated string at the end"] = code + "🖨️ \"never closed\n" + "\n".join("x" * 80 for _ in range(900))
+programs["no trailing newline"] = code.rstrip("\n")
+programs["one long string"] = "🖨️ \"" + "\n".join("a" * 100 for _ in range(1500)) + "\"\n🖨️ 1️⃣\n"
+
+# Test 1: Cut points are newlines outside strings, with the Lexer's line numbers
+print("\n1. Test chunk boundaries:")
+code = programs["strings and comments"]
+strings = string_spans(code)
+chunks = split_chunks(code, 8)
+naive = [code.index("\n", len(code) * k // 8) for k in range(1, 8)]
+inside = sum(1 for cut in naive if any(start < cut < end for start, end in strings))
+cut_inside = [start for start, _, _ in chunks if any(s < start < e for s, e in strings)]
+wrong_lines = [(start, line) for start, _, line in chunks if Lexer(code[:start]).tokenize()[-1].line != line]
+if not cut_inside and not wrong_lines:
+    print(f"✅ {len(chunks)} chunks cut outside strings ({inside} of 7 naive cuts would land inside one)")
+else:
+    print(f"❌ Cuts inside strings at {cut_inside}, wrong first lines {wrong_lines}")
+if inside == 0:
+    print("❌ The sample never puts a naive cut inside a string")
+
+# Test 2: workers=2 gives the serial Lexer's token stream
+print("\n2. Test against Lexer:")
+for name, code in programs.items():
+    expected = stream(Lexer(code).tokenize())
+    lexer = ParallelLexer(code, workers=2)
+    actual = stream(lexer.tokenize())
+    pieces = len(split_chunks(code, lexer.workers * lexer.chunks_per_worker))
+    if len(code) < MIN_PARALLEL_SIZE or pieces < 2:
+        print(f"❌ {name}: only {len(code)} characters in {pieces} chunks, the serial path would be used")
+    elif actual == expected:
+        print(f"✅ {name}: {len(actual)} tokens from {pieces} chunks, last line {actual[-1][2]}")
+    else:
+        mismatch = next((k for k, (a, b) in enumerate(zip(actual, expected)) if a != b), min(len(actual), len(expected)))
+        print(f"❌ {name}: token {mismatch} is {actual[mismatch:mismatch + 1]}, Lexer gave {expected[mismatch:mismatch + 1]}")
+
+# Test 3: The stitched tokens parse like the serial ones
+print("\n3. Test parsing:")
+code = programs["strings and comments"]
+same = Parser(ParallelLexer(code, workers=2).tokenize()).parse() == Parser(Lexer(code).tokenize()).parse()
+print("✅ Same AST" if same else "❌ AST differs")
+
+print("\n" + "=" * 60)
+print("Parallel Lexer Tests Complete")
+print("=" * 60)
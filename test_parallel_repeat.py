@@ -0,0 +1,62 @@
+import contextlib
+import io
+import os
+import tempfile
+
+from emoji import Lexer, Parser, Interpreter
+from ParallelRepeat import ParallelInterpreter
+
+print("=" * 60)
+print("Testing Parallel Repeat")
+print("=" * 60)
+
+
+def run(interpreter, code):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        try:
+            interpreter.execute(Parser(Lexer(code).tokenize()).parse())
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}")
+    return out.getvalue()
+
+
+def check(name, code, expect_parallel):
+    expected = run(Interpreter(), code)
+    with ParallelInterpreter(workers=2, min_iterations=10) as interpreter:
+        actual = run(interpreter, code)
+        parallel = interpreter.parallel_stats['parallel'] > 0
+    if actual != expected:
+        print(f"❌ {name}: output {actual!r}, sequential run printed {expected!r}")
+    elif parallel != expect_parallel:
+        print(f"❌ {name}: expected {'parallel' if expect_parallel else 'sequential'} execution")
+    else:
+        print(f"✅ {name}: {'parallel' if parallel else 'sequential'}, output {actual.strip()!r}")
+
+
+with tempfile.TemporaryDirectory() as directory:
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        with open('lib.emoji', 'w', encoding='utf-8') as f:
+            f.write('🎯 sq 📥 x 👉\n    ⬅️ x ✖️ x\n🔚\n')
+
+        # Test 1: A plain reduction runs in parallel with the same result
+        print("\n1. Test parallel reduction:")
+        check("reduction", "📦 t ➡️ 0️⃣\n🔂 100 👉\n    t ➡️ t ➕ 3️⃣\n🔚\n🖨️ t", True)
+
+        # Test 2: 📚 inside the body must run in this process, so the loop stays sequential
+        print("\n2. Test 📚 inside a 🔂 body:")
+        check("import in body",
+              "📦 t ➡️ 0️⃣\n🔂 100 👉\n    📚 \"lib.emoji\"\n    t ➡️ t ➕ 3️⃣\n🔚\n🖨️ sq(3️⃣)", False)
+
+        # Test 3: A function imported before the loop can still be called in parallel
+        print("\n3. Test imported function in a reduction:")
+        check("imported call",
+              "📚 \"lib.emoji\"\n📦 t ➡️ 0️⃣\n🔂 100 👉\n    t ➡️ t ➕ sq(2️⃣)\n🔚\n🖨️ t", True)
+    finally:
+        os.chdir(cwd)
+
+print("\n" + "=" * 60)
+print("Parallel Repeat Tests Complete")
+print("=" * 60)
@@ -0,0 +1,65 @@
+import contextlib
+import io
+
+from emoji import Lexer, Parser, Interpreter
+from Quickening import QuickeningInterpreter, WARMUP
+
+print("=" * 60)
+print("Testing Quickening")
+print("=" * 60)
+
+
+def run(interpreter, code):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        try:
+            interpreter.execute(Parser(Lexer(code).tokenize()).parse())
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}")
+    return out.getvalue()
+
+
+def check(name, code, min_deopts=0):
+    """Compare QuickeningInterpreter with Interpreter; the busiest site must deoptimize min_deopts times."""
+    expected = run(Interpreter(), code)
+    interpreter = QuickeningInterpreter()
+    actual = run(interpreter, code)
+    site = max(interpreter.specialization_stats(), key=lambda s: s['deopts'])
+    if actual != expected:
+        print(f"❌ {name}: {actual!r}, Interpreter printed {expected!r}")
+    elif site['deopts'] < min_deopts:
+        print(f"❌ {name}: expected {min_deopts} deopts, got {site}")
+    else:
+        print(f"✅ {name}: {actual.split()[-1]} ({site['deopts']} deopts, ends {site['state']})")
+
+
+adder = "🎯 add 📥 a b 👉\n    ⬅️ a ➕ b\n🔚\n📦 t ➡️ 0️⃣\n"
+warm = WARMUP * 2
+
+
+def calls(args, times=warm):
+    return f"🔂 {times} 👉\n    t ➡️ add({args})\n🔚\n🖨️ t\n"
+
+
+# Test 1: One site sees int, then str, then float operands
+print("\n1. Test type changes at one site:")
+check("int then str then float", adder + calls("1️⃣ 2️⃣") + calls('"a" "b"') + calls("1.5 2.25"), min_deopts=2)
+check("str then int", adder + calls('"x" "y"') + calls("3️⃣ 4️⃣"), min_deopts=1)
+check("mixed int and float", adder + calls("1️⃣ 2️⃣") + calls("1️⃣ 0.5") + calls("0.5 1️⃣"), min_deopts=2)
+check("bool operands after ints", adder + calls("1️⃣ 2️⃣") + calls("✅ ✅"), min_deopts=1)
+
+# Test 2: Errors at a quickened site match the generic path
+print("\n2. Test errors after quickening:")
+check("int then str operand", adder + calls("1️⃣ 2️⃣") + calls('1️⃣ "b"', 1), min_deopts=1)
+divider = "🎯 div 📥 a b 👉\n    ⬅️ a ➗ b\n🔚\n"
+check("division by zero", divider + f"🔂 {warm} 👉\n    🖨️ div(6️⃣ 3️⃣)\n🔚\n🖨️ div(1️⃣ 0️⃣)\n")
+check("float division by zero", divider + f"🔂 {warm} 👉\n    🖨️ div(1.5 0.5)\n🔚\n🖨️ div(1.5 0.0)\n")
+
+# Test 3: Long strings still build in place after quickening
+print("\n3. Test string building:")
+check("growing string", f"📦 s ➡️ \"\"\n🔂 600 👉\n    s ➡️ s ➕ \"ab\"\n🔚\n🖨️ 📏(s)\n"
+      f"🖨️ s 🟰 s ➕ \"\"\n")
+
+print("\n" + "=" * 60)
+print("Quickening Tests Complete")
+print("=" * 60)
@@ -0,0 +1,75 @@
+import contextlib
+import io
+import subprocess
+import sys
+from collections import Counter
+
+import emoji
+from emoji import Lexer, Parser, Interpreter, RandomSource
+from Quickening import QuickeningInterpreter
+from StackInterpreter import StackInterpreter
+
+print("=" * 60)
+print("Testing Seeded 🎲")
+print("=" * 60)
+
+
+def draws(interpreter):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        interpreter.execute(Parser(Lexer("🔂 50 👉\n    🖨️ 🎲 1️⃣ 🔟\n🔚\n").tokenize()).parse())
+    return out.getvalue().split()
+
+
+# Test 1: A fixed seed gives the same 🎲 sequence on every engine
+print("\n1. Test reproducible sequences:")
+expected = draws(Interpreter(seed=42))
+for engine in (Interpreter, QuickeningInterpreter, StackInterpreter):
+    actual = draws(engine(seed=42))
+    print(f"{'✅' if actual == expected else '❌'} {engine.__name__}: {' '.join(actual[:10])} ...")
+if draws(Interpreter(seed=43)) != expected:
+    print("✅ Another seed gives another sequence")
+else:
+    print("❌ Seeds 42 and 43 gave the same sequence")
+
+# Test 2: Non-power-of-two ranges stay in bounds and cover every value
+print("\n2. Test ranges:")
+source = RandomSource(7)
+for lo, hi in ((1, 10), (0, 2), (-3, 3), (5, 5), (0, 99)):
+    values = [source.randint(lo, hi) for _ in range(20000)]
+    counts = Counter(values)
+    spread = max(counts.values()) / min(counts.values())
+    if min(values) >= lo and max(values) <= hi and len(counts) == hi - lo + 1 and spread < 2:
+        print(f"✅ 🎲 {lo} {hi}: all {len(counts)} values, max/min count {spread:.2f}")
+    else:
+        print(f"❌ 🎲 {lo} {hi}: range {min(values)}..{max(values)}, {len(counts)} values, spread {spread:.2f}")
+# A span of 3 * 2**62 rejects a quarter of all 64-bit words
+span = 3 << 62
+values = [source.randint(0, span - 1) for _ in range(2000)]
+thirds = Counter(value * 3 // span for value in values)
+if all(0 <= value < span for value in values) and len(thirds) == 3:
+    print(f"✅ Rejection sampling: {dict(sorted(thirds.items()))} per third of the range")
+else:
+    print(f"❌ Rejection sampling out of range or lopsided: {thirds}")
+huge = [source.randint(0, 1 << 70) for _ in range(100)]
+print("✅ Spans above 64 bits stay in range" if all(0 <= v <= 1 << 70 for v in huge) else "❌ Huge span out of range")
+try:
+    source.randint(5, 1)
+    print("❌ Should have raised an error!")
+except ValueError as e:
+    print(f"✅ Caught error: {e}")
+
+# Test 3: --seed makes command-line runs reproducible
+print("\n3. Test --seed:")
+answers = "".join(f"{n}\n" for n in range(1, 11))
+runs = [subprocess.run([sys.executable, emoji.__file__, '--seed', '5'], input=answers,
+                       capture_output=True, text=True, encoding='utf-8').stdout for _ in range(2)]
+guesses = [output.count("Enter your guess") for output in runs]
+if runs[0].split("Runtime")[0] == runs[1].split("Runtime")[0] and guesses[0] > 0:
+    print(f"✅ Two runs with --seed 5 took {guesses[0]} guesses each")
+else:
+    print(f"❌ Runs differ: {guesses}")
+
+print("\n" + "=" * 60)
+print("Seeded 🎲 Tests Complete")
+print("=" * 60)
@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+import Replay
+
+print("=" * 60)
+print("Testing Record and Replay")
+print("=" * 60)
+
+
+def cli(*args, stdin=''):
+    """(exit status, stdout, stderr) of the Replay.py command line."""
+    result = subprocess.run([sys.executable, Replay.__file__, *args], input=stdin,
+                            capture_output=True, text=True, encoding='utf-8')
+    return result.returncode, result.stdout, result.stderr
+
+
+with tempfile.TemporaryDirectory() as directory:
+    programs = {
+        'session.emoji': '📦 n ➡️ 📝\n⏱️\n🔂 n 👉\n    🖨️ 🎲 1️⃣ 1000\n🔚\n⏱️\n'
+                         '📦 name ➡️ 📝\n🖨️ name\n',
+        'eof.emoji': '📦 n ➡️ 📝\n🖨️ n\n📦 m ➡️ 📝\n🖨️ m\n',
+        'error.emoji': '📦 n ➡️ 📝\n🖨️ 1️⃣ ➗ n\n',
+        'undefined.emoji': '🖨️ 🔴\n',
+        'syntax.emoji': '🖨️ ( 1️⃣ ➕\n',
+    }
+    for name, code in programs.items():
+        with open(os.path.join(directory, name), 'w', encoding='utf-8') as f:
+            f.write(code)
+    program = os.path.join(directory, 'session.emoji')
+    trace = os.path.join(directory, 'session.trace')
+
+    # Test 1: Every engine replays the recorded session exactly
+    print("\n1. Test record and replay round trip:")
+    status, recorded, err = cli('record', program, trace, '--seed', '7', stdin='3\n🦄\n')
+    if status == 0 and 'Recorded 7 events' in err:
+        print(f"✅ Recorded: {recorded.split()}")
+    else:
+        print(f"❌ Recording failed: status {status}, stderr {err!r}")
+    for engine in ('tree', 'quickening', 'loop', 'stack', 'profile'):
+        status, replayed, err = cli('replay', program, trace, '--engine', engine)
+        if status == 0 and replayed.startswith(recorded) and 'not used' not in err:
+            print(f"✅ {engine}: same output")
+        else:
+            print(f"❌ {engine}: status {status}, output {replayed!r}, stderr {err!r}")
+
+    # Test 2: A session that ends on 📝 EOF replays to the same EOF
+    print("\n2. Test EOF session:")
+    program = os.path.join(directory, 'eof.emoji')
+    trace = os.path.join(directory, 'eof.trace')
+    status, recorded, _ = cli('record', program, trace, stdin='5\n')
+    _, replayed, _ = cli('replay', program, trace)
+    if status == 0 and recorded == replayed == "5\n\n⚠️ Input ended (EOF). Exiting.\n":
+        print("✅ Record and replay both report the EOF")
+    else:
+        print(f"❌ Recorded {recorded!r}, replayed {replayed!r}")
+
+    # Test 3: Runtime and syntax errors are reported, not raised
+    print("\n3. Test errors:")
+    program = os.path.join(directory, 'error.emoji')
+    trace = os.path.join(directory, 'error.trace')
+    for label, (status, _, err) in (("runtime error", cli('record', program, trace, stdin='0\n')),
+                                    ("replayed runtime error", cli('replay', program, trace)),
+                                    ("syntax error", cli('record', os.path.join(directory, 'syntax.emoji'), trace)),
+                                    ("diverged replay", cli('replay', os.path.join(directory, 'eof.emoji'), trace)),
+                                    ("undefined variable", cli('record', os.path.join(directory, 'undefined.emoji'), trace))):
+        if status == 1 and err.count('❌ Error:') == 1 and 'Traceback' not in err:
+            print(f"✅ {label}: {err.strip().splitlines()[-1]}")
+        else:
+            print(f"❌ {label}: status {status}, stderr {err!r}")
+
+print("\n" + "=" * 60)
+print("Record and Replay Tests Complete")
+print("=" * 60)
@@ -0,0 +1,86 @@
+import contextlib
+import io
+import sys
+
+from emoji import Lexer, Parser, Interpreter
+from IterativeParser import IterativeParser
+from StackInterpreter import StackInterpreter
+
+print("=" * 60)
+print("Testing Stack Interpreter")
+print("=" * 60)
+
+
+def run(interpreter, ast):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        try:
+            interpreter.execute(ast)
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}")
+    return out.getvalue()
+
+
+def parse(code):
+    return Parser(Lexer(code).tokenize()).parse()
+
+
+def check(name, code):
+    """Compare StackInterpreter with Interpreter."""
+    expected = run(Interpreter(), parse(code))
+    actual = run(StackInterpreter(), parse(code))
+    if actual == expected:
+        print(f"✅ {name}: {actual.split()}")
+    else:
+        print(f"❌ {name}: {actual!r}, Interpreter printed {expected!r}")
+
+
+depth = sys.getrecursionlimit() * 5
+
+# Test 1: Recursion far past the Python recursion limit
+print("\n1. Test deep recursion:")
+countdown = ("🎯 down 📥 n 👉\n    ❓ n 🟰 0️⃣ 👉\n        ⬅️ 0️⃣\n    🔚\n    ⬅️ down(n ➖ 1️⃣) ➕ 1️⃣\n🔚\n"
+             f"🖨️ down({depth})\n")
+output = run(StackInterpreter(), parse(countdown))
+print(f"✅ down({depth}) = {output.strip()}" if output == f"{depth}\n" else f"❌ down({depth}): {output!r}")
+mutual = ("🎯 even 📥 n 👉\n    ❓ n 🟰 0️⃣ 👉\n        ⬅️ ✅\n    🔚\n    ⬅️ odd(n ➖ 1️⃣)\n🔚\n"
+          "🎯 odd 📥 n 👉\n    ❓ n 🟰 0️⃣ 👉\n        ⬅️ ❌\n    🔚\n    ⬅️ even(n ➖ 1️⃣)\n🔚\n"
+          f"🖨️ even({depth})\n🖨️ odd({depth})\n")
+output = run(StackInterpreter(), parse(mutual))
+print(f"✅ Mutual recursion: {output.split()}" if output == "True\nFalse\n" else f"❌ Mutual recursion: {output!r}")
+failing = ("🎯 down 📥 n 👉\n    ❓ n 🟰 0️⃣ 👉\n        ⬅️ 1️⃣ ➗ n\n    🔚\n    ⬅️ down(n ➖ 1️⃣)\n🔚\n"
+           f"🖨️ down({depth})\n")
+output = run(StackInterpreter(), parse(failing))
+print(f"✅ Error at the bottom: {output.strip()}" if output.startswith("ZeroDivisionError")
+      else f"❌ Error at the bottom: {output!r}")
+
+# Test 2: Deeply nested blocks and expressions
+print("\n2. Test deep nesting:")
+nesting = sys.getrecursionlimit() * 2
+blocks = "".join("    " * i + "❓ ✅ 👉\n" for i in range(nesting)) + "    " * nesting + "🖨️ 7️⃣\n" + \
+         "".join("    " * i + "🔚\n" for i in reversed(range(nesting)))
+output = run(StackInterpreter(), IterativeParser(Lexer(blocks).tokenize()).parse())
+print(f"✅ {nesting} nested ❓ blocks" if output == "7\n" else f"❌ Nested blocks: {output!r}")
+expression = "🖨️ " + "( " * nesting + "1️⃣" + " ➕ 1️⃣ )" * nesting + "\n"
+output = run(StackInterpreter(), IterativeParser(Lexer(expression).tokenize()).parse())
+print(f"✅ {nesting} nested parentheses" if output == f"{nesting + 1}\n" else f"❌ Nested expression: {output!r}")
+
+# Test 3: ⬅️ from inside loops and ❓ blocks unwinds to the caller
+print("\n3. Test ⬅️ from nested blocks:")
+check("from a 🔂 inside a 🔁", "🎯 find 📥 n 👉\n    📦 i ➡️ 0️⃣\n    🔁 ✅ 👉\n        🔂 3️⃣ 👉\n"
+      "            i ➡️ i ➕ 1️⃣\n            ❓ i 🟰 n 👉\n                ⬅️ i ✖️ 🔟\n            🔚\n        🔚\n"
+      "    🔚\n🔚\n🖨️ find(5️⃣)\n🖨️ find(1️⃣)\n")
+check("from an ❔ branch", "🎯 sign 📥 n 👉\n    ❓ n ⬇️ 0️⃣ 👉\n        ⬅️ ➖ 1️⃣\n    ❔ 👉\n"
+      "        ❓ n 🟰 0️⃣ 👉\n            ⬅️ 0️⃣\n        🔚\n    🔚\n    ⬅️ 1️⃣\n🔚\n"
+      "🖨️ sign(➖ 4️⃣)\n🖨️ sign(0️⃣)\n🖨️ sign(9️⃣)\n")
+check("inside an expression", "🎯 first 📥 n 👉\n    🔂 n 👉\n        ⬅️ 🔟\n    🔚\n    ⬅️ 0️⃣\n🔚\n"
+      "🖨️ 1️⃣ ➕ first(3️⃣) ✖️ 2️⃣\n🖨️ 1️⃣ ➕ first(0️⃣) ✖️ 2️⃣\n")
+check("loop after the call", "🎯 f 👉\n    🔂 5️⃣ 👉\n        ⬅️ 1️⃣\n    🔚\n🔚\n📦 t ➡️ 0️⃣\n"
+      "🔂 4️⃣ 👉\n    t ➡️ t ➕ f()\n🔚\n🖨️ t\n")
+check("from a recursive loop", "🎯 depth 📥 n 👉\n    🔂 2️⃣ 👉\n        ❓ n 🟰 0️⃣ 👉\n            ⬅️ 0️⃣\n"
+      "        🔚\n        ⬅️ depth(n ➖ 1️⃣) ➕ 1️⃣\n    🔚\n🔚\n🖨️ depth(6️⃣)\n")
+check("⬅️ outside a 🎯", "🔂 3️⃣ 👉\n    ⬅️ 1️⃣\n🔚\n🖨️ 2️⃣\n")
+
+print("\n" + "=" * 60)
+print("Stack Interpreter Tests Complete")
+print("=" * 60)
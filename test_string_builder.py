@@ -0,0 +1,94 @@
+import contextlib
+import io
+
+from emoji import Lexer, Parser, Interpreter, StringBuilder
+from Quickening import QuickeningInterpreter
+from StackInterpreter import StackInterpreter
+from Suspendable import SuspendableInterpreter
+
+print("=" * 60)
+print("Testing String Building")
+print("=" * 60)
+
+
+def parse(code):
+    return Parser(Lexer(code).tokenize()).parse()
+
+
+def run(interpreter, code):
+    """(printed output, execute() result, globals) of a run."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        if isinstance(interpreter, SuspendableInterpreter):
+            steps = interpreter.run(parse(code))
+            try:
+                while True:
+                    next(steps)
+            except StopIteration as stop:
+                result = stop.value
+        else:
+            result = interpreter.execute(parse(code))
+    return out.getvalue(), result, interpreter.globals
+
+
+def baseline(code):
+    """The same run with plain str concatenation only."""
+    min_length = StringBuilder.MIN_LENGTH
+    StringBuilder.MIN_LENGTH = float('inf')
+    try:
+        return run(Interpreter(), code)
+    finally:
+        StringBuilder.MIN_LENGTH = min_length
+
+
+program = """
+📦 s ➡️ ""
+🔂 500 👉
+    s ➡️ s ➕ "ab"
+🔚
+📦 copy ➡️ s
+s ➡️ s ➕ "!"
+📦 longer ➡️ copy ➕ "?"
+🖨️ s 🟰 copy
+🖨️ 📏(s)
+🖨️ longer
+s ➡️ s ➕ "."
+"""
+
+# Test 1: Long concatenation in a loop matches plain str concatenation
+print("\n1. Test long concatenation:")
+expected_output, expected_result, expected_globals = baseline(program)
+for name, engine in (("Interpreter", Interpreter), ("QuickeningInterpreter", QuickeningInterpreter),
+                     ("StackInterpreter", StackInterpreter), ("SuspendableInterpreter", SuspendableInterpreter)):
+    output, result, variables = run(engine(), program)
+    if output != expected_output or result != expected_result:
+        print(f"❌ {name}: output or result differs from plain str concatenation")
+    elif variables != expected_globals:
+        print(f"❌ {name}: globals differ from plain str concatenation")
+    else:
+        print(f"✅ {name}: same output, {len(result)} characters")
+
+# Test 2: The host only ever sees str
+print("\n2. Test values seen by the host:")
+for name, engine in (("Interpreter", Interpreter), ("SuspendableInterpreter", SuspendableInterpreter)):
+    _, result, variables = run(engine(), program)
+    builders = [k for k, v in variables.items() if type(v) is not str]
+    if type(result) is str and not builders:
+        print(f"✅ {name}: result and globals are str")
+    else:
+        print(f"❌ {name}: result {type(result).__name__}, StringBuilder globals {builders}")
+
+# Test 3: Globals are plain str even when the program fails
+print("\n3. Test globals after an error:")
+interpreter = Interpreter()
+try:
+    with contextlib.redirect_stdout(io.StringIO()):
+        interpreter.execute(parse(program + "🖨️ 1️⃣ ➗ 0️⃣\n"))
+    print("❌ Should have raised an error!")
+except ZeroDivisionError:
+    value = interpreter.globals["s"]
+    print(f"✅ s is {type(value).__name__}" if type(value) is str else f"❌ s is {type(value).__name__}")
+
+print("\n" + "=" * 60)
+print("String Building Tests Complete")
+print("=" * 60)
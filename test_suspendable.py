@@ -0,0 +1,165 @@
+import asyncio
+import re
+
+from emoji import Lexer, Parser, Interpreter, demo_program
+from Suspendable import SuspendableInterpreter, InputRequest
+
+print("=" * 60)
+print("Testing Suspendable Interpreter")
+print("=" * 60)
+
+
+def parse(code, lazy=False):
+    return Parser(Lexer(code).tokenize(), lazy=lazy).parse()
+
+
+def clean(transcript):
+    # ⏱️ timings differ from run to run
+    return [re.sub(r'Runtime: [0-9.]+ seconds', 'Runtime: … seconds', str(line)) for line in transcript]
+
+
+def settle(result):
+    # A program ending in ⏱️ returns its timing
+    if isinstance(result, dict) and result.get('type') == 'timer':
+        return dict(result, value='…')
+    return result
+
+
+def straight(code, answers):
+    """Transcript and result of a plain Interpreter run reading answers."""
+    transcript = []
+    pending = list(answers)
+    interpreter = Interpreter(seed=9)
+    interpreter.emit = transcript.append
+
+    def read_line(prompt):
+        transcript.append(f"📝 {prompt}")
+        if not pending or pending[0] is None:
+            raise EOFError("input ended")
+        return pending.pop(0)
+
+    interpreter.read_line = read_line
+    try:
+        result = interpreter.execute(parse(code))
+    except Exception as e:
+        result = f"{type(e).__name__}"
+    return clean(transcript), settle(result), interpreter.globals
+
+
+def resumed(code, answers, lazy=False):
+    """The same run driven through SuspendableInterpreter.run and send()."""
+    transcript = []
+    pending = list(answers)
+    session = SuspendableInterpreter(seed=9, output=transcript.append)
+    steps = session.run(parse(code, lazy))
+    suspensions = 0
+    try:
+        request = next(steps)
+        while True:
+            assert isinstance(request, InputRequest)
+            suspensions += 1
+            transcript.append(f"📝 {request.prompt}")
+            request = steps.send(pending.pop(0) if pending else None)
+    except StopIteration as stop:
+        result = stop.value
+    except Exception as e:
+        result = f"{type(e).__name__}"
+    return clean(transcript), settle(result), session.globals, suspensions
+
+
+def check(name, code, answers, lazy=False):
+    expected = straight(code, answers)
+    transcript, result, variables, suspensions = resumed(code, answers, lazy)
+    if (transcript, result, variables) != expected:
+        print(f"❌ {name}: {transcript}, Interpreter gave {expected[0]}")
+    elif not suspensions:
+        print(f"❌ {name}: never suspended")
+    else:
+        print(f"✅ {name}: {suspensions} suspensions, last lines {transcript[-2:]}")
+
+
+summing = """
+📦 total ➡️ 0️⃣
+🔂 3️⃣ 👉
+    🖨️ "next?"
+    total ➡️ total ➕ 📝 "number: "
+    🖨️ total
+🔚
+🔁 total ⬆️ 0️⃣ 👉
+    total ➡️ total ➖ 📝
+    🖨️ total
+🔚
+total
+"""
+
+asking = """
+🎯 ask 📥 label 👉
+    🖨️ "asking " ➕ label
+    📦 answer ➡️ 📝 label
+    ❓ answer 🟰 "again" 👉
+        ⬅️ ask(label ➕ "!")
+    🔚
+    ⬅️ answer
+🔚
+🎯 pair 👉
+    ⬅️ ask("a? ") ➕ ask("b? ")
+🔚
+📦 seen ➡️ ""
+🔂 2️⃣ 👉
+    seen ➡️ seen ➕ pair() ➕ ","
+    🖨️ seen
+🔚
+🖨️ ask("last? ") ✖️ 2️⃣
+"""
+
+# Test 1: 📝 inside loops
+print("\n1. Test input mid-loop:")
+check("🔂 then 🔁", summing, ["4", "5", "6", "10", "5"])
+check("EOF inside the 🔁", summing, ["1", "2", "3", "4"])
+
+# Test 2: 📝 inside 🎯 calls, nested and recursive
+print("\n2. Test input inside 🎯:")
+check("nested calls", asking, ["x", "again", "y", "p", "q", "21"])
+check("lazily parsed bodies", asking, ["x", "again", "again", "y", "p", "q", "4"], lazy=True)
+check("EOF inside a call", asking, ["x"])
+
+# Test 3: A whole program, driven answer by answer
+print("\n3. Test the demo program:")
+check("number guessing", demo_program, [str(n) for n in range(1, 101)])
+
+# Test 4: run_async interleaves sessions on one event loop
+print("\n4. Test run_async:")
+
+
+async def session(code, answers, log):
+    transcript = []
+    pending = list(answers)
+    interpreter = SuspendableInterpreter(seed=9, output=transcript.append)
+
+    async def ask(prompt):
+        transcript.append(f"📝 {prompt}")
+        log.append(code)
+        await asyncio.sleep(0)
+        return pending.pop(0) if pending else None
+
+    result = await interpreter.run_async(parse(code), ask)
+    return clean(transcript), settle(result), interpreter.globals
+
+
+async def main():
+    log = []
+    runs = [(summing, ["4", "5", "6", "10", "5"]), (asking, ["x", "again", "y", "p", "q", "21"])]
+    results = await asyncio.gather(*(session(code, answers, log) for code, answers in runs))
+    return log, results, runs
+
+
+log, results, runs = asyncio.run(main())
+for (code, answers), actual, name in zip(runs, results, ("loop session", "call session")):
+    expected = straight(code, answers)
+    print(f"✅ {name}: matches Interpreter" if actual == expected else f"❌ {name}: {actual[0]}, expected {expected[0]}")
+switches = sum(1 for a, b in zip(log, log[1:]) if a is not b)
+print(f"✅ Sessions interleaved {switches} times" if switches > 1 else f"❌ Sessions ran one after the other")
+
+print("\n" + "=" * 60)
+print("Suspendable Interpreter Tests Complete")
+print("=" * 60)
@@ -0,0 +1,99 @@
+from lark import Tree, Token
+
+from Evaluator import Environment, Evaluator, TypeChecker
+
+print("=" * 60)
+print("Testing Static Type Checker")
+print("=" * 60)
+
+
+def decl(var_type, name, value):
+    return Tree("var_decl", [Token("TYPE", var_type), Token("IDENT", name), value])
+
+
+def assign(name, value):
+    return Tree("assignment", [Token("IDENT", name), value])
+
+
+def ident(name):
+    return Tree("identifier", [Token("IDENT", name)])
+
+
+def binop(left, operator, right):
+    return Tree("bin_expr", [left, Token("OP", operator), right])
+
+
+def program(*statements):
+    return Tree("program", list(statements))
+
+
+# Test 1: A well-typed program passes and is annotated
+print("\n1. Test well-typed program:")
+tree = program(
+    decl("int", "x", binop(Token("INT", "5"), "+", Token("INT", "3"))),
+    assign("x", binop(ident("x"), "*", Token("INT", "2"))),
+    decl("bool", "big", binop(ident("x"), ">", Token("INT", "10"))),
+    decl("string", "s", binop(Token("STRING", '"a"'), "+", Token("STRING", '"b"'))),
+    Tree("block", [decl("float", "y", Token("FLOAT", "1.5")), binop(ident("y"), "/", Token("FLOAT", "0.5"))]),
+)
+errors = TypeChecker().check(tree)
+if errors:
+    print(f"❌ Unexpected errors: {errors}")
+else:
+    print("✅ No type errors")
+annotated = [node for node in tree.iter_subtrees() if node.data in ("var_decl", "assignment", "bin_expr")]
+if all(getattr(node, "checked", False) for node in annotated):
+    print(f"✅ {len(annotated)} nodes annotated")
+else:
+    print("❌ Some nodes were not annotated")
+
+# Test 2: Checked nodes give the same results without the runtime checks
+print("\n2. Test check-free evaluation:")
+evaluator = Evaluator()
+
+
+def unexpected_check(operator, left, right):
+    raise AssertionError(f"runtime check for {operator}")
+
+
+evaluator.apply_operator = unexpected_check
+env = Environment()
+try:
+    result = evaluator.evaluate(tree, env)
+    values = {name: env.get(name)["value"] for name in ("x", "big", "s")}
+    if result == {"type": "float", "value": 3.0} and values == {"x": 16, "big": True, "s": "ab"}:
+        print(f"✅ Evaluated without runtime checks: {values}, block result {result}")
+    else:
+        print(f"❌ Got {values}, block result {result}")
+except AssertionError as e:
+    print(f"❌ Checked node took the slow path: {e}")
+
+# Test 3: Type errors are reported before execution
+print("\n3. Test reported type errors:")
+cases = {
+    "declaration mismatch": program(decl("int", "x", Token("STRING", '"five"'))),
+    "assignment mismatch": program(decl("int", "x", Token("INT", "1")), assign("x", Token("FLOAT", "2.0"))),
+    "mixed operands": program(binop(Token("INT", "1"), "+", Token("FLOAT", "2.0"))),
+    "unsupported operator": program(binop(Token("STRING", '"a"'), "-", Token("STRING", '"b"'))),
+    "undefined variable": program(assign("z", Token("INT", "1"))),
+    "out of scope": program(Tree("block", [decl("int", "y", Token("INT", "1"))]), ident("y")),
+}
+for name, tree in cases.items():
+    errors = TypeChecker().check(tree)
+    if len(errors) == 1 and not any(getattr(node, "checked", False) for node in tree.iter_subtrees()):
+        print(f"✅ {name}: {errors[0]}")
+    else:
+        print(f"❌ {name}: {errors}")
+
+# Test 4: Unchecked trees still get the runtime checks
+print("\n4. Test unchecked evaluation:")
+tree = cases["assignment mismatch"]
+try:
+    Evaluator().evaluate(tree, Environment())
+    print("❌ Should have raised an error!")
+except Exception as e:
+    print(f"✅ Caught error: {e}")
+
+print("\n" + "=" * 60)
+print("Static Type Checker Tests Complete")
+print("=" * 60)
@@ -0,0 +1,98 @@
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import Zygote
+
+print("=" * 60)
+print("Testing Zygote Server")
+print("=" * 60)
+
+
+def launch(path, program, stdin=b''):
+    """(exit status, stdout, stderr) of program run through the server at path."""
+    with tempfile.TemporaryFile() as inp, tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        inp.write(stdin)
+        inp.seek(0)
+        status = Zygote.launch(program, path, fds=(inp.fileno(), out.fileno(), err.fileno()))
+        out.seek(0)
+        err.seek(0)
+        return status, out.read().decode('utf-8'), err.read().decode('utf-8')
+
+
+def send_raw(path, message):
+    """Send message with three fds; return what the server answers before closing."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET) as sock, open(os.devnull, 'rb') as null:
+        sock.connect(path)
+        socket.send_fds(sock, [message], [null.fileno()] * 3)
+        return sock.recv(Zygote.STATUS.size)
+
+
+if not hasattr(os, 'pidfd_open') or not hasattr(socket, 'send_fds'):
+    print("\n⚠️  Skipped: needs Linux with os.pidfd_open and socket.send_fds")
+else:
+    with tempfile.TemporaryDirectory() as directory:
+        programs = {
+            'echo.emoji': '📦 n ➡️ 📝\n🖨️ n ✖️ 2️⃣\n',
+            'error.emoji': '🖨️ 1️⃣ ➗ 0️⃣\n',
+            'syntax.emoji': '🖨️ ( 1️⃣ ➕\n',
+        }
+        for name, code in programs.items():
+            with open(os.path.join(directory, name), 'w', encoding='utf-8') as f:
+                f.write(code)
+        path = os.path.join(directory, 'zygote.sock')
+        server = subprocess.Popen([sys.executable, Zygote.__file__, 'serve', '--socket', path],
+                                  stderr=subprocess.DEVNULL)
+        try:
+            while not os.path.exists(path):
+                time.sleep(0.01)
+
+            # Test 1: stdin and stdout are the client's, status 0
+            print("\n1. Test launch:")
+            result = launch(path, os.path.join(directory, 'echo.emoji'), b'21\n')
+            if result == (0, '42\n', ''):
+                print("✅ Output 42, status 0")
+            else:
+                print(f"❌ Unexpected result: {result}")
+
+            # Test 2: Runtime errors, syntax errors and missing files exit with status 1
+            print("\n2. Test exit status of failing programs:")
+            for name in ('error.emoji', 'syntax.emoji', 'missing.emoji'):
+                status, out, err = launch(path, os.path.join(directory, name))
+                if status == 1 and err.startswith('❌ Error:'):
+                    print(f"✅ {name}: status 1, {err.strip()}")
+                else:
+                    print(f"❌ {name}: status {status}, stderr {err!r}")
+
+            # Test 3: Malformed requests are rejected without stopping the server
+            print("\n3. Test rejected requests:")
+            for message in (b'[1]', b'{}', b'{"program": 1, "cwd": "/"}', b'{"program": "x", "cwd": "/", "seed": "s"}',
+                            b'not json'):
+                try:
+                    reply = send_raw(path, message)
+                except OSError as e:
+                    print(f"❌ Server unreachable before {message!r}: {e}")
+                    break
+                if reply != b'':
+                    print(f"❌ {message!r} was accepted")
+                elif server.poll() is not None:
+                    print(f"❌ {message!r} stopped the server")
+                    break
+                else:
+                    print(f"✅ {message!r} rejected")
+            result = launch(path, os.path.join(directory, 'echo.emoji'), b'5\n')
+            print("✅ Server still launches programs" if result[0] == 0 else f"❌ Launch after rejections: {result}")
+        finally:
+            server.terminate()
+            server.wait()
+        if os.path.exists(path):
+            print("❌ Socket file left behind")
+        else:
+            print("✅ Socket file removed on shutdown")
+
+print("\n" + "=" * 60)
+print("Zygote Server Tests Complete")
+print("=" * 60)